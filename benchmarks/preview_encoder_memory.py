@@ -0,0 +1,116 @@
+"""
+Memory of a worker's preview encoder over a long job.
+
+Feeds the frames of a long job through one ``PreviewEncoder``, the way a
+worker does, and samples the process's resident memory and the number of
+images in ``bpy.data`` as it goes. The frames alternate between two image
+files, so every frame reloads the reused source image. Memory should level
+off after the first frames; the run fails (exit code 1) if it still grows
+by more than ``--max-growth`` MB after the warm-up.
+
+Run inside Blender:
+
+    blender -b --factory-startup --python-exit-code 1 --python benchmarks/preview_encoder_memory.py -- --frames 10000
+
+``--jpeg`` writes the thumbnails as JPEG files instead of the shared preview
+buffer (the fallback when the UI didn't create one).
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import types
+
+import bpy
+
+# Import the modules of the repository, not an installed copy of the addon
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rendercue")
+if "rendercue" not in sys.modules:
+    package = types.ModuleType("rendercue")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["rendercue"] = package
+
+from rendercue.constants import STATUS_FILENAME, PREVIEW_FILENAME_PREFIX  # noqa: E402
+from rendercue.core import PreviewEncoder  # noqa: E402
+from rendercue.preview_buffer import create_buffer  # noqa: E402
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=10000, help="Frames to encode")
+    parser.add_argument("--resolution", type=int, default=1920, help="Width of the frames, 16:9")
+    parser.add_argument("--sample", type=int, default=1000, help="Frames between memory samples")
+    parser.add_argument("--warmup", type=int, default=500, help="Frames before the baseline sample")
+    parser.add_argument("--max-growth", type=float, default=16.0, help="Allowed growth after the warm-up, in MB")
+    parser.add_argument("--jpeg", action="store_true", help="Write JPEG thumbnails instead of the preview buffer")
+    return parser.parse_args(argv)
+
+
+def get_resident_bytes():
+    """Get the resident memory of this process (Linux, or any OS with psutil)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def write_frame(path, width, height, value):
+    """Save a flat colored PNG frame."""
+    image = bpy.data.images.new("RenderCue_BenchmarkFrame", width, height)
+    image.pixels.foreach_set([value, value * 0.5, 1.0 - value, 1.0] * (width * height))
+    image.filepath_raw = path
+    image.file_format = 'PNG'
+    image.save()
+    bpy.data.images.remove(image)
+
+
+def main():
+    args = parse_args()
+    width, height = args.resolution, args.resolution * 9 // 16
+    with tempfile.TemporaryDirectory() as temp_dir:
+        frames = [os.path.join(temp_dir, f"Scene_{i:04d}.png") for i in (1, 2)]
+        for i, path in enumerate(frames):
+            write_frame(path, width, height, 0.25 + 0.5 * i)
+
+        status_path = os.path.join(temp_dir, STATUS_FILENAME)
+        if not args.jpeg:
+            create_buffer(status_path)
+        encoder = PreviewEncoder(os.path.join(temp_dir, f"{PREVIEW_FILENAME_PREFIX}0.jpg"), status_path)
+        print(f"Blender {bpy.app.version_string}, {args.frames} frames of {width}x{height}, "
+              f"thumbnails to {'JPEG files' if encoder.buffer is None else 'the preview buffer'}")
+        print(f"  {'frame':>6} {'resident MB':>12} {'images':>7} {'ms/frame':>9}")
+
+        baseline = None
+        samples = []
+        started = time.perf_counter()
+        try:
+            for frame in range(1, args.frames + 1):
+                encoder.encode_file(frames[frame % 2])
+                if frame == args.warmup:
+                    baseline = get_resident_bytes()
+                if frame % args.sample == 0 or frame == args.frames:
+                    resident = get_resident_bytes()
+                    if baseline is not None:
+                        samples.append(resident)
+                    elapsed = (time.perf_counter() - started) / frame * 1000
+                    print(f"  {frame:6d} {resident / 2 ** 20:12.1f} {len(bpy.data.images):7d} {elapsed:9.2f}")
+        finally:
+            encoder.close()
+
+    if not samples:
+        print("No samples after the warm-up, nothing checked")
+        return
+    growth = (max(samples) - baseline) / 2 ** 20
+    print(f"  growth after frame {args.warmup}: {growth:.1f} MB (allowed {args.max_growth:.1f} MB)")
+    if growth > args.max_growth:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Per-frame overhead of the two render methods.
+
+Renders the same frames of a tiny scene frame by frame (one
+``render(write_still=True)`` per frame, like the Frame by Frame method) and
+as one ``render(animation=True)`` call (like the Animation method). With
+almost nothing to render, the difference is the overhead saved per frame:
+scene sync, render setup and teardown.
+
+Run inside Blender:
+
+    blender -b --factory-startup --python benchmarks/render_method_overhead.py -- --frames 48
+
+Pass a .blend before ``--python`` to measure on a real scene instead of the
+default cube; ``--resolution`` then caps its render size.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import bpy
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=48, help="Frames per run")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per method, the median is reported")
+    parser.add_argument("--engine", default="BLENDER_WORKBENCH", help="Render engine of the scene")
+    parser.add_argument("--resolution", type=int, default=64, help="Longest edge in pixels")
+    parser.add_argument("--persistent-data", action="store_true", help="Keep render data between frames (Cycles)")
+    return parser.parse_args(argv)
+
+
+def render_frame_by_frame(scene, frames, output_dir):
+    for frame in frames:
+        scene.frame_set(frame)
+        scene.render.filepath = os.path.join(output_dir, f"frame_{frame:04d}")
+        bpy.ops.render.render(write_still=True)
+
+
+def render_animation(scene, frames, output_dir):
+    scene.frame_start = frames[0]
+    scene.frame_end = frames[-1]
+    scene.frame_step = 1
+    scene.render.filepath = os.path.join(output_dir, "anim_####")
+    bpy.ops.render.render(animation=True)
+
+
+def measure(method, scene, frames, output_dir, repeats):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        method(scene, frames, output_dir)
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    args = parse_args()
+    scene = bpy.context.scene
+    scene.render.engine = args.engine
+    scale = args.resolution / max(scene.render.resolution_x, scene.render.resolution_y)
+    scene.render.resolution_percentage = max(1, min(100, round(scale * 100)))
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.use_persistent_data = args.persistent_data
+    if args.engine == 'CYCLES':
+        scene.cycles.samples = 1
+
+    frames = list(range(1, args.frames + 1))
+    with tempfile.TemporaryDirectory() as output_dir:
+        # One untimed frame, so shader compilation doesn't count against the first method
+        render_frame_by_frame(scene, frames[:1], output_dir)
+        frame_by_frame = measure(render_frame_by_frame, scene, frames, output_dir, args.repeats)
+        animation = measure(render_animation, scene, frames, output_dir, args.repeats)
+
+    count = len(frames)
+    print(f"Blender {bpy.app.version_string}, {args.engine}, {count} frames, median of {args.repeats} runs")
+    print(f"  frame by frame  {frame_by_frame:8.2f} s  {frame_by_frame / count * 1000:8.1f} ms/frame")
+    print(f"  animation       {animation:8.2f} s  {animation / count * 1000:8.1f} ms/frame")
+    print(f"  saved per frame {(frame_by_frame - animation) / count * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
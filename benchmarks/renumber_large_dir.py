@@ -0,0 +1,115 @@
+"""
+Renumbering cost on a large output folder.
+
+Fills a temp folder with empty frame files (every second frame, like a job
+with frame step 2, plus files of a second sequence that must be left
+alone) and times each stage of the renumbering engine:
+
+- finding the sequence: one ``os.scandir`` pass with plain string checks,
+  against the ``glob`` plus regex scan the old renumbering used
+- planning the renames
+- moving the frames in place, journal writes included
+- building a symlink view instead
+
+Needs no Blender, run with plain Python from the repository root:
+
+    python benchmarks/renumber_large_dir.py --frames 20000
+
+Pass ``--dir`` to create the folder on another drive, e.g. a network share,
+where the listing and every rename cost a round trip.
+"""
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+# The package's __init__ needs Blender, the renumbering engine doesn't
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rendercue")
+if "rendercue" not in sys.modules:
+    package = types.ModuleType("rendercue")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["rendercue"] = package
+
+from rendercue.constants import RENUMBER_SYMLINK  # noqa: E402
+from rendercue.renumber import (  # noqa: E402
+    list_names, scan_sequence, plan_renumber, move_renames, link_renames
+)
+
+NAME_PREFIX = "Scene_"
+OTHER_PREFIX = "Mist_"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=20000, help="Frame files in the sequence")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs of the read-only stages, the median is reported")
+    parser.add_argument("--dir", default=None, help="Create the test folder in this directory")
+    return parser.parse_args()
+
+
+def fill_folder(output_dir, count):
+    for frame in range(1, count * 2, 2):
+        for prefix in (NAME_PREFIX, OTHER_PREFIX):
+            open(os.path.join(output_dir, f"{prefix}{frame:04d}.png"), 'wb').close()
+
+
+def scan_glob_regex(output_dir):
+    """The scan of the old renumbering: glob the folder, regex every match."""
+    frame_regex = re.compile(r'[._](\d+)\.\w+$')
+    frame_files = []
+    for path in glob.glob(os.path.join(output_dir, f"{NAME_PREFIX}*.png")):
+        match = frame_regex.search(path)
+        if match:
+            frame_files.append((int(match.group(1)), path))
+    frame_files.sort()
+    return frame_files
+
+
+def scan_scandir(output_dir):
+    return scan_sequence(list_names(output_dir), NAME_PREFIX)
+
+
+def measure(function, repeats):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def time_once(function):
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def main():
+    args = parse_args()
+    count = args.frames
+    with tempfile.TemporaryDirectory(dir=args.dir) as output_dir:
+        fill_folder(output_dir, count)
+        glob_regex = measure(lambda: scan_glob_regex(output_dir), args.repeats)
+        scandir = measure(lambda: scan_scandir(output_dir), args.repeats)
+        plan = measure(lambda: plan_renumber(output_dir, NAME_PREFIX, 1), args.repeats)
+
+        renames = plan_renumber(output_dir, NAME_PREFIX, 1)
+        link = time_once(lambda: link_renames(output_dir, renames, [], RENUMBER_SYMLINK))
+        move = time_once(lambda: move_renames(output_dir, renames))
+
+    print(f"{count} frames ({count * 2} files in the folder), {len(renames)} renames")
+    print(f"  scan, glob + regex      {glob_regex * 1000:9.1f} ms")
+    print(f"  scan, scandir + strings {scandir * 1000:9.1f} ms  ({glob_regex / scandir:.1f}x)")
+    print(f"  plan (scan included)    {plan * 1000:9.1f} ms")
+    print(f"  symlink view            {link * 1000:9.1f} ms  {link / count * 1e6:6.1f} us/frame")
+    print(f"  journaled move          {move * 1000:9.1f} ms  {move / count * 1e6:6.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
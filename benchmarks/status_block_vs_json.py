@@ -0,0 +1,127 @@
+"""
+Status updates through the shared-memory block against the JSON status file.
+
+Times one status update from the worker to the UI both ways:
+
+- JSON: the worker dumps the whole status to the status file, the UI's
+  status watcher stats it and parses it again
+- Block: the worker updates the memory-mapped status block in place, the UI
+  reads the header and the jobs the event ring names
+
+and the poll the UI makes while nothing changed (a stat against one
+integer unpack). Needs no Blender, run with plain Python from the
+repository root:
+
+    python benchmarks/status_block_vs_json.py --jobs 200
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+# The package's __init__ needs Blender, the status block doesn't
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rendercue")
+if "rendercue" not in sys.modules:
+    package = types.ModuleType("rendercue")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["rendercue"] = package
+
+from rendercue.constants import (  # noqa: E402
+    STATUS_FILENAME, STATUS_JOB_INDEX, STATUS_TOTAL_JOBS, STATUS_MESSAGE, STATUS_ETR,
+    STATUS_FINISHED, STATUS_ERROR, STATUS_TIMESTAMP, STATUS_FINISHED_FRAMES, STATUS_TOTAL_FRAMES,
+    STATUS_LAST_FRAME, STATUS_CURRENT_FRAME, STATUS_FRAME_STARTED, STATUS_MEDIAN_FRAME_TIME,
+    STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS, EVENT_PROGRESS
+)
+from rendercue.status_block import StatusBlockReader, StatusBlockWriter  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200, help="Jobs in the queue")
+    parser.add_argument("--updates", type=int, default=2000, help="Status updates per run")
+    parser.add_argument("--repeats", type=int, default=5, help="Runs per channel, the median is reported")
+    return parser.parse_args()
+
+
+def make_status(jobs, update):
+    """A status mid-batch, like ``BackgroundWorker.log_status`` builds it."""
+    job_index = update % jobs
+    return {
+        STATUS_JOB_INDEX: job_index,
+        STATUS_TOTAL_JOBS: jobs,
+        STATUS_MESSAGE: f"Rendering Scene.{job_index:03d} (Frame {update})",
+        STATUS_ETR: "01:23:45",
+        STATUS_FINISHED: False,
+        STATUS_ERROR: None,
+        STATUS_TIMESTAMP: time.time(),
+        STATUS_FINISHED_FRAMES: update,
+        STATUS_TOTAL_FRAMES: jobs * 250,
+        STATUS_LAST_FRAME: f"/renders/Scene.{job_index:03d}/Scene_{update:04d}.png",
+        STATUS_CURRENT_FRAME: [job_index, update],
+        STATUS_FRAME_STARTED: time.time(),
+        STATUS_MEDIAN_FRAME_TIME: 12.5,
+        STATUS_JOB_STATUSES: ['COMPLETED'] * job_index + ['RENDERING'] + ['PENDING'] * (jobs - job_index - 1),
+        STATUS_JOB_PROGRESS: [{'done': 250 if i < job_index else 0, 'total': 250} for i in range(jobs)],
+        STATUS_JOB_TIMINGS: [{'start': 0.0, 'end': 0.0} for _ in range(jobs)],
+    }
+
+
+def run_json(status_path, statuses):
+    for status in statuses:
+        with open(status_path, 'w') as f:
+            json.dump(status, f)
+        os.stat(status_path)
+        with open(status_path, 'r') as f:
+            json.load(f)
+
+
+def run_block(writer, reader, statuses):
+    for status in statuses:
+        writer.write(status, EVENT_PROGRESS, [status[STATUS_JOB_INDEX]], status[STATUS_JOB_STATUSES],
+                     status[STATUS_JOB_PROGRESS], status[STATUS_JOB_TIMINGS])
+        reader.read()
+
+
+def measure(function, repeats):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def main():
+    args = parse_args()
+    statuses = [make_status(args.jobs, update) for update in range(args.updates)]
+    polls = range(args.updates)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        status_path = os.path.join(temp_dir, STATUS_FILENAME)
+        json_update = measure(lambda: run_json(status_path, statuses), args.repeats)
+        json_idle = measure(lambda: [os.stat(status_path) for _ in polls], args.repeats)
+
+        reader = StatusBlockReader(status_path, args.jobs)
+        writer = StatusBlockWriter(status_path)
+        try:
+            block_update = measure(lambda: run_block(writer, reader, statuses), args.repeats)
+            block_idle = measure(lambda: [reader.read() for _ in polls], args.repeats)
+        finally:
+            writer.close()
+            reader.close()
+        size = os.path.getsize(status_path)
+
+    per_update = 1e6 / args.updates
+    print(f"{args.jobs} jobs ({size} byte status file), {args.updates} updates, median of {args.repeats} runs")
+    print(f"  update, JSON   {json_update * per_update:8.1f} us")
+    print(f"  update, block  {block_update * per_update:8.1f} us  ({json_update / block_update:.1f}x)")
+    print(f"  idle poll, stat   {json_idle * per_update:8.2f} us")
+    print(f"  idle poll, block  {block_idle * per_update:8.2f} us  ({json_idle / block_idle:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+RenderCue Audit Module
+
+This module checks the frames a job should have written:
+- Existence from one listing of the output folder, no stat per missing frame
+- Size and file signature of every frame that is there, on a thread pool
+- An optional deep check that reads every file completely: PNG chunks are
+  CRC checked and their image data inflated, JPEGs must be complete
+
+Kept free of bpy, so the checks can run on threads.
+"""
+
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .constants import (
+    AUDIT_THREADS, AUDIT_MISSING, AUDIT_EMPTY, AUDIT_CORRUPT, AUDIT_UNREADABLE,
+    AUDIT_CHUNK_SIZE
+)
+from .renumber import list_names, scan_sequence
+
+# Leading bytes of the image formats Blender writes (formats without one, like TGA, are only size checked)
+SIGNATURES = {
+    ".png": (b"\x89PNG\r\n\x1a\n",),
+    ".jpg": (b"\xff\xd8\xff",),
+    ".jpeg": (b"\xff\xd8\xff",),
+    ".exr": (b"\x76\x2f\x31\x01",),
+    ".tif": (b"II*\x00", b"MM\x00*"),
+    ".tiff": (b"II*\x00", b"MM\x00*"),
+    ".bmp": (b"BM",),
+    ".hdr": (b"#?",),
+    ".webp": (b"RIFF",),
+    ".jp2": (b"\x00\x00\x00\x0cjP  \r\n\x87\n",),
+    ".j2c": (b"\xff\x4f\xff\x51",),
+    ".dpx": (b"SDPX", b"XPDS"),
+    ".cin": (b"\x80\x2a\x5f\xd7", b"\xd7\x5f\x2a\x80"),
+    ".rgb": (b"\x01\xda",),
+}
+_HEAD_SIZE = 16
+_PNG_CHUNK = struct.Struct(">I4s")
+_PNG_CRC = struct.Struct(">I")
+
+
+def is_valid_png(data):
+    """Walk the chunks of a PNG, verify their CRCs and inflate the image data.
+
+    The pixels are inflated in slices and dropped, so even huge frames only
+    need the file itself in memory.
+    """
+    inflater = zlib.decompressobj()
+    pos = 8
+    try:
+        while pos + _PNG_CHUNK.size <= len(data):
+            length, kind = _PNG_CHUNK.unpack_from(data, pos)
+            body = pos + _PNG_CHUNK.size
+            end = body + length + _PNG_CRC.size
+            if end > len(data):
+                return False
+            if zlib.crc32(data[pos + 4:body + length]) != _PNG_CRC.unpack_from(data, body + length)[0]:
+                return False
+            if kind == b"IDAT":
+                inflater.decompress(data[body:body + length], AUDIT_CHUNK_SIZE)
+                while inflater.unconsumed_tail:
+                    inflater.decompress(inflater.unconsumed_tail, AUDIT_CHUNK_SIZE)
+            elif kind == b"IEND":
+                return inflater.eof
+            pos = end
+    except zlib.error:
+        return False
+    return False
+
+
+def check_frame(path, deep=False):
+    """Check a frame file.
+
+    Args:
+        path (str): The frame file.
+        deep (bool): Read the whole file and check the structure of PNGs and JPEGs.
+
+    Returns:
+        str or None: An ``AUDIT_*`` problem, None if the frame is fine.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(_HEAD_SIZE)
+            if not head:
+                return AUDIT_EMPTY
+            signatures = SIGNATURES.get(ext)
+            if signatures and not head.startswith(signatures):
+                return AUDIT_CORRUPT
+            if not deep:
+                return None
+            if ext == ".png":
+                return None if is_valid_png(head + f.read()) else AUDIT_CORRUPT
+            # Other formats are read to the end, which catches I/O errors and truncated reads
+            tail = head
+            while True:
+                chunk = f.read(AUDIT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                tail = chunk
+    except OSError:
+        return AUDIT_UNREADABLE
+    if ext in (".jpg", ".jpeg") and not tail.rstrip(b"\0").endswith(b"\xff\xd9"):
+        return AUDIT_CORRUPT
+    return None
+
+
+def audit_sequence(output_dir, name_prefix, numbers, deep=False, threads=AUDIT_THREADS):
+    """Find the missing and broken frames of a job's output.
+
+    The file extension is taken from the frames in the folder, so the
+    sequence is found whatever format it was rendered in.
+
+    Args:
+        output_dir (str): Output folder of the job.
+        name_prefix (str): Part of the file name before the frame number (e.g. "Scene_").
+        numbers (dict): Number in the file name of every frame the job covers
+            (differs from the frame for sequentially numbered output).
+        deep (bool): Read every file completely, see ``check_frame``.
+        threads (int): Number of files checked at the same time.
+
+    Returns:
+        dict: ``AUDIT_*`` problem per frame, for frames that aren't fine.
+
+    Raises:
+        OSError: If the output folder exists but can't be listed.
+    """
+    try:
+        names = list_names(output_dir)
+    except FileNotFoundError:
+        return {frame: AUDIT_MISSING for frame in numbers}
+
+    sequences = scan_sequence(names, name_prefix, set(numbers.values()))
+    if not sequences:
+        return {frame: AUDIT_MISSING for frame in numbers}
+    ext, files = max(sequences.items(), key=lambda item: len(item[1]))
+    present = {number: name for number, name, _ in files}
+
+    problems = {}
+    checks = []
+    for frame, number in numbers.items():
+        name = present.get(number)
+        if name is None:
+            problems[frame] = AUDIT_MISSING
+        else:
+            checks.append((frame, os.path.join(output_dir, name)))
+
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as pool:
+        results = pool.map(lambda check: check_frame(check[1], deep), checks)
+        for (frame, _), problem in zip(checks, results):
+            if problem:
+                problems[frame] = problem
+    return problems
@@ -6,9 +6,11 @@ Centralizes filenames, status keys, manifest keys, and default values.
 # Filenames
 MANIFEST_FILENAME = "rendercue_manifest.json"
 STATUS_FILENAME = "rendercue_status.json"
-PAUSE_SIGNAL_FILENAME = "rendercue_pause.signal"
 PREVIEW_FILENAME_PREFIX = ".rendercue_preview_"
 DEBUG_LOG_FILENAME = "worker_debug.log"
+JOB_CLAIM_FILENAME_PREFIX = "rendercue_claim_"
+DAEMON_ADDRESS_FILENAME = "rendercue_daemon.json"
+JOURNAL_FILENAME_SUFFIX = "_rendercue_journal.jsonl"
 
 # Status Keys
 STATUS_JOB_INDEX = "job_index"
@@ -25,6 +27,129 @@ STATUS_PAUSED_DURATION = "paused_duration"
 STATUS_JOB_STATUSES = "job_statuses"
 STATUS_JOB_PROGRESS = "job_progress"
 STATUS_JOB_TIMINGS = "job_timings"
+STATUS_SKIPPED_FRAMES = "skipped_frames"
+STATUS_CURRENT_FRAME = "current_frame"
+STATUS_FRAME_STARTED = "frame_started"
+STATUS_MEDIAN_FRAME_TIME = "median_frame_time"
+STATUS_SYNC_SAVED = "sync_saved"
+STATUS_COPY_TIME = "copy_time"
+STATUS_OUTPUT_BYTES = "output_bytes"
+STATUS_PROJECTED_BYTES = "projected_bytes"
+STATUS_DISK_PAUSES = "disk_pauses"
+STATUS_SEQ = "seq"
+STATUS_RELEASED = "released"
+
+# Worker Daemon
+DAEMON_AUTHKEY_ENV = "RENDERCUE_DAEMON_KEY"
+DAEMON_CMD_RENDER = "render"
+
+# Worker Control (JSON commands the UI writes to a worker's stdin, one per line)
+CONTROL_COMMAND = "cmd"
+CONTROL_PAUSE = "pause"
+CONTROL_RESUME = "resume"
+CONTROL_SUSPENDED = "suspended"
+CONTROL_MODE = "mode"
+CONTROL_SECONDS = "seconds"
+CONTROL_CANCEL_JOB = "cancel_job"
+CONTROL_PRIORITIZE_JOB = "prioritize_job"
+CONTROL_APPEND_JOBS = "append_jobs"
+CONTROL_DRAIN = "drain"
+CONTROL_JOB = "job"
+CONTROL_JOBS = "jobs"
+CONTROL_BATCH = "batch"
+
+# Pause Modes
+PAUSE_IMMEDIATE = 'IMMEDIATE'
+PAUSE_AFTER_FRAME = 'AFTER_FRAME'
+PAUSE_RELEASE = 'RELEASE'
+
+# Frame Claims (skip existing)
+FRAME_CLAIM_STALE_SECONDS = 900
+FRAME_CLAIM_HEARTBEAT_SECONDS = 30
+
+# Worker Events (NDJSON lines on the worker's stdout)
+EVENT_LINE_PREFIX = "@rendercue "
+EVENT_TYPE = "type"
+EVENT_STATUS = "status"
+EVENT_JOBS = "jobs"
+EVENT_BATCH = "batch"
+EVENT_PROGRESS = "progress"
+EVENT_FRAME_STARTED = "frame_started"
+EVENT_FRAME_DONE = "frame_done"
+EVENT_JOB_STATE = "job_state"
+EVENT_ERROR = "error"
+EVENT_HEARTBEAT = "heartbeat"
+
+# Status Block (shared-memory status channel)
+STATUS_BLOCK_SUFFIX = ".block"
+PREVIEW_BUFFER_SUFFIX = ".preview"
+STATUS_BLOCK_RING_SIZE = 256
+# Room for jobs appended while the batch renders
+STATUS_BLOCK_SPARE_JOBS = 256
+
+# Status Coalescing (minimum time between two status writes, urgent updates excepted)
+STATUS_FLUSH_SECONDS = 0.25
+
+# UI Polling (the modal timer adapts to how fast frames finish)
+STATUS_WATCH_INTERVAL = 0.1
+TIMER_DEFAULT_INTERVAL = 1.0
+TIMER_MIN_INTERVAL = 0.1
+TIMER_MAX_INTERVAL = 2.0
+TIMER_TICKS_PER_FRAME = 2
+
+# Watchdog
+STATUS_HEARTBEAT_SECONDS = 10
+FRAME_TIME_WINDOW = 20
+
+# Scene Grouping
+# Job settings that can change between renders without invalidating the
+# synced scene data (BVH, textures) kept by persistent data
+SCENE_GROUP_CACHE_SAFE_KEYS = (
+    "override_frame_range", "frame_start", "frame_end",
+    "override_frame_step", "frame_step",
+    "frame_list",
+    "override_output", "output_path",
+    "override_format", "render_format",
+    "override_camera", "camera",
+    "override_skip_existing", "skip_existing",
+    "override_frame_timeout", "frame_timeout",
+)
+# Render stats line once the engine is sampling (Cycles / EEVEE), ending scene sync
+RENDER_STATS_SAMPLING_PATTERN = r"\bSample \d+/\d+|Rendering \d+ / \d+ samples"
+
+# Renumbering (frame step output)
+RENUMBER_MOVE = "MOVE"
+RENUMBER_SYMLINK = "SYMLINK"
+RENUMBER_HARDLINK = "HARDLINK"
+RENUMBER_JOURNAL_FILENAME = ".rendercue_renumber.json"
+RENUMBER_TEMP_PREFIX = ".rendercue_renumber_"
+RENUMBER_VIEW_DIRNAME = "renumbered"
+# Sidecar next to renumbered output, mapping each sequential number to its source frame
+RENUMBER_MAP_SUFFIX = "frame_map.json"
+
+# Output Staging (frames rendered to local scratch, copied out by background threads)
+STAGING_DIRNAME = "rendercue_scratch"
+STAGING_CHUNK_SIZE = 4 * 1024 * 1024
+# Seconds before the first retry of a failed copy, doubled for every further one
+STAGING_RETRY_DELAY = 2.0
+
+# Disk Space (frames measured per job before projecting its output, free space always kept)
+DISK_SAMPLE_FRAMES = 3
+DISK_MIN_FREE_BYTES = 512 * 1024 * 1024
+
+# Output Audit (frames checked at the same time, read size of deep checks, problems found)
+AUDIT_THREADS = 8
+AUDIT_CHUNK_SIZE = 1024 * 1024
+AUDIT_MISSING = "missing"
+AUDIT_EMPTY = "empty"
+AUDIT_CORRUPT = "corrupt"
+AUDIT_UNREADABLE = "unreadable"
+
+# Preview Thumbnails (longest edge, in pixels)
+PREVIEW_MAX_SIZE = 256
+
+# Animation Render Method
+ANIMATION_CHUNK_FRAMES = 100
 
 # Defaults
 DEFAULT_ETR = "--:--"
@@ -35,6 +160,28 @@ MANIFEST_JOBS = "jobs"
 MANIFEST_GLOBAL_OUTPUT = "global_output_path"
 MANIFEST_OUTPUT_LOCATION = "output_location"
 MANIFEST_RENUMBER_OUTPUT = "renumber_output"
+MANIFEST_RENUMBER_MODE = "renumber_mode"
+# What workers do with the renumber preference: name stepped frames gap-free, or build a link view after the job
+MANIFEST_SEQUENTIAL_NAMES = "sequential_names"
+MANIFEST_RENUMBER_VIEW = "renumber_view"
+MANIFEST_SHARD_INDEX = "shard_index"
+MANIFEST_SHARD_COUNT = "shard_count"
+MANIFEST_JOB_POOL = "job_pool"
+MANIFEST_JOURNAL_PATH = "journal_path"
+MANIFEST_SKIP_EXISTING = "skip_existing"
+MANIFEST_RENDER_METHOD = "render_method"
+MANIFEST_JOB_ORDER = "job_order"
+MANIFEST_STATUS_CHANNEL = "status_channel"
+MANIFEST_PAUSED_DURATION = "paused_duration"
+MANIFEST_PREVIEW_POLICY = "preview_policy"
+MANIFEST_PREVIEW_EVERY = "preview_every"
+MANIFEST_PREVIEW_INTERVAL = "preview_interval"
+MANIFEST_DEBUG_LOG = "debug_log"
+MANIFEST_BATCH_ID = "batch_id"
+MANIFEST_STAGING = "output_staging"
+MANIFEST_STAGING_DIR = "staging_dir"
+MANIFEST_STAGING_THREADS = "staging_threads"
+MANIFEST_STAGING_RETRIES = "staging_retries"
 
 # Job Keys
 JOB_SCENE_NAME = "scene_name"
@@ -72,6 +219,17 @@ JOB_TIME_LIMIT = "time_limit"
 JOB_OVERRIDE_PERSISTENT_DATA = "override_persistent_data"
 JOB_USE_PERSISTENT_DATA = "use_persistent_data"
 
+JOB_OVERRIDE_SKIP_EXISTING = "override_skip_existing"
+JOB_SKIP_EXISTING = "skip_existing"
+JOB_OVERRIDE_FRAME_TIMEOUT = "override_frame_timeout"
+JOB_FRAME_TIMEOUT = "frame_timeout"
+JOB_SCENE_GROUP = "scene_group"
+JOB_CANCELLED = "cancelled"
+
+# Resume
+JOB_COMPLETED_FRAMES = "completed_frames"
+JOB_FRAME_LIST = "frame_list"
+
 # UI Constants
 UI_RESOLUTION_PERCENTAGE_BASE = 100
 UI_BANNER_SCALE = 1.1
@@ -80,6 +238,8 @@ UI_QUEUE_PREVIEW_BEFORE = 5
 UI_QUEUE_PREVIEW_AFTER = 4
 UI_MAX_JOB_NAME_LENGTH = 18
 UI_PREVIEW_COLLECTION_KEY = "main"
+# Fixed key of the live preview in the preview collection
+UI_PREVIEW_IMAGE_KEY = "live_preview"
 
 # Icon Mappings
 UI_STATUS_ICONS = {
@@ -4,8 +4,11 @@ RenderCue Core Module
 This module contains the core logic for the RenderCue addon, including:
 - StateManager: Handles saving and loading of the render queue.
 - BackgroundWorker: Manages the background rendering process.
+- WorkerDaemon: Keeps a background worker resident between batches.
+- PreviewEncoder: Writes the preview thumbnails of a worker.
+- Output staging: Workers render to local scratch and copy frames out in the background.
 - RenderCueLogger: Provides a consistent logging interface.
-- Utility functions for frame renumbering and file management.
+- Utility functions for frame lists, journals and output paths.
 """
 
 import bpy
@@ -13,10 +16,17 @@ import os
 import json
 import logging
 import time
-import glob
 import re
 import shutil
-import uuid
+import sys
+import queue
+import threading
+import statistics
+import struct
+import math
+import numpy as np
+from collections import deque
+from multiprocessing.connection import Listener
 from .constants import (
     MANIFEST_JOBS, MANIFEST_GLOBAL_OUTPUT, MANIFEST_OUTPUT_LOCATION,
     MANIFEST_RENUMBER_OUTPUT,
@@ -36,10 +46,42 @@ from .constants import (
     STATUS_JOB_INDEX, STATUS_TOTAL_JOBS, STATUS_TIMESTAMP,
     STATUS_FINISHED_FRAMES, STATUS_TOTAL_FRAMES, STATUS_LAST_FRAME,
     STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS,
-    DEFAULT_ETR, PAUSE_SIGNAL_FILENAME, PREVIEW_FILENAME_PREFIX,
-    DEBUG_LOG_FILENAME, STATUS_PAUSED_DURATION
+    DEFAULT_ETR, PREVIEW_FILENAME_PREFIX,
+    DEBUG_LOG_FILENAME, STATUS_PAUSED_DURATION,
+    MANIFEST_SHARD_INDEX, MANIFEST_SHARD_COUNT, MANIFEST_JOB_POOL,
+    JOB_CLAIM_FILENAME_PREFIX, DAEMON_AUTHKEY_ENV, DAEMON_CMD_RENDER,
+    JOURNAL_FILENAME_SUFFIX, MANIFEST_JOURNAL_PATH, JOB_COMPLETED_FRAMES,
+    STATUS_SKIPPED_FRAMES, MANIFEST_SKIP_EXISTING, JOB_OVERRIDE_SKIP_EXISTING,
+    JOB_SKIP_EXISTING, FRAME_CLAIM_STALE_SECONDS, FRAME_CLAIM_HEARTBEAT_SECONDS,
+    MANIFEST_RENDER_METHOD, ANIMATION_CHUNK_FRAMES, JOB_FRAME_LIST,
+    STATUS_CURRENT_FRAME, STATUS_FRAME_STARTED, STATUS_MEDIAN_FRAME_TIME,
+    STATUS_HEARTBEAT_SECONDS, FRAME_TIME_WINDOW, JOB_OVERRIDE_FRAME_TIMEOUT,
+    JOB_FRAME_TIMEOUT, MANIFEST_JOB_ORDER, STATUS_SYNC_SAVED, JOB_SCENE_GROUP,
+    SCENE_GROUP_CACHE_SAFE_KEYS, RENDER_STATS_SAMPLING_PATTERN,
+    MANIFEST_STATUS_CHANNEL, EVENT_LINE_PREFIX, EVENT_TYPE, EVENT_STATUS, EVENT_JOBS,
+    EVENT_BATCH, EVENT_PROGRESS, EVENT_FRAME_STARTED, EVENT_FRAME_DONE,
+    EVENT_JOB_STATE, EVENT_ERROR, EVENT_HEARTBEAT, STATUS_SEQ, STATUS_FLUSH_SECONDS,
+    STATUS_RELEASED, MANIFEST_PAUSED_DURATION, CONTROL_COMMAND, CONTROL_PAUSE,
+    CONTROL_RESUME, CONTROL_SUSPENDED, CONTROL_MODE, CONTROL_SECONDS,
+    PAUSE_AFTER_FRAME, PAUSE_RELEASE, CONTROL_CANCEL_JOB, CONTROL_PRIORITIZE_JOB,
+    CONTROL_APPEND_JOBS, CONTROL_DRAIN, CONTROL_JOB, CONTROL_JOBS, CONTROL_BATCH,
+    MANIFEST_BATCH_ID, JOB_CANCELLED, PREVIEW_MAX_SIZE, MANIFEST_PREVIEW_POLICY,
+    MANIFEST_PREVIEW_EVERY, MANIFEST_PREVIEW_INTERVAL, MANIFEST_DEBUG_LOG,
+    MANIFEST_RENUMBER_MODE, MANIFEST_STAGING, MANIFEST_STAGING_DIR,
+    MANIFEST_STAGING_THREADS, MANIFEST_STAGING_RETRIES, STATUS_COPY_TIME,
+    DISK_SAMPLE_FRAMES, DISK_MIN_FREE_BYTES, STATUS_OUTPUT_BYTES, STATUS_PROJECTED_BYTES,
+    STATUS_DISK_PAUSES
 )
 from . import version_compat
+from .status_block import StatusBlockWriter
+from .preview_buffer import PreviewBufferWriter
+from .audit import check_frame
+from .renumber import (
+    renumber_sequence, RenumberError, get_sequential_frame, write_frame_map,
+    get_renumber_flags, uses_sequential_names, builds_link_view
+)
+from .staging import OutputStager, get_scratch_dir, is_same_drive
+from .disk_space import get_free_bytes, get_mount_point, format_bytes
 
 # --- Logging ---
 
@@ -100,54 +142,28 @@ class StateManager:
             MANIFEST_GLOBAL_OUTPUT: settings.global_output_path,
             MANIFEST_OUTPUT_LOCATION: settings.output_location,
             MANIFEST_RENUMBER_OUTPUT: context.preferences.addons[__package__].preferences.renumber_frame_step_output,
+            MANIFEST_RENUMBER_MODE: context.preferences.addons[__package__].preferences.renumber_mode,
+            **get_renumber_flags(context.preferences.addons[__package__].preferences.renumber_frame_step_output,
+                                 context.preferences.addons[__package__].preferences.renumber_mode),
+            MANIFEST_SKIP_EXISTING: settings.skip_existing_frames,
+            MANIFEST_RENDER_METHOD: context.preferences.addons[__package__].preferences.render_method,
+            MANIFEST_STATUS_CHANNEL: context.preferences.addons[__package__].preferences.status_channel,
+            MANIFEST_PREVIEW_POLICY: context.preferences.addons[__package__].preferences.preview_policy,
+            MANIFEST_PREVIEW_EVERY: context.preferences.addons[__package__].preferences.preview_every,
+            MANIFEST_PREVIEW_INTERVAL: context.preferences.addons[__package__].preferences.preview_interval,
+            MANIFEST_DEBUG_LOG: context.preferences.addons[__package__].preferences.worker_debug_log,
+            MANIFEST_STAGING: context.preferences.addons[__package__].preferences.use_output_staging,
+            MANIFEST_STAGING_DIR: bpy.path.abspath(context.preferences.addons[__package__].preferences.staging_directory),
+            MANIFEST_STAGING_THREADS: context.preferences.addons[__package__].preferences.staging_copy_threads,
+            MANIFEST_STAGING_RETRIES: context.preferences.addons[__package__].preferences.staging_copy_retries,
             MANIFEST_JOBS: []
         }
         
         for job in settings.jobs:
-            job_data = {
-                JOB_SCENE_NAME: job.scene.name if job.scene else None,
-                
-                JOB_OVERRIDE_FRAME_RANGE: job.override_frame_range,
-                JOB_FRAME_START: job.frame_start,
-                JOB_FRAME_END: job.frame_end,
-                
-                JOB_OVERRIDE_OUTPUT: job.override_output,
-                JOB_OUTPUT_PATH: job.output_path,
-                
-                JOB_OVERRIDE_RESOLUTION: job.override_resolution,
-                JOB_RESOLUTION_SCALE: job.resolution_scale,
-                
-                JOB_OVERRIDE_SAMPLES: job.override_samples,
-                JOB_SAMPLES: job.samples,
-                
-                JOB_OVERRIDE_FORMAT: job.override_format,
-                JOB_RENDER_FORMAT: job.render_format,
-                
-                JOB_OVERRIDE_ENGINE: job.override_engine,
-                JOB_RENDER_ENGINE: job.render_engine,
-                
-                JOB_OVERRIDE_VIEW_LAYER: job.override_view_layer,
-                JOB_VIEW_LAYER: job.view_layer,
-                
-                # New Overrides
-                JOB_OVERRIDE_CAMERA: job.override_camera,
-                JOB_CAMERA: job.camera.name if job.camera else None,
-                JOB_OVERRIDE_FRAME_STEP: job.override_frame_step,
-                JOB_FRAME_STEP: job.frame_step,
-                JOB_OVERRIDE_TRANSPARENT: job.override_transparent,
-                JOB_FILM_TRANSPARENT: job.film_transparent,
-                JOB_OVERRIDE_COMPOSITOR: job.override_compositor,
-                JOB_USE_COMPOSITOR: job.use_compositor,
-                JOB_OVERRIDE_DENOISING: job.override_denoising,
-                JOB_USE_DENOISING: job.use_denoising,
-                JOB_OVERRIDE_DEVICE: job.override_device,
-                JOB_DEVICE: job.device,
-                JOB_OVERRIDE_TIME_LIMIT: job.override_time_limit,
-                JOB_TIME_LIMIT: job.time_limit,
-                JOB_OVERRIDE_PERSISTENT_DATA: job.override_persistent_data,
-                JOB_USE_PERSISTENT_DATA: job.use_persistent_data
-            }
-            data[MANIFEST_JOBS].append(job_data)
+            data[MANIFEST_JOBS].append(StateManager.serialize_job(job))
+        
+        if context.preferences.addons[__package__].preferences.group_jobs_by_scene:
+            data[MANIFEST_JOB_ORDER] = group_jobs_by_scene(data[MANIFEST_JOBS])
             
         try:
             with open(filepath, 'w') as f:
@@ -156,6 +172,68 @@ class StateManager:
             logger = logging.getLogger("RenderCue")
             logger.error(f"Error saving state to {filepath}: {e}")
             
+    @staticmethod
+    def serialize_job(job):
+        """Get the manifest entry of a job.
+
+        Args:
+            job (RenderCueJob): Job from the queue.
+
+        Returns:
+            dict: The job's settings, keyed by the ``JOB_*`` manifest keys.
+        """
+        data = {
+            JOB_SCENE_NAME: job.scene.name if job.scene else None,
+            
+            JOB_OVERRIDE_FRAME_RANGE: job.override_frame_range,
+            JOB_FRAME_START: job.frame_start,
+            JOB_FRAME_END: job.frame_end,
+            
+            JOB_OVERRIDE_OUTPUT: job.override_output,
+            JOB_OUTPUT_PATH: job.output_path,
+            
+            JOB_OVERRIDE_RESOLUTION: job.override_resolution,
+            JOB_RESOLUTION_SCALE: job.resolution_scale,
+            
+            JOB_OVERRIDE_SAMPLES: job.override_samples,
+            JOB_SAMPLES: job.samples,
+            
+            JOB_OVERRIDE_FORMAT: job.override_format,
+            JOB_RENDER_FORMAT: job.render_format,
+            
+            JOB_OVERRIDE_ENGINE: job.override_engine,
+            JOB_RENDER_ENGINE: job.render_engine,
+            
+            JOB_OVERRIDE_VIEW_LAYER: job.override_view_layer,
+            JOB_VIEW_LAYER: job.view_layer,
+            
+            # New Overrides
+            JOB_OVERRIDE_CAMERA: job.override_camera,
+            JOB_CAMERA: job.camera.name if job.camera else None,
+            JOB_OVERRIDE_FRAME_STEP: job.override_frame_step,
+            JOB_FRAME_STEP: job.frame_step,
+            JOB_OVERRIDE_TRANSPARENT: job.override_transparent,
+            JOB_FILM_TRANSPARENT: job.film_transparent,
+            JOB_OVERRIDE_COMPOSITOR: job.override_compositor,
+            JOB_USE_COMPOSITOR: job.use_compositor,
+            JOB_OVERRIDE_DENOISING: job.override_denoising,
+            JOB_USE_DENOISING: job.use_denoising,
+            JOB_OVERRIDE_DEVICE: job.override_device,
+            JOB_DEVICE: job.device,
+            JOB_OVERRIDE_TIME_LIMIT: job.override_time_limit,
+            JOB_TIME_LIMIT: job.time_limit,
+            JOB_OVERRIDE_PERSISTENT_DATA: job.override_persistent_data,
+            JOB_USE_PERSISTENT_DATA: job.use_persistent_data,
+            JOB_OVERRIDE_SKIP_EXISTING: job.override_skip_existing,
+            JOB_SKIP_EXISTING: job.skip_existing,
+            JOB_OVERRIDE_FRAME_TIMEOUT: job.override_frame_timeout,
+            JOB_FRAME_TIMEOUT: job.frame_timeout
+        }
+        # Only present when set, an explicit list replaces the frame range
+        if job.override_frame_list and job.frame_list.strip():
+            data[JOB_FRAME_LIST] = job.frame_list.strip()
+        return data
+
     @staticmethod
     def load_state(context, filepath):
         """Load render queue state from an external JSON file.
@@ -179,6 +257,7 @@ class StateManager:
             
             settings.global_output_path = data.get(MANIFEST_GLOBAL_OUTPUT, settings.global_output_path)
             settings.output_location = data.get(MANIFEST_OUTPUT_LOCATION, 'BLEND')
+            settings.skip_existing_frames = data.get(MANIFEST_SKIP_EXISTING, False)
             # settings.renumber_frame_step_output = data.get(MANIFEST_RENUMBER_OUTPUT, False)
             
             for job_data in data.get(MANIFEST_JOBS, []):
@@ -221,6 +300,8 @@ class StateManager:
                     
                 job.override_frame_step = job_data.get(JOB_OVERRIDE_FRAME_STEP, False)
                 job.frame_step = job_data.get(JOB_FRAME_STEP, 1)
+                job.override_frame_list = JOB_FRAME_LIST in job_data
+                job.frame_list = job_data.get(JOB_FRAME_LIST, "")
                 
                 job.override_transparent = job_data.get(JOB_OVERRIDE_TRANSPARENT, False)
                 job.film_transparent = job_data.get(JOB_FILM_TRANSPARENT, False)
@@ -240,6 +321,11 @@ class StateManager:
                 job.override_persistent_data = job_data.get(JOB_OVERRIDE_PERSISTENT_DATA, False)
                 job.use_persistent_data = job_data.get(JOB_USE_PERSISTENT_DATA, False)
                 
+                job.override_skip_existing = job_data.get(JOB_OVERRIDE_SKIP_EXISTING, False)
+                job.skip_existing = job_data.get(JOB_SKIP_EXISTING, True)
+                job.override_frame_timeout = job_data.get(JOB_OVERRIDE_FRAME_TIMEOUT, False)
+                job.frame_timeout = job_data.get(JOB_FRAME_TIMEOUT, 0.0)
+                
             return True
         except (OSError, json.JSONDecodeError) as e:
             logger = logging.getLogger("RenderCue")
@@ -306,47 +392,12 @@ class StateManager:
             MANIFEST_GLOBAL_OUTPUT: settings.global_output_path,
             MANIFEST_OUTPUT_LOCATION: settings.output_location,
             MANIFEST_RENUMBER_OUTPUT: context.preferences.addons[__package__].preferences.renumber_frame_step_output,
+            MANIFEST_SKIP_EXISTING: settings.skip_existing_frames,
             MANIFEST_JOBS: []
         }
         
         for job in settings.jobs:
-            job_data = {
-                JOB_SCENE_NAME: job.scene.name if job.scene else None,
-                JOB_OVERRIDE_FRAME_RANGE: job.override_frame_range,
-                JOB_FRAME_START: job.frame_start,
-                JOB_FRAME_END: job.frame_end,
-                JOB_OVERRIDE_OUTPUT: job.override_output,
-                JOB_OUTPUT_PATH: job.output_path,
-                JOB_OVERRIDE_RESOLUTION: job.override_resolution,
-                JOB_RESOLUTION_SCALE: job.resolution_scale,
-                JOB_OVERRIDE_SAMPLES: job.override_samples,
-                JOB_SAMPLES: job.samples,
-                JOB_OVERRIDE_FORMAT: job.override_format,
-                JOB_RENDER_FORMAT: job.render_format,
-                JOB_OVERRIDE_ENGINE: job.override_engine,
-                JOB_RENDER_ENGINE: job.render_engine,
-                JOB_OVERRIDE_VIEW_LAYER: job.override_view_layer,
-                JOB_VIEW_LAYER: job.view_layer,
-                
-                # New Overrides
-                JOB_OVERRIDE_CAMERA: job.override_camera,
-                JOB_CAMERA: job.camera.name if job.camera else None,
-                JOB_OVERRIDE_FRAME_STEP: job.override_frame_step,
-                JOB_FRAME_STEP: job.frame_step,
-                JOB_OVERRIDE_TRANSPARENT: job.override_transparent,
-                JOB_FILM_TRANSPARENT: job.film_transparent,
-                JOB_OVERRIDE_COMPOSITOR: job.override_compositor,
-                JOB_USE_COMPOSITOR: job.use_compositor,
-                JOB_OVERRIDE_DENOISING: job.override_denoising,
-                JOB_USE_DENOISING: job.use_denoising,
-                JOB_OVERRIDE_DEVICE: job.override_device,
-                JOB_DEVICE: job.device,
-                JOB_OVERRIDE_TIME_LIMIT: job.override_time_limit,
-                JOB_TIME_LIMIT: job.time_limit,
-                JOB_OVERRIDE_PERSISTENT_DATA: job.override_persistent_data,
-                JOB_USE_PERSISTENT_DATA: job.use_persistent_data
-            }
-            data[MANIFEST_JOBS].append(job_data)
+            data[MANIFEST_JOBS].append(StateManager.serialize_job(job))
             
         text_name = ".rendercue_data"
         text = bpy.data.texts.get(text_name)
@@ -375,6 +426,7 @@ class StateManager:
             
             settings.global_output_path = data.get(MANIFEST_GLOBAL_OUTPUT, settings.global_output_path)
             settings.output_location = data.get(MANIFEST_OUTPUT_LOCATION, 'BLEND')
+            settings.skip_existing_frames = data.get(MANIFEST_SKIP_EXISTING, False)
             # settings.renumber_frame_step_output = data.get(MANIFEST_RENUMBER_OUTPUT, False)
             
             for job_data in data.get(MANIFEST_JOBS, []):
@@ -414,6 +466,8 @@ class StateManager:
                     
                 job.override_frame_step = job_data.get(JOB_OVERRIDE_FRAME_STEP, False)
                 job.frame_step = job_data.get(JOB_FRAME_STEP, 1)
+                job.override_frame_list = JOB_FRAME_LIST in job_data
+                job.frame_list = job_data.get(JOB_FRAME_LIST, "")
                 
                 job.override_transparent = job_data.get(JOB_OVERRIDE_TRANSPARENT, False)
                 job.film_transparent = job_data.get(JOB_FILM_TRANSPARENT, False)
@@ -433,6 +487,11 @@ class StateManager:
                 job.override_persistent_data = job_data.get(JOB_OVERRIDE_PERSISTENT_DATA, False)
                 job.use_persistent_data = job_data.get(JOB_USE_PERSISTENT_DATA, False)
                 
+                job.override_skip_existing = job_data.get(JOB_OVERRIDE_SKIP_EXISTING, False)
+                job.skip_existing = job_data.get(JOB_SKIP_EXISTING, True)
+                job.override_frame_timeout = job_data.get(JOB_OVERRIDE_FRAME_TIMEOUT, False)
+                job.frame_timeout = job_data.get(JOB_FRAME_TIMEOUT, 0.0)
+                
                 # NEW: Validate and sanitize loaded data
                 StateManager._sanitize_job_data(job, job_data, scene)
         except json.JSONDecodeError as e:
@@ -473,115 +532,625 @@ def _load_post_handler(dummy):
 
 # --- Utilities ---
 
-def renumber_output_sequence(output_dir, file_pattern, start_frame, end_frame, step):
-    """Renumber output files sequentially to close gaps caused by frame steps.
-    
+def format_etr(remaining_seconds):
+    """Format a remaining time in seconds as an ETR string.
+
     Args:
-        output_dir (str): Directory containing the rendered files.
-        file_pattern (str): Glob pattern to match files (e.g. "*.png").
-        start_frame (int): The starting frame number of the sequence.
-        end_frame (int): The ending frame number of the sequence.
-        step (int): The frame step used during rendering.
+        remaining_seconds (float): Estimated seconds left.
+
+    Returns:
+        str: "MM:SS" or "HH:MM:SS", or the default placeholder when unknown.
     """
-    if step <= 1:
-        return
+    if remaining_seconds <= 0:
+        return DEFAULT_ETR
 
-    logger = logging.getLogger("RenderCue")
-    logger.info(f"Renumbering sequence in {output_dir}...")
-    
-    # 1. Find all matching files
-    # We need to be careful to only match files that look like frame numbers
-    # Pattern usually is Name_####.ext
-    # We'll use a regex to extract frame numbers for sorting
-    
-    files = glob.glob(os.path.join(output_dir, file_pattern))
-    if not files:
-        logger.info("No files found to renumber.")
-        return
-
-    # Regex to find the frame number at the end of the filename
-    # Matches _1234.ext or .1234.ext
-    frame_regex = re.compile(r'[._](\d+)\.\w+$')
-    
-    # Filter and sort files by frame number
-    # List of (frame_number, full_path)
-    frame_files = []
-    for f in files:
-        match = frame_regex.search(f)
-        if match:
-            frame_num = int(match.group(1))
-            # Only include frames within our render range (roughly)
-            # We allow some buffer in case of existing files, but primarily we care about the sequence order
-            frame_files.append((frame_num, f))
-            
-    # Sort by frame number
-    frame_files.sort(key=lambda x: x[0])
-    
-    if not frame_files:
-        logger.info("No matching frame files found.")
-        return
+    mins, secs = divmod(int(remaining_seconds), 60)
+    hrs, mins = divmod(mins, 60)
+    if hrs > 0:
+        return f"{hrs:02d}:{mins:02d}:{secs:02d}"
+    return f"{mins:02d}:{secs:02d}"
 
-    # 2. Rename sequentially
-    # We use a temp rename strategy to avoid collisions if the new names overlap with old ones
-    # (e.g. renaming 3->2 when 2 exists)
-    
-    renames = []
-    target_frame = 1 # Start from 1 for video editors, or start_frame?
-    # Usually video editors want 1, 2, 3... or start_frame, start_frame+1...
-    # Let's stick to sequential from start_frame for consistency with timeline
-    target_frame = start_frame
-    
-    # First pass: Rename to temp
-    temp_files = []
+
+def parse_frame_list(text):
+    """Parse a compact frame list into frame numbers.
+
+    Accepts comma separated frames and ranges, with an optional step:
+    ``"1-10,15,20-30x5"``.
+
+    Args:
+        text (str): The frame list.
+
+    Returns:
+        list: Sorted, unique frame numbers.
+
+    Raises:
+        ValueError: If the text is not a valid frame list.
+    """
+    frames = set()
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        step = 1
+        if "x" in part:
+            part, step_text = part.split("x", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid frame step: {step}")
+        # Allow negative frames ("-5--1") by splitting on the separating dash only
+        match = re.fullmatch(r"(-?\d+)(?:-(-?\d+))?", part)
+        if not match:
+            raise ValueError(f"Invalid frame list entry: {part}")
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) is not None else start
+        frames.update(range(start, end + 1, step))
+    return sorted(frames)
+
+
+def format_frame_list(frames):
+    """Format frame numbers as a compact frame list (see ``parse_frame_list``).
+
+    Args:
+        frames (iterable): Frame numbers.
+
+    Returns:
+        str: The frame list, e.g. ``"1-10,15,20-30x5"``.
+    """
+    frames = sorted(set(frames))
+    parts = []
+    i = 0
+    while i < len(frames):
+        # Extend the longest run with a constant step
+        j = i
+        step = 1
+        if i + 1 < len(frames):
+            step = frames[i + 1] - frames[i]
+            j = i + 1
+            while j + 1 < len(frames) and frames[j + 1] - frames[j] == step:
+                j += 1
+        if j - i >= 2 or (j - i == 1 and step == 1):
+            run = f"{frames[i]}-{frames[j]}"
+            parts.append(run if step == 1 else f"{run}x{step}")
+            i = j + 1
+        else:
+            parts.append(str(frames[i]))
+            i += 1
+    return ",".join(parts)
+
+
+def split_frame_runs(frames, max_length=None):
+    """Split frame numbers into runs with a constant step.
+
+    Args:
+        frames (list): Frame numbers in render order.
+        max_length (int, optional): Maximum number of frames per run.
+
+    Returns:
+        list: ``(start, end, step)`` tuples covering every frame.
+    """
+    runs = []
+    i = 0
+    while i < len(frames):
+        j = i
+        step = 1
+        if i + 1 < len(frames) and frames[i + 1] > frames[i]:
+            step = frames[i + 1] - frames[i]
+            while (j + 1 < len(frames) and frames[j + 1] - frames[j] == step
+                   and (max_length is None or j + 1 - i < max_length)):
+                j += 1
+        runs.append((frames[i], frames[j], step))
+        i = j + 1
+    return runs
+
+
+def group_jobs_by_scene(jobs):
+    """Order jobs so jobs that can share synced scene data render back-to-back.
+
+    Jobs are grouped when they use the same scene and only differ in settings
+    that don't invalidate the render cache (camera, output, format, frames).
+    Groups keep the position of their first job, and jobs keep their queue
+    order within a group. Members of groups with more than one job are tagged
+    with ``JOB_SCENE_GROUP`` so the worker keeps persistent data on for them.
+
+    Job indices are not changed, so statuses still map to the queue in the UI.
+
+    Args:
+        jobs (list): Job dicts from the manifest, updated in place.
+
+    Returns:
+        list: Job indices in render order.
+    """
+    groups = {}
+    for index, job in enumerate(jobs):
+        settings = tuple(sorted(
+            (key, json.dumps(value)) for key, value in job.items()
+            if key not in SCENE_GROUP_CACHE_SAFE_KEYS
+        ))
+        groups.setdefault(settings, []).append(index)
     
+    order = []
+    for group_id, members in enumerate(groups.values()):
+        order.extend(members)
+        if len(members) > 1:
+            for index in members:
+                jobs[index][JOB_SCENE_GROUP] = group_id
+    return order
+
+
+def get_journal_path(blend_filepath):
+    """Get the resume journal of a .blend file.
+
+    The journal is a hidden file next to the .blend rather than in the temp
+    directory, so it survives crashes and reboots.
+
+    Args:
+        blend_filepath (str): Path of the .blend file being rendered.
+
+    Returns:
+        str: Path to the journal.
+    """
+    directory, filename = os.path.split(blend_filepath)
+    blend_name = os.path.splitext(filename)[0] or "Untitled"
+    return os.path.join(directory, f".{blend_name}{JOURNAL_FILENAME_SUFFIX}")
+
+
+def read_journal(journal_path, scene_names):
+    """Collect the completed frames recorded in a resume journal.
+
+    Entries for a job whose scene no longer matches the queue are ignored,
+    as is a final line cut off by a crash.
+
+    Args:
+        journal_path (str): Path to the journal.
+        scene_names (list): Scene name of every job in the queue, in order.
+
+    Returns:
+        dict: Set of completed frames, keyed by 0-based job index.
+    """
+    completed = {}
     try:
-        for frame_num, old_path in frame_files:
-            # Construct new filename
-            # We assume standard Blender naming: Name_####.ext
-            # We want to preserve the Name_ part and extension
-            
-            dirname, basename = os.path.split(old_path)
-            match = frame_regex.search(basename)
-            if not match:
-                continue
-                
-            prefix = basename[:match.start(1)] # Everything before the number
-            suffix = basename[match.end(1):]   # Everything after the number (usually empty or just extension)
-            ext = os.path.splitext(basename)[1]
-            
-            # Reconstruct new name
-            # Note: match.start(1) includes the separator (. or _) if we aren't careful
-            # The regex is [._](\d+), so group 1 is just digits.
-            # prefix will include the separator.
-            
-            new_name = f"{prefix}{target_frame:04d}{ext}" 
-            # Note: Blender might use different padding, but 4 is standard. 
-            # If original had different padding, we might want to detect it, but 4 is safe default.
-            
-            new_path = os.path.join(dirname, new_name)
-            
-            if new_path != old_path:
-                # Rename to temp
-                temp_name = f".tmp_renumber_{uuid.uuid4().hex}_{basename}"
-                # uuid not imported, use time
-                temp_name = f".tmp_renumber_{int(time.time()*1000)}_{target_frame}_{basename}"
-                temp_path = os.path.join(dirname, temp_name)
-                
-                os.replace(old_path, temp_path)
-                temp_files.append((temp_path, new_path))
-            
-            target_frame += 1
-            
-        # Second pass: Rename temp to final
-        for temp_path, new_path in temp_files:
-            os.replace(temp_path, new_path)
-            
-        logger.info(f"Successfully renumbered {len(temp_files)} files.")
+        with open(journal_path, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    job_index = entry['job']
+                    frame = entry['frame']
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+                if 0 <= job_index < len(scene_names) and entry.get('scene') == scene_names[job_index]:
+                    completed.setdefault(job_index, set()).add(frame)
+    except OSError:
+        pass
+    return completed
+
+
+def get_job_frame_range(job, scene):
+    """Resolve the effective frame range of a manifest job.
+
+    Args:
+        job (dict): Job entry from the manifest.
+        scene (bpy.types.Scene): The scene the job renders.
+
+    Returns:
+        tuple: (frame_start, frame_end, frame_step)
+    """
+    # Use scene defaults when override is disabled
+    if job.get(JOB_OVERRIDE_FRAME_RANGE):
+        frame_start = job[JOB_FRAME_START]
+        frame_end = job[JOB_FRAME_END]
+    else:
+        frame_start = scene.frame_start
+        frame_end = scene.frame_end
+
+    if job.get(JOB_OVERRIDE_FRAME_STEP):
+        frame_step = job.get(JOB_FRAME_STEP, 1)
+    else:
+        frame_step = scene.frame_step
+
+    return frame_start, frame_end, max(1, frame_step)
+
+
+def get_job_frame_list(job, scene):
+    """Get every frame a manifest job covers.
+
+    An explicit frame list (e.g. written when a crashed worker is restarted)
+    takes precedence over the job's frame range.
+
+    Args:
+        job (dict): Job entry from the manifest.
+        scene (bpy.types.Scene): The scene the job renders.
+
+    Returns:
+        list: Frame numbers in render order.
+    """
+    if JOB_FRAME_LIST in job:
+        try:
+            return parse_frame_list(job[JOB_FRAME_LIST])
+        except ValueError:
+            pass
+    frame_start, frame_end, frame_step = get_job_frame_range(job, scene)
+    return list(range(frame_start, frame_end + 1, frame_step))
+
+
+def get_job_output_dir(manifest, job_index, blend_filepath):
+    """Resolve the output directory for a manifest job.
+
+    Mirrors the folder layout used by the worker: job override path first,
+    otherwise ``<base>/<SceneName>`` with a ``_Job<N>`` suffix when the same
+    scene is queued more than once.
+
+    Args:
+        manifest (dict): The loaded render manifest.
+        job_index (int): 0-based index of the job in the manifest.
+        blend_filepath (str): Path of the .blend file being rendered.
+
+    Returns:
+        str: Absolute output directory for the job.
+    """
+    jobs = manifest.get(MANIFEST_JOBS, [])
+    job = jobs[job_index]
+    scene_name = job[JOB_SCENE_NAME]
+
+    # Job Override takes precedence
+    if job.get(JOB_OVERRIDE_OUTPUT) and job.get(JOB_OUTPUT_PATH):
+        output_dir = job[JOB_OUTPUT_PATH]
+        if output_dir.startswith("//"):
+            output_dir = bpy.path.abspath(output_dir)
+        return output_dir
+
+    # Determine Base Path
+    if manifest.get(MANIFEST_OUTPUT_LOCATION, "BLEND") == 'CUSTOM':
+        base_path = manifest.get(MANIFEST_GLOBAL_OUTPUT, "//")
+    else:
+        # Use Blend File Name + Suffix
+        blend_name = os.path.splitext(os.path.basename(blend_filepath))[0] or "Untitled"
+        base_path = f"//{blend_name}_RenderCue"
+
+    if base_path.startswith("//"):
+        base_path = bpy.path.abspath(base_path)
+
+    # Always Separate Folders, suffix duplicates with the job number
+    folder_name = scene_name
+    scene_usage = sum(1 for j in jobs[:job_index + 1] if j.get(JOB_SCENE_NAME) == scene_name)
+    if scene_usage > 1:
+        folder_name = f"{scene_name}_Job{job_index + 1}"
+
+    return os.path.join(base_path, folder_name)
+
+
+# --- Override State ---
+
+class OverrideState:
+    """Applies job overrides to RNA properties and puts the originals back.
+
+    Overrides for a job are staged with ``set`` and written by ``apply``, which
+    works on the delta to the previous job: properties the previous job changed
+    but this one doesn't are restored, and values that already match are not
+    written again (every write tags the depsgraph). ``restore`` undoes all of
+    it once the batch is done.
+    """
+
+    _KEEP = object()
+
+    def __init__(self):
+        self._original = {}
+        self._staged = {}
+
+    @staticmethod
+    def _key(owner, attr):
+        return (owner.as_pointer(), attr)
+
+    def original(self, owner, attr):
+        """Get the value a property had before any override touched it."""
+        entry = self._original.get(self._key(owner, attr))
+        return entry[2] if entry else getattr(owner, attr)
+
+    def set(self, owner, attr, value):
+        """Stage an override for the next ``apply``."""
+        self._staged[self._key(owner, attr)] = (owner, attr, value)
+
+    def keep(self, owner, attr):
+        """Stage a property that is changed directly, so ``restore`` resets it."""
+        self._staged[self._key(owner, attr)] = (owner, attr, self._KEEP)
+
+    def apply(self):
+        """Write the staged overrides as a delta to the current state.
+
+        Returns:
+            list: ``(owner, attr, value, error)`` for every write that failed.
+        """
+        failed = []
+        for key in reversed(list(self._original)):
+            if key not in self._staged:
+                failed.extend(self._write(*self._original.pop(key)))
         
-    except Exception as e:
-        logger.error(f"Error during renumbering: {e}")
-        # Attempt rollback? Complex. For now just log.
+        for key, (owner, attr, value) in self._staged.items():
+            if key not in self._original:
+                self._original[key] = (owner, attr, getattr(owner, attr))
+            if value is not self._KEEP:
+                failed.extend(self._write(owner, attr, value))
+        self._staged = {}
+        return failed
+
+    def restore(self):
+        """Put every overridden property back to its original value.
+
+        Returns:
+            list: ``(owner, attr, value, error)`` for every write that failed.
+        """
+        failed = []
+        for key in reversed(list(self._original)):
+            failed.extend(self._write(*self._original.pop(key)))
+        self._staged = {}
+        return failed
+
+    @staticmethod
+    def _write(owner, attr, value):
+        try:
+            if getattr(owner, attr) != value:
+                setattr(owner, attr, value)
+        except (AttributeError, TypeError, ValueError, ReferenceError) as e:
+            return [(owner, attr, value, e)]
+        return []
+
+
+# --- Preview Encoder ---
+
+class PreviewEncoder:
+    """Writes the preview thumbnails of a worker.
+
+    One encoder lives as long as its worker. Thumbnails go into the preview
+    buffer the UI created for the worker, as raw RGBA pixels. Without one, they
+    are saved as JPEG files (written to a temp file and moved into place) from
+    a scratch image. Frame files are loaded into a reused source image, so no
+    datablocks are created or removed per frame.
+    """
+
+    def __init__(self, filepath, status_path, max_size=PREVIEW_MAX_SIZE):
+        """Initialize the encoder.
+
+        Args:
+            filepath (str): Path of the JPEG preview, used without a preview buffer.
+            status_path (str): Status file of the worker, the preview buffer sits next to it.
+            max_size (int): Longest edge of the thumbnail, in pixels.
+        """
+        self.filepath = filepath
+        self.temp_path = filepath + ".tmp"
+        self.max_size = max_size
+        self.image = None
+        self.source = None
+        try:
+            self.buffer = PreviewBufferWriter(status_path)
+        except OSError:
+            self.buffer = None
+
+    @property
+    def output_path(self):
+        """The file the UI reads the preview from (the buffer or the JPEG)."""
+        return self.buffer.path if self.buffer else self.filepath
+
+    def encode_render_result(self, img):
+        """Write a thumbnail of the Render Result, read straight from its pixels.
+
+        Background renders often don't keep the buffer around, in which case
+        nothing is written.
+
+        Args:
+            img (bpy.types.Image): The Render Result image.
+
+        Returns:
+            bool: True if the thumbnail was written.
+        """
+        pixels = self.read_pixels(img)
+        if pixels is None:
+            return False
+        # Render Result is scene linear
+        self.write(pixels, linear=True)
+        return True
+
+    def encode_file(self, path):
+        """Write a thumbnail of a frame file.
+
+        The file is loaded into the reused source image and scaled down in
+        place before its pixels are read.
+
+        Args:
+            path (str): Path of the frame file.
+
+        Returns:
+            bool: True if the thumbnail was written.
+        """
+        if self.source is None:
+            self.source = bpy.data.images.load(path, check_existing=False)
+            self.source.name = "RenderCue_PreviewSource"
+        else:
+            self.source.filepath_raw = path
+            self.source.reload()
+
+        width, height = self.source.size
+        factor = self.max_size / max(width, height, 1)
+        if factor < 1.0:
+            self.source.scale(max(1, round(width * factor)), max(1, round(height * factor)))
+
+        pixels = self.read_pixels(self.source)
+        if pixels is None:
+            return False
+        # Byte images hold display (sRGB) values already
+        self.write(pixels, linear=self.source.is_float)
+        return True
+
+    @staticmethod
+    def read_pixels(img):
+        """Read the pixels of an image into a (height, width, channels) array.
+
+        Returns:
+            numpy.ndarray or None: The pixels, None if the image has no usable buffer.
+        """
+        width, height = img.size
+        channels = img.channels
+        if width <= 0 or height <= 0 or channels <= 0 or len(img.pixels) != width * height * channels:
+            return None
+        pixels = np.empty(width * height * channels, dtype=np.float32)
+        img.pixels.foreach_get(pixels)
+        return pixels.reshape(height, width, channels)
+
+    def write(self, pixels, linear):
+        """Downsample pixels to the thumbnail size and write the preview file.
+
+        Args:
+            pixels (numpy.ndarray): (height, width, channels) pixels.
+            linear (bool): True for scene linear values, which get an sRGB
+                encode (approximated by a 2.2 gamma).
+        """
+        height, width, channels = pixels.shape
+        step = math.ceil(max(width, height) / self.max_size)
+        if step > 1:
+            if min(width, height) < step:
+                pixels = pixels[::step, ::step]
+            else:
+                # Box filter
+                rows, cols = height // step, width // step
+                pixels = pixels[:rows * step, :cols * step].reshape(rows, step, cols, step, channels).mean(axis=(1, 3))
+        rows, cols = pixels.shape[:2]
+
+        rgba = np.ones((rows, cols, 4), dtype=np.float32)
+        rgba[..., :3] = pixels[..., :3] if channels >= 3 else pixels[..., :1]
+        if linear:
+            rgba[..., :3] = np.clip(rgba[..., :3], 0.0, 1.0) ** (1.0 / 2.2)
+
+        if self.buffer:
+            rgba = (np.clip(rgba, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+            self.buffer.write(cols, rows, rgba.tobytes())
+            return
+
+        image = self.get_image(cols, rows)
+        image.pixels.foreach_set(rgba.ravel())
+        try:
+            image.save()
+            os.replace(self.temp_path, self.filepath)
+        except (OSError, RuntimeError):
+            if os.path.exists(self.temp_path):
+                os.remove(self.temp_path)
+            raise
 
+    def get_image(self, width, height):
+        """Get the scratch thumbnail image, at the given size."""
+        if self.image is None:
+            self.image = bpy.data.images.new("RenderCue_Preview", width, height, alpha=False)
+            self.image.file_format = 'JPEG'
+            self.image.filepath_raw = self.temp_path
+        elif tuple(self.image.size) != (width, height):
+            self.image.scale(width, height)
+        return self.image
+
+    def close(self):
+        """Remove the scratch images and unmap the preview buffer."""
+        if self.buffer:
+            self.buffer.close()
+            self.buffer = None
+        for img in (self.image, self.source):
+            if img is not None:
+                try:
+                    bpy.data.images.remove(img)
+                except ReferenceError:
+                    pass
+        self.image = None
+        self.source = None
+
+
+# --- Worker Control ---
+
+class RenderReleased(Exception):
+    """Raised in the worker to stop a batch that was paused with its memory released."""
+
+
+class WorkerControl:
+    """Commands the UI sends a worker process over its stdin.
+
+    Each line is one JSON object (see ``CONTROL_*``). A thread reads them,
+    updates the pause state and queues the queue edits, both of which the
+    render loop picks up between frames. One instance serves the whole
+    process, so a warm daemon keeps it across batches.
+    """
+
+    def __init__(self):
+        self.queue_commands = queue.Queue()
+        self.pause_mode = None
+        self.resumed = threading.Event()
+        self.resumed.set()
+        self.closed = threading.Event()
+        self.suspended_seconds = 0.0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.read, daemon=True)
+        self.thread.start()
+
+    def read(self):
+        try:
+            for line in sys.stdin:
+                try:
+                    command = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(command, dict):
+                    self.handle(command)
+        except (OSError, ValueError, AttributeError):
+            pass
+        # Without a UI nobody could resume us
+        self.closed.set()
+        self.resume()
+
+    def handle(self, command):
+        """Apply one command."""
+        name = command.get(CONTROL_COMMAND)
+        if name == CONTROL_PAUSE:
+            self.pause_mode = command.get(CONTROL_MODE) or PAUSE_AFTER_FRAME
+            self.resumed.clear()
+        elif name == CONTROL_RESUME:
+            self.resume()
+        elif name == CONTROL_SUSPENDED:
+            # The UI stopped the whole process, account the time as paused
+            with self.lock:
+                self.suspended_seconds += float(command.get(CONTROL_SECONDS) or 0.0)
+        elif name in (CONTROL_CANCEL_JOB, CONTROL_PRIORITIZE_JOB, CONTROL_APPEND_JOBS, CONTROL_DRAIN):
+            self.queue_commands.put(command)
+
+    def resume(self):
+        self.pause_mode = None
+        self.resumed.set()
+
+    def take_queue_commands(self, batch_id):
+        """Get the queue edits received since the last call.
+
+        Args:
+            batch_id (str): Batch the worker renders. Edits meant for another
+                batch (sent to a warm daemon just as its batch ended) are dropped.
+
+        Returns:
+            list: Command dicts, oldest first.
+        """
+        commands = []
+        while True:
+            try:
+                command = self.queue_commands.get_nowait()
+            except queue.Empty:
+                return commands
+            if command.get(CONTROL_BATCH) == batch_id:
+                commands.append(command)
+
+    def take_suspended_seconds(self):
+        """Get the time the process was suspended since the last call."""
+        with self.lock:
+            seconds, self.suspended_seconds = self.suspended_seconds, 0.0
+        return seconds
+
+
+_worker_control = None
+
+def get_worker_control():
+    """Get the control channel of this process, starting it on first use."""
+    global _worker_control
+    if _worker_control is None:
+        _worker_control = WorkerControl()
+    return _worker_control
 
 # --- Background Worker ---
 
@@ -605,13 +1174,97 @@ class BackgroundWorker:
         self.jobs = []
         self.total_jobs = 0
         self.current_job_index = 0
+
+        # Frame Sharding (parallel workers render every Nth frame of each job)
+        self.shard_index = 0
+        self.shard_count = 1
+
+        # Job Pool (parallel workers claim whole jobs from a shared queue)
+        self.job_pool = False
+
+        # Resume Journal (frames already rendered by an interrupted batch)
+        self.journal_path = None
+
+        # Frames that are done without being rendered by this batch
+        # (resumed from the journal or already on disk)
+        self.skipped_frames = 0
+
+        # Animation Render Method (job whose frames render_write reports)
+        self.animation_job_index = None
+        # (frame start, frame step) while frames are saved under sequential numbers
+        self.animation_sequential = None
+        # Output directory while frames are moved or copied out of Blender's render path
+        self.animation_output_dir = None
+        self.animation_staged = False
+
+        # Output Staging (frames render to local scratch, copier threads move them out)
+        self.stager = None
+        self.scratch_dir = None
+        self.copy_times = deque(maxlen=FRAME_TIME_WINDOW)
+        self.job_copy_times = []
+        # Jobs whose frames didn't all reach the output (a failed copy or animation render)
+        self.failed_jobs = set()
+
+        # Disk Space ([frames, bytes] written per job, pauses for a full output drive)
+        self.output_sizes = {}
+        self.output_bytes = 0
+        self.disk_pauses = 0
+
+        # Skip Existing (zero-byte placeholder claimed for the frame in flight)
+        self.claimed_frame_path = None
+        self.last_claim_heartbeat = 0
+        # Claimed frames rendered to scratch whose copy hasn't landed yet
+        self.staged_claims = set()
+
+        # Job overrides currently applied to the scenes
+        self.overrides = OverrideState()
+
+        # Watchdog (frame in flight and recent frame times, for stall detection)
+        self.frame_started_at = None
+        self.frame_times = deque(maxlen=FRAME_TIME_WINDOW)
+        self.last_status = None
+        self.last_status_write = 0
         
+        # Status Channel (events on stdout instead of rewriting the status file)
+        self.event_stream = False
+        self.shared_memory = False
+        self.status_block = None
+        
+        # Status Coalescing (updates are flushed at a fixed cadence, with the jobs they touched)
+        self.status_seq = 0
+        self.status_pending = None
+        self.dirty_jobs = set()
+
+        # Scene Grouping (first-frame sync time per job group, and time saved by reusing it)
+        self.sync_pattern = re.compile(RENDER_STATS_SAMPLING_PATTERN)
+        self.frame_synced = True
+        self.synced_jobs = set()
+        self.group_sync_times = {}
+        self.sync_saved = 0.0
+
         # Progress Tracking
+        self.current_frame = None
         self.start_time = 0
         self.total_frames_to_render = 0
         self.finished_frames_count = 0
         self.last_preview_path = ""
+        # Preview Policy (frames and time since the last preview, jobs that got one)
+        self.frames_since_preview = 0
+        self.last_preview_time = 0.0
+        self.previewed_jobs = set()
+        # Reused for every preview (created with the first one)
+        self.preview_encoder = None
         self.total_paused_duration = 0
+        # Paused time of the workers this one took over from (restarts, released pauses)
+        self.paused_before = 0.0
+        self.released = False
+        
+        # Live Queue Edits
+        self.batch_id = None
+        self.pending_jobs = []
+        self.cancelled_jobs = set()
+        self.job_interrupted = False
+        self.draining = False
         
         # Job Status Tracking
         self.job_statuses = []
@@ -630,26 +1283,51 @@ class BackgroundWorker:
                 self.manifest = json.load(f)
             self.jobs = self.manifest.get(MANIFEST_JOBS, [])
             self.total_jobs = len(self.jobs)
+            self.shard_index = self.manifest.get(MANIFEST_SHARD_INDEX, 0)
+            self.shard_count = max(1, self.manifest.get(MANIFEST_SHARD_COUNT, 1))
+            self.job_pool = self.manifest.get(MANIFEST_JOB_POOL, False)
+            self.journal_path = self.manifest.get(MANIFEST_JOURNAL_PATH)
+            self.event_stream = self.manifest.get(MANIFEST_STATUS_CHANNEL) == 'EVENTS'
+            self.paused_before = self.manifest.get(MANIFEST_PAUSED_DURATION, 0.0)
+            self.batch_id = self.manifest.get(MANIFEST_BATCH_ID)
+            self.shared_memory = self.manifest.get(MANIFEST_STATUS_CHANNEL) == 'SHARED_MEMORY'
             
+            # Scene grouping only changes the order, indices stay queue indices
+            self.job_order = list(range(self.total_jobs))
+            job_order = self.manifest.get(MANIFEST_JOB_ORDER)
+            if job_order and sorted(job_order) == self.job_order:
+                self.job_order = job_order
+
             # Initialize tracking lists
             self.job_statuses = ['PENDING'] * self.total_jobs
             self.job_progress = [{'done': 0, 'total': 0} for _ in range(self.total_jobs)]
             self.job_timings = [{'start': 0.0, 'end': 0.0} for _ in range(self.total_jobs)]
             
+            # Jobs cancelled while an earlier worker of this batch was rendering
+            self.cancelled_jobs = {i for i, job in enumerate(self.jobs) if job.get(JOB_CANCELLED)}
+            for i in self.cancelled_jobs:
+                self.job_statuses[i] = 'CANCELLED'
+            
             return True
         except (OSError, json.JSONDecodeError) as e:
             if self.logger:
                 self.logger.error(f"Failed to load manifest: {e}")
             return False
 
-    def log_status(self, message, etr=DEFAULT_ETR, finished=False, error=None, **kwargs):
-        """Write current status to the status JSON file.
+    def log_status(self, message, etr=DEFAULT_ETR, finished=False, error=None, event=None, flush=False, **kwargs):
+        """Report the current status to the UI.
+
+        Updates are coalesced: routine progress is written at most every
+        ``STATUS_FLUSH_SECONDS``, while the batch, job state changes, frame
+        starts, errors and completion go out right away.
 
         Args:
             message (str): Status message to display in UI.
             etr (str): Estimated time remaining string.
             finished (bool): Whether the entire batch is complete.
             error (str, optional): Error message if an error occurred.
+            event (str, optional): Event type to emit (defaults to progress or error).
+            flush (bool): Write right away, e.g. before blocking.
             **kwargs: Additional status fields (e.g., last_frame).
         """
         # Update last preview path if provided
@@ -667,11 +1345,90 @@ class BackgroundWorker:
             STATUS_FINISHED_FRAMES: self.finished_frames_count,
             STATUS_TOTAL_FRAMES: self.total_frames_to_render,
             STATUS_LAST_FRAME: self.last_preview_path,
-            STATUS_PAUSED_DURATION: self.total_paused_duration,
+            STATUS_PAUSED_DURATION: self.paused_before + self.total_paused_duration,
+            STATUS_RELEASED: self.released,
             STATUS_JOB_STATUSES: self.job_statuses,
             STATUS_JOB_PROGRESS: self.job_progress,
-            STATUS_JOB_TIMINGS: self.job_timings
+            STATUS_JOB_TIMINGS: self.job_timings,
+            STATUS_SKIPPED_FRAMES: self.skipped_frames,
+            # Frame in flight, so the UI knows which frame took a crashed worker down
+            STATUS_CURRENT_FRAME: [self.current_job_index, self.current_frame] if self.current_frame is not None else None,
+            STATUS_FRAME_STARTED: self.frame_started_at if self.current_frame is not None else None,
+            STATUS_MEDIAN_FRAME_TIME: statistics.median(self.frame_times) if self.frame_times else None,
+            STATUS_SYNC_SAVED: self.sync_saved,
+            STATUS_COPY_TIME: statistics.median(self.copy_times) if self.copy_times else None,
+            STATUS_OUTPUT_BYTES: self.output_bytes,
+            STATUS_PROJECTED_BYTES: self.output_bytes + sum(self.get_remaining_bytes(i) for i in self.output_sizes),
+            STATUS_DISK_PAUSES: self.disk_pauses
         }
+        self.last_status = data
+        if 0 <= self.current_job_index < self.total_jobs:
+            self.dirty_jobs.add(self.current_job_index)
+        
+        event = event or (EVENT_ERROR if error else EVENT_PROGRESS)
+        self.status_pending = event
+        urgent = flush or finished or event in (EVENT_BATCH, EVENT_FRAME_STARTED, EVENT_ERROR, EVENT_JOB_STATE)
+        if urgent or time.time() - self.last_status_write >= STATUS_FLUSH_SECONDS:
+            self.flush_status()
+
+    def flush_status(self):
+        """Write the pending status update, with every job it touched."""
+        if self.status_pending is None or self.last_status is None:
+            return
+        self.status_seq += 1
+        self.last_status[STATUS_SEQ] = self.status_seq
+        if self.event_stream:
+            self.emit_event(self.status_pending, self.last_status, self.dirty_jobs)
+        elif self.status_block:
+            self.write_block(self.status_pending, self.last_status, self.dirty_jobs)
+        else:
+            self.write_status(self.last_status)
+        self.status_pending = None
+        self.dirty_jobs = set()
+
+    def emit_event(self, event_type, data, job_indices=()):
+        """Write one event line to stdout for the UI's event reader.
+
+        Events carry the scalar status fields and the state of the jobs that
+        changed since the previous event, so the per-job arrays aren't resent
+        with every update. Only the batch event holds the full status.
+
+        Args:
+            event_type (str): One of the ``EVENT_*`` types.
+            data (dict): Status fields as built by ``log_status``.
+            job_indices (iterable): Jobs whose state to include.
+        """
+        if event_type == EVENT_BATCH:
+            fields = data
+        else:
+            fields = {key: value for key, value in data.items()
+                      if key not in (STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS)}
+        payload = {EVENT_TYPE: event_type, EVENT_STATUS: fields}
+        if job_indices and event_type != EVENT_BATCH:
+            payload[EVENT_JOBS] = {
+                i: [self.job_statuses[i], self.job_progress[i], self.job_timings[i]]
+                for i in job_indices
+            }
+        
+        self.last_status_write = time.time()
+        try:
+            sys.stdout.write(EVENT_LINE_PREFIX + json.dumps(payload) + "\n")
+            sys.stdout.flush()
+        except (OSError, ValueError):
+            # UI went away, the pause/stop signals still work
+            pass
+
+    def set_job_status(self, job_index, status):
+        """Set the status of a job and report it right away."""
+        self.job_statuses[job_index] = status
+        self.dirty_jobs.add(job_index)
+        if self.last_status is not None:
+            self.status_pending = EVENT_JOB_STATE
+            self.flush_status()
+
+    def write_status(self, data):
+        """Write a status dict to the status JSON file."""
+        self.last_status_write = time.time()
         try:
             with open(self.status_path, 'w') as f:
                 json.dump(data, f)
@@ -679,41 +1436,607 @@ class BackgroundWorker:
             if self.logger:
                 self.logger.error(f"Failed to write status: {e}")
 
-    def calculate_total_frames(self):
-        """Calculate total frames to be rendered across all jobs."""
-        self.total_frames_to_render = 0
-        for job in self.jobs:
-            # Note: This assumes scene data is available or passed in manifest.
-            # Since we only have scene names in manifest, we rely on the blend file.
-            scene_name = job.get(JOB_SCENE_NAME)
-            if scene_name and scene_name in bpy.data.scenes:
-                scene = bpy.data.scenes[scene_name]
-                
-                # Use scene defaults when override is disabled
-                if job.get(JOB_OVERRIDE_FRAME_RANGE):
-                    start = job[JOB_FRAME_START]
-                    end = job[JOB_FRAME_END]
-                else:
-                    start = scene.frame_start
-                    end = scene.frame_end
-                
-                # Determine step
-                step = scene.frame_step
-                if job.get(JOB_OVERRIDE_FRAME_STEP):
-                    step = job.get(JOB_FRAME_STEP, 1)
-                
-                # Calculate frame count
-                if start > end:
-                    job_frames = 0
-                else:
-                    job_frames = (end - start) // step + 1
-                
-                self.total_frames_to_render += job_frames
-                
-                # Update total frames for this job in tracking
-                idx = self.jobs.index(job)
-                if idx < len(self.job_progress):
-                    self.job_progress[idx]['total'] = job_frames
+    def write_block(self, event_type, data, job_indices=()):
+        """Update the shared-memory status block in place."""
+        self.last_status_write = time.time()
+        try:
+            self.status_block.write(data, event_type, job_indices,
+                                    self.job_statuses, self.job_progress, self.job_timings)
+        except (ValueError, struct.error) as e:
+            if self.logger:
+                self.logger.error(f"Failed to write status block: {e}")
+
+    def heartbeat(self):
+        """Rewrite the last status with a fresh timestamp.
+
+        Called from render_stats while a frame renders, so the UI watchdog can
+        tell a long frame from a hung one.
+        """
+        now = time.time()
+        if self.status_pending is not None and now - self.last_status_write >= STATUS_FLUSH_SECONDS:
+            self.last_status[STATUS_TIMESTAMP] = now
+            self.flush_status()
+            return
+        if self.last_status is None or now - self.last_status_write < STATUS_HEARTBEAT_SECONDS:
+            return
+        self.last_status[STATUS_TIMESTAMP] = now
+        if self.event_stream:
+            self.emit_event(EVENT_HEARTBEAT, {STATUS_TIMESTAMP: now})
+        elif self.status_block:
+            self.write_block(EVENT_HEARTBEAT, self.last_status)
+        else:
+            self.write_status(self.last_status)
+
+    def start_frame(self, frame):
+        """Mark a frame as in flight for status reports and frame timing."""
+        self.current_frame = frame
+        self.frame_started_at = time.time()
+        self.frame_synced = False
+
+    def record_sync_time(self):
+        """Measure scene sync of a job's first frame and credit reuse within its group."""
+        self.frame_synced = True
+        job_index = self.current_job_index
+        if job_index in self.synced_jobs or self.frame_started_at is None:
+            return
+        self.synced_jobs.add(job_index)
+        
+        sync_time = time.time() - self.frame_started_at
+        group = self.jobs[job_index].get(JOB_SCENE_GROUP)
+        if group is None:
+            return
+        if group not in self.group_sync_times:
+            self.group_sync_times[group] = sync_time
+            return
+        saved = max(0.0, self.group_sync_times[group] - sync_time)
+        self.sync_saved += saved
+        self.logger.info(f"Job {job_index + 1}: scene sync took {sync_time:.1f}s, {saved:.1f}s saved by scene grouping")
+
+    def calculate_total_frames(self):
+        """Calculate total frames to be rendered across all jobs."""
+        self.total_frames_to_render = 0
+        for idx in range(self.total_jobs):
+            if idx not in self.cancelled_jobs:
+                self.total_frames_to_render += self.count_job_frames(idx)
+
+    def count_job_frames(self, idx):
+        """Count the frames of a job and record them in its progress.
+
+        Args:
+            idx (int): Index of the job.
+
+        Returns:
+            int: Frames the job accounts for in this worker (0 if its scene is missing).
+        """
+        job = self.jobs[idx]
+        # Note: This assumes scene data is available or passed in manifest.
+        # Since we only have scene names in manifest, we rely on the blend file.
+        scene_name = job.get(JOB_SCENE_NAME)
+        if not scene_name or scene_name not in bpy.data.scenes:
+            return 0
+        scene = bpy.data.scenes[scene_name]
+        job_frames = len(self.get_job_frames(job, scene))
+
+        # Frames finished before a resume count towards the job, but only
+        # once across shards (pool workers seed them when claiming the job)
+        resumed = len(self.get_completed_frames(job, scene))
+        if self.job_pool:
+            job_frames += resumed
+        elif self.shard_index == 0:
+            job_frames += resumed
+            self.count_skipped_frames(idx, resumed)
+
+        # Update total frames for this job in tracking
+        if idx < len(self.job_progress):
+            self.job_progress[idx]['total'] = job_frames
+        return job_frames
+
+    def apply_queue_commands(self):
+        """Apply the queue edits the UI sent since the last call.
+
+        Jobs can be cancelled (a job that is rendering stops after its current
+        frame), moved to the front of the queue or appended, and the batch can
+        be drained, which stops it once the current frame is done.
+        """
+        for command in get_worker_control().take_queue_commands(self.batch_id):
+            name = command.get(CONTROL_COMMAND)
+            job_index = command.get(CONTROL_JOB)
+            if name == CONTROL_DRAIN:
+                if not self.draining:
+                    self.logger.info("Draining: stopping after the current frame")
+                self.draining = True
+            elif name == CONTROL_APPEND_JOBS:
+                self.append_jobs(job_index, command.get(CONTROL_JOBS) or [])
+            elif not isinstance(job_index, int) or not 0 <= job_index < self.total_jobs:
+                self.logger.warning(f"Ignoring {name} for unknown job {job_index}")
+            elif name == CONTROL_CANCEL_JOB:
+                self.cancel_job(job_index)
+            elif name == CONTROL_PRIORITIZE_JOB and job_index in self.pending_jobs:
+                self.pending_jobs.remove(job_index)
+                self.pending_jobs.insert(0, job_index)
+                self.logger.info(f"Job {job_index + 1} moved to the front of the queue")
+
+    def cancel_job(self, job_index):
+        """Cancel a job. A pending job is dropped, a rendering one stops after its frame."""
+        if job_index in self.cancelled_jobs:
+            return
+        self.cancelled_jobs.add(job_index)
+        self.logger.info(f"Job {job_index + 1} cancelled")
+        if job_index in self.pending_jobs:
+            self.pending_jobs.remove(job_index)
+            self.drop_remaining_frames(job_index)
+            self.set_job_status(job_index, 'CANCELLED')
+
+    def drop_remaining_frames(self, job_index):
+        """Take the frames a job won't render out of the batch total."""
+        progress = self.job_progress[job_index]
+        self.total_frames_to_render -= max(0, progress['total'] - progress['done'])
+
+    def append_jobs(self, first_index, jobs):
+        """Add jobs queued in the UI while the batch renders.
+
+        Args:
+            first_index (int): Queue index of the first job, which must follow
+                the last job of the manifest (anything else is a stale edit).
+            jobs (list): Manifest entries of the jobs.
+        """
+        if first_index != self.total_jobs:
+            self.logger.warning(f"Ignoring appended jobs starting at {first_index}, the queue has {self.total_jobs}")
+            return
+        for job in jobs:
+            idx = self.total_jobs
+            self.jobs.append(job)
+            self.total_jobs += 1
+            self.job_statuses.append('PENDING')
+            self.job_progress.append({'done': 0, 'total': 0})
+            self.job_timings.append({'start': 0.0, 'end': 0.0})
+            self.pending_jobs.append(idx)
+            self.total_frames_to_render += self.count_job_frames(idx)
+        self.logger.info(f"Appended {len(jobs)} jobs to the batch")
+        # The job arrays grew, send them in full
+        self.log_status(f"Added {len(jobs)} jobs to the queue", etr="Calculating...", event=EVENT_BATCH)
+
+    def is_job_interrupted(self, job_index):
+        """Check whether a job has to stop before its next frame."""
+        return self.draining or job_index in self.cancelled_jobs
+
+    def get_job_frames(self, job, scene):
+        """Get the frames this worker renders for a job.
+
+        Frames recorded as completed in the resume journal are left out. When
+        the manifest is a shard of a parallel render, every worker takes every
+        Nth remaining frame of the job.
+
+        Args:
+            job (dict): Job entry from the manifest.
+            scene (bpy.types.Scene): The scene the job renders.
+
+        Returns:
+            list: Frame numbers in render order.
+        """
+        completed = self.get_completed_frames(job, scene)
+        frames = [f for f in get_job_frame_list(job, scene) if f not in completed]
+        return frames[self.shard_index::self.shard_count]
+
+    def get_completed_frames(self, job, scene):
+        """Get the frames of a job that a previous, interrupted batch finished.
+
+        Args:
+            job (dict): Job entry from the manifest.
+            scene (bpy.types.Scene): The scene the job renders.
+
+        Returns:
+            set: Completed frame numbers among the job's current frames.
+        """
+        frame_list = job.get(JOB_COMPLETED_FRAMES)
+        if not frame_list:
+            return set()
+        try:
+            completed = set(parse_frame_list(frame_list))
+        except ValueError:
+            return set()
+        return completed.intersection(get_job_frame_list(job, scene))
+
+    def count_skipped_frames(self, job_index, count):
+        """Count frames that are done without being rendered by this batch."""
+        self.job_progress[job_index]['done'] += count
+        self.finished_frames_count += count
+        self.skipped_frames += count
+        self.dirty_jobs.add(job_index)
+
+    def claim_frame(self, final_path):
+        """Claim an output frame so other workers and RenderCue instances skip it.
+
+        A claim is a zero-byte placeholder at the final path, created with
+        O_EXCL so only one renderer wins, even on a shared network folder.
+        Placeholders are kept fresh while rendering; one that hasn't been
+        touched for a long time belongs to a dead renderer and is taken over.
+
+        Args:
+            final_path (str): Where the frame will be written.
+
+        Returns:
+            str: 'RENDER' if this worker should render the frame, 'EXISTS' if a
+            complete file is already there, 'CLAIMED' if another renderer has it.
+        """
+        try:
+            fd = os.open(final_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.close(fd)
+            return 'RENDER'
+        except FileExistsError:
+            pass
+
+        try:
+            stat = os.stat(final_path)
+        except OSError:
+            # Vanished between the two calls, let the next pass pick it up
+            return 'CLAIMED'
+
+        if stat.st_size > 0:
+            return 'EXISTS'
+        if time.time() - stat.st_mtime < FRAME_CLAIM_STALE_SECONDS:
+            return 'CLAIMED'
+
+        self.logger.warning(f"Taking over stale claim on {final_path}")
+        try:
+            os.utime(final_path)
+        except OSError:
+            return 'CLAIMED'
+        return 'RENDER'
+
+    def release_frame_claim(self, final_path):
+        """Remove our placeholder after a failed render so the frame can be retried."""
+        try:
+            if os.path.getsize(final_path) == 0:
+                os.remove(final_path)
+        except OSError:
+            pass
+
+    def on_render_stats(self, stats):
+        """Handler called during rendering, keeps the status and frame claim fresh."""
+        if not self.frame_synced and self.sync_pattern.search(stats):
+            self.record_sync_time()
+        self.heartbeat()
+        self.refresh_claims()
+
+    def refresh_claims(self):
+        """Keep our placeholders fresh, so other renderers don't take them over as stale.
+
+        Covers the frame being rendered and staged frames until their copy
+        replaced the placeholder.
+        """
+        if not self.claimed_frame_path and not self.staged_claims:
+            return
+        now = time.time()
+        if now - self.last_claim_heartbeat < FRAME_CLAIM_HEARTBEAT_SECONDS:
+            return
+        self.last_claim_heartbeat = now
+        paths = list(self.staged_claims)
+        if self.claimed_frame_path:
+            paths.append(self.claimed_frame_path)
+        for path in paths:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    def on_render_pre(self, scene, depsgraph=None):
+        """Handler called before each frame of an animation render starts."""
+        if self.animation_job_index is None:
+            return
+        self.start_frame(scene.frame_current)
+        self.log_status(f"Rendering {scene.name} (Frame {scene.frame_current})", etr="Calculating...", event=EVENT_FRAME_STARTED)
+
+    def on_render_write(self, scene, depsgraph=None):
+        """Handler called after a frame of an animation render was written to disk."""
+        if self.animation_job_index is None:
+            return
+        path = scene.render.frame_path(frame=scene.frame_current)
+        if not os.path.exists(path):
+            return
+        # Not written through a temp file, so check it before it counts as done
+        problem = check_frame(path)
+        if problem:
+            self.logger.error(f"Frame {scene.frame_current} written {problem}: {path}")
+            return
+        if self.animation_output_dir:
+            # Blender names the file by its frame, give it its output name right away
+            number = scene.frame_current
+            if self.animation_sequential:
+                number = get_sequential_frame(number, *self.animation_sequential)
+            target = os.path.join(self.animation_output_dir, f"{scene.name}_{number:04d}{os.path.splitext(path)[1]}")
+            if self.animation_staged:
+                # Journaled once the copy arrived
+                self.stager.submit(path, target, (self.animation_job_index, scene, scene.frame_current))
+                self.collect_copies()
+                return
+            try:
+                os.replace(path, target)
+                path = target
+            except OSError as e:
+                self.logger.error(f"Cannot rename frame {scene.frame_current} to {target}: {e}")
+        self.frame_written(self.animation_job_index, scene, scene.frame_current, path)
+
+    def render_animation(self, job_index, scene, frames, output_dir, sequential=None):
+        """Render a job's frames with Blender's animation render.
+
+        Frames are grouped into runs with a constant step and rendered with one
+        ``render(animation=True)`` call per run (chunked, so pause still takes
+        effect every now and then). Progress comes from the render_post and
+        render_write handlers, which journal a frame only once its file checks
+        out. The scene's frame range is restored afterwards.
+
+        Blender writes the frames itself, so there are no atomic writes or
+        frame claims: only used for jobs no other worker renders into and
+        without skip existing, where a frame cut short by a crash is simply
+        rendered again on resume.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+            scene (bpy.types.Scene): The scene to render.
+            frames (list): Frames to render, in order.
+            output_dir (str): Output directory of the job.
+            sequential (tuple, optional): (frame start, frame step) of the job
+                when frames are saved under sequential numbers.
+
+        Returns:
+            bool: True if every run rendered without an error.
+        """
+        render = scene.render
+        # Movies are one growing file, only frame files are staged
+        staged = self.use_staging(output_dir) and not render.is_movie_format
+
+        original = (scene.frame_start, scene.frame_end, scene.frame_step,
+                    render.filepath, render.use_overwrite, render.use_placeholder)
+
+        # Frames left by an interrupted run weren't journaled, they are rendered again
+        render.use_overwrite = True
+        render.use_placeholder = False
+        if staged:
+            # Prefixed by job, a frame whose copy failed stays put until the next batch
+            render.filepath = os.path.join(self.scratch_dir, f"{job_index}_{scene.name}_####")
+        else:
+            render.filepath = os.path.join(output_dir, f"{scene.name}_####")
+
+        success = True
+        self.animation_job_index = job_index
+        self.animation_sequential = sequential
+        self.animation_output_dir = output_dir if sequential or staged else None
+        self.animation_staged = staged
+        try:
+            for start, end, step in split_frame_runs(frames, ANIMATION_CHUNK_FRAMES):
+                self.check_pause()
+                # The whole run is written before the next chance to pause
+                self.check_disk_space(job_index, output_dir, (end - start) // step + 1)
+                self.apply_queue_commands()
+                if self.is_job_interrupted(job_index):
+                    self.job_interrupted = True
+                    break
+
+                # Start first, Blender clamps frame_end to frame_start
+                scene.frame_start = start
+                scene.frame_end = end
+                scene.frame_step = step
+
+                self.log_status(f"Rendering {scene.name} (Frames {start}-{end})", etr="Calculating...")
+                self.logger.info(f"Rendering frames {start}-{end} (step {step}) to {output_dir}")
+                try:
+                    bpy.ops.render.render(animation=True)
+                except Exception as e:
+                    msg = f"Error rendering {scene.name} frames {start}-{end}: {str(e)}"
+                    self.logger.error(msg)
+                    self.log_status(msg, error=str(e))
+                    success = False
+                    continue
+        finally:
+            self.animation_job_index = None
+            self.animation_sequential = None
+            self.animation_output_dir = None
+            self.animation_staged = False
+            self.current_frame = None
+            (scene.frame_start, scene.frame_end, scene.frame_step,
+             render.filepath, render.use_overwrite, render.use_placeholder) = original
+
+        return success
+
+    def frame_written(self, job_index, scene, frame, path):
+        """Account a frame that reached its output and record it in the resume journal.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+            scene (bpy.types.Scene): The scene that was rendered.
+            frame (int): The frame number.
+            path (str): The written output file.
+        """
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            size = 0
+        sample = self.output_sizes.setdefault(job_index, [0, 0])
+        sample[0] += 1
+        sample[1] += size
+        self.output_bytes += size
+        if sample[0] == DISK_SAMPLE_FRAMES:
+            self.report_projection(job_index, os.path.dirname(path))
+        self.journal_frame(job_index, scene, frame, path)
+
+    def get_remaining_bytes(self, job_index, frames=None):
+        """Project the bytes a job still writes from the average size of its frames so far.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+            frames (int, optional): Frames to project, the job's unfinished frames by default.
+        """
+        count, size = self.output_sizes.get(job_index, (0, 0))
+        if not count:
+            return 0
+        if frames is None:
+            progress = self.job_progress[job_index]
+            frames = max(0, progress['total'] - progress['done'])
+        return int(size / count * frames)
+
+    def report_projection(self, job_index, output_dir):
+        """Log the projected output of a job, and warn if its drive fills up before the job ends."""
+        count, size = self.output_sizes[job_index]
+        remaining = self.get_remaining_bytes(job_index)
+        try:
+            free = get_free_bytes(output_dir)
+        except OSError:
+            return
+        drive = get_mount_point(output_dir)
+        self.logger.info(
+            f"Job {job_index + 1}: about {format_bytes(size / count)} per frame, "
+            f"{format_bytes(remaining)} still to write, {format_bytes(free)} free on {drive}")
+        if remaining + DISK_MIN_FREE_BYTES > free:
+            msg = f"{drive} fills up before job {job_index + 1} ends ({format_bytes(free)} free, {format_bytes(remaining)} needed)"
+            self.logger.warning(f"{msg}, rendering pauses when it runs out")
+            self.log_status(msg)
+
+    def check_disk_space(self, job_index, output_dir, frames_ahead=1):
+        """Pause before the output drive runs out of space.
+
+        The worker pauses itself and counts the pause in its status, so the
+        UI pauses the other workers too. Once resumed, the space is checked again.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+            output_dir (str): Output directory of the job.
+            frames_ahead (int): Frames about to be written.
+        """
+        control = get_worker_control()
+        # Without a UI nobody could resume us
+        while not control.closed.is_set():
+            try:
+                free = get_free_bytes(output_dir)
+            except OSError:
+                return
+            # Frames still being copied out need their room too
+            pending = self.stager.pending if self.stager else 0
+            needed = DISK_MIN_FREE_BYTES + self.get_remaining_bytes(job_index, frames_ahead + pending)
+            if free >= needed:
+                return
+            self.disk_pauses += 1
+            msg = f"Paused: {format_bytes(free)} left on {get_mount_point(output_dir)}"
+            self.logger.warning(f"{msg}, the next frames need {format_bytes(needed)}")
+            control.handle({CONTROL_COMMAND: CONTROL_PAUSE, CONTROL_MODE: PAUSE_AFTER_FRAME})
+            self.check_pause(msg)
+
+    def journal_frame(self, job_index, scene, frame, path):
+        """Record a finished frame in the resume journal.
+
+        Every entry is flushed and fsync'd, so the journal never claims a frame
+        that isn't on disk even if the machine loses power right after.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+            scene (bpy.types.Scene): The scene that was rendered.
+            frame (int): The frame number.
+            path (str): The written output file.
+        """
+        if not self.journal_path:
+            return
+        entry = json.dumps({'job': job_index, 'scene': scene.name, 'frame': frame, 'path': path})
+        try:
+            with open(self.journal_path, 'a') as f:
+                f.write(entry + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            self.logger.error(f"Failed to write resume journal: {e}")
+
+    def start_staging(self):
+        """Create the scratch folder and copier threads if the manifest asks for staging."""
+        if not self.manifest.get(MANIFEST_STAGING, False):
+            return
+        try:
+            self.scratch_dir = get_scratch_dir(self.manifest.get(MANIFEST_STAGING_DIR, ""))
+        except OSError as e:
+            self.logger.error(f"Cannot create the scratch folder, rendering straight to the output: {e}")
+            return
+        self.stager = OutputStager(self.manifest.get(MANIFEST_STAGING_THREADS, 2),
+                                   self.manifest.get(MANIFEST_STAGING_RETRIES, 3))
+        self.logger.info(f"Staging frames in {self.scratch_dir}")
+
+    def stop_staging(self):
+        """Let the copies in flight finish, then stop the copier threads."""
+        if not self.stager:
+            return
+        self.collect_copies(wait=True)
+        self.stager.close()
+        self.stager = None
+        try:
+            # Frames whose copy failed are kept for the user
+            os.rmdir(self.scratch_dir)
+        except OSError:
+            pass
+
+    def use_staging(self, output_dir):
+        """Check whether frames for an output directory render to the scratch folder first.
+
+        Output on the scratch drive itself gains nothing from a copy.
+        """
+        return self.stager is not None and not is_same_drive(self.scratch_dir, output_dir)
+
+    def collect_copies(self, wait=False):
+        """Journal the frames the copier threads brought to their output.
+
+        Args:
+            wait (bool): Block until every queued copy is done.
+        """
+        while self.stager and self.stager.pending:
+            self.refresh_claims()
+            if wait:
+                self.log_status(f"Copying {self.stager.pending} frames to the output", etr="Copying...")
+            for copy in self.stager.collect(timeout=1.0 if wait else 0):
+                job_index, scene, frame = copy.tag
+                self.staged_claims.discard(copy.target)
+                if copy.error:
+                    msg = f"Cannot copy frame {frame} to {copy.target}: {copy.error}. It is kept at {copy.source}"
+                    self.logger.error(msg)
+                    self.log_status(msg, error=copy.error)
+                    self.release_frame_claim(copy.target)
+                    self.failed_jobs.add(job_index)
+                    self.set_job_status(job_index, 'FAILED')
+                    continue
+                self.copy_times.append(copy.seconds)
+                self.job_copy_times.append(copy.seconds)
+                retried = f" after {copy.attempts} attempts" if copy.attempts > 1 else ""
+                self.logger.info(f"Copied frame {frame} to {copy.target} in {copy.seconds:.2f}s{retried}")
+                self.frame_written(job_index, scene, frame, copy.target)
+            if not wait:
+                break
+
+    def claim_job(self, job_index):
+        """Claim a job so no other pool worker renders it.
+
+        Claims are lock files created with O_EXCL next to the status file, so
+        exactly one worker wins each job no matter how many are racing for it.
+
+        Args:
+            job_index (int): 0-based index of the job in the manifest.
+
+        Returns:
+            bool: True if this worker should render the job.
+        """
+        if not self.job_pool:
+            return True
+
+        claim_path = os.path.join(
+            os.path.dirname(self.status_path),
+            f"{JOB_CLAIM_FILENAME_PREFIX}{job_index}.lock"
+        )
+        try:
+            fd = os.open(claim_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        except OSError as e:
+            if self.logger:
+                self.logger.error(f"Could not claim job {job_index + 1}: {e}")
+            return False
+
+        with os.fdopen(fd, 'w') as f:
+            f.write(os.path.basename(self.status_path))
+        return True
 
     def on_render_post(self, scene, depsgraph=None):
         """Handler called after each frame render to update progress and save preview.
@@ -724,130 +2047,83 @@ class BackgroundWorker:
         """
 
         self.finished_frames_count += 1
+        self.collect_suspended_time()
+        if self.frame_started_at is not None:
+            self.frame_times.append(time.time() - self.frame_started_at)
         
         # Update job progress
         if self.current_job_index < len(self.job_progress):
             self.job_progress[self.current_job_index]['done'] += 1
         
         # Calculate ETR
-        elapsed = time.time() - self.start_time
+        elapsed = time.time() - self.start_time - self.total_paused_duration
         etr = DEFAULT_ETR
         
-        if self.finished_frames_count > 0 and self.total_frames_to_render > 0:
-            avg_time_per_frame = elapsed / self.finished_frames_count
+        # Skipped frames took no time in this batch
+        rendered_frames = self.finished_frames_count - self.skipped_frames
+        if rendered_frames > 0 and self.total_frames_to_render > 0:
+            avg_time_per_frame = elapsed / rendered_frames
             remaining_frames = self.total_frames_to_render - self.finished_frames_count
-            remaining_seconds = avg_time_per_frame * remaining_frames
-            
-            if remaining_seconds > 0:
-                mins, secs = divmod(int(remaining_seconds), 60)
-                hrs, mins = divmod(mins, 60)
-                if hrs > 0:
-                    etr = f"{hrs:02d}:{mins:02d}:{secs:02d}"
-                else:
-                    etr = f"{mins:02d}:{secs:02d}"
+            etr = format_etr(avg_time_per_frame * remaining_frames)
         
 
         
-        # Save Preview Image
-        # We save a separate JPEG for the preview
-        # Use a fixed filename so Blender can reload it reliably
-        preview_path = os.path.join(os.path.dirname(self.status_path), f"{PREVIEW_FILENAME_PREFIX}latest.jpg")
+        # Save Preview Image, if the preview policy asks for one
+        if not self.should_write_preview():
+            msg = f"Rendering {self.current_job_index + 1}/{self.total_jobs}: {scene.name} (Frame {scene.frame_current})"
+            self.log_status(msg, etr=etr, event=EVENT_FRAME_DONE)
+            return
+
+        # A small JPEG thumbnail, with a fixed filename so Blender can reload it reliably
+        # (one per status file, so parallel workers never share a temp file)
+        status_name = os.path.splitext(os.path.basename(self.status_path))[0]
+        preview_path = os.path.join(os.path.dirname(self.status_path), f"{PREVIEW_FILENAME_PREFIX}{status_name}.jpg")
         
-        # Debug Log
+        # Debug Log (optional, see the Worker Debug Log preference)
         debug_log_path = os.path.join(os.path.dirname(self.status_path), DEBUG_LOG_FILENAME)
+        debug_log = self.manifest.get(MANIFEST_DEBUG_LOG, False)
         def log_debug(msg):
+            if not debug_log:
+                return
             try:
                 with open(debug_log_path, "a") as f:
                     f.write(f"{time.ctime()}: {msg}\n")
             except OSError:
                 pass
 
+        if self.preview_encoder is None:
+            self.preview_encoder = PreviewEncoder(preview_path, self.status_path)
+        preview_path = self.preview_encoder.output_path
+
+        preview_started = time.perf_counter()
         try:
-            preview_generated = False
-            
-            # Strategy 1: Try to save from Render Result buffer
-            if 'Render Result' in bpy.data.images:
-                img = bpy.data.images['Render Result']
-                
-                if img.has_data and img.size[0] > 0 and img.size[1] > 0:
-                    try:
-                        temp_preview_path = preview_path + ".tmp"
-                        
-                        # Create temporary scene with JPEG settings
-                        temp_scene = bpy.data.scenes.new("RenderCue_TempPreview")
-                        try:
-                            temp_scene.render.image_settings.file_format = 'JPEG'
-                            temp_scene.render.image_settings.color_mode = 'RGB'
-                            if hasattr(temp_scene.render.image_settings, 'quality'):
-                                temp_scene.render.image_settings.quality = 90
-                            
-                            img.save_render(filepath=temp_preview_path, scene=temp_scene)
-                            
-                            try:
-                                os.replace(temp_preview_path, preview_path)
-                                log_debug(f"Preview saved from buffer to {preview_path}")
-                                preview_generated = True
-                            except OSError as e:
-                                log_debug(f"Atomic rename failed: {e}")
-                                if os.path.exists(temp_preview_path):
-                                    os.remove(temp_preview_path)
-                        finally:
-                            bpy.data.scenes.remove(temp_scene)
-                    except Exception as e:
-                        log_debug(f"Buffer save failed: {e}. Falling back to disk load.")
+            source = None
             
-            # Strategy 2: Fallback to loading from disk if buffer failed
-            if not preview_generated:
-                log_debug(f"Attempting to load preview from disk: {scene.render.filepath}")
-                
-                filepath = scene.render.filepath
-                loaded_img = None
-                
+            # Strategy 1: Downsample the Render Result buffer
+            img = bpy.data.images.get('Render Result')
+            if img is not None and img.has_data:
                 try:
-                    # Find the actual file (handle extensions)
-                    actual_path = None
-                    if os.path.exists(filepath) and os.path.isfile(filepath):
-                        actual_path = filepath
-                    else:
-                        for ext in ['.png', '.jpg', '.jpeg', '.exr', '.tif', '.tga', '.bmp']:
-                            if os.path.exists(filepath + ext):
-                                actual_path = filepath + ext
-                                break
-                    
-                    if actual_path:
-                        loaded_img = bpy.data.images.load(actual_path)
-                        
-                        # Save this loaded image as our preview thumbnail
-                        # We can use img.save() directly since it's a loaded image, 
-                        # but we want to convert to small JPG.
-                        # So we use the same temp scene trick.
-                        
-                        temp_preview_path = preview_path + ".tmp"
-                        temp_scene = bpy.data.scenes.new("RenderCue_TempPreview_Disk")
-                        try:
-                            temp_scene.render.image_settings.file_format = 'JPEG'
-                            temp_scene.render.image_settings.color_mode = 'RGB'
-                            if hasattr(temp_scene.render.image_settings, 'quality'):
-                                temp_scene.render.image_settings.quality = 90
-                                
-                            loaded_img.save_render(filepath=temp_preview_path, scene=temp_scene)
-                            
-                            os.replace(temp_preview_path, preview_path)
-                            log_debug(f"Preview saved from disk file to {preview_path}")
-                            preview_generated = True
-                            
-                        finally:
-                            bpy.data.scenes.remove(temp_scene)
-                    else:
-                        log_debug(f"Could not find rendered file at {filepath}")
-
+                    if self.preview_encoder.encode_render_result(img):
+                        source = "buffer"
                 except Exception as e:
-                    log_debug(f"Disk load fallback failed: {e}")
-                finally:
-                    if loaded_img:
-                        bpy.data.images.remove(loaded_img)
+                    log_debug(f"Buffer thumbnail failed: {e}. Falling back to disk load.")
+            
+            # Strategy 2: Fallback to the written frame, scaled down
+            if source is None:
+                frame_path = self.find_frame_file(scene)
+                if frame_path is None:
+                    log_debug(f"Could not find rendered file at {scene.render.filepath}")
+                else:
+                    try:
+                        if self.preview_encoder.encode_file(frame_path):
+                            source = "file"
+                    except Exception as e:
+                        log_debug(f"Disk load fallback failed: {e}")
 
-            if not preview_generated:
+            if source is not None:
+                if self.logger:
+                    self.logger.debug(f"Preview from {source} in {(time.perf_counter() - preview_started) * 1000:.1f} ms")
+            else:
                 preview_path = ""
                 
         except Exception as e:
@@ -858,8 +2134,55 @@ class BackgroundWorker:
 
         msg = f"Rendering {self.current_job_index + 1}/{self.total_jobs}: {scene.name} (Frame {scene.frame_current})"
 
-        self.log_status(msg, etr=etr, last_frame=preview_path)
+        self.log_status(msg, etr=etr, event=EVENT_FRAME_DONE, last_frame=preview_path)
+
 
+    def should_write_preview(self):
+        """Check whether the frame that just finished gets a preview.
+
+        Follows the preview policy of the manifest: every frame, every Nth
+        frame, at most one per interval, the first and last frame of each job,
+        or none.
+
+        Returns:
+            bool: True if a preview should be written.
+        """
+        policy = self.manifest.get(MANIFEST_PREVIEW_POLICY, 'EVERY_FRAME')
+        self.frames_since_preview += 1
+        now = time.time()
+        
+        if policy == 'OFF':
+            return False
+        elif policy == 'EVERY_NTH':
+            due = self.frames_since_preview >= max(1, self.manifest.get(MANIFEST_PREVIEW_EVERY, 1))
+        elif policy == 'INTERVAL':
+            due = now - self.last_preview_time >= self.manifest.get(MANIFEST_PREVIEW_INTERVAL, 0.0)
+        elif policy == 'FIRST_LAST':
+            progress = self.job_progress[self.current_job_index] if self.current_job_index < len(self.job_progress) else None
+            due = self.current_job_index not in self.previewed_jobs or (progress is not None and progress['done'] >= progress['total'])
+        else:
+            due = True
+        
+        if due:
+            self.frames_since_preview = 0
+            self.last_preview_time = now
+            self.previewed_jobs.add(self.current_job_index)
+        return due
+
+    def find_frame_file(self, scene):
+        """Find the file the render just wrote for the current frame.
+
+        Args:
+            scene (bpy.types.Scene): The scene that was rendered.
+
+        Returns:
+            str or None: Path of the frame file, None if none was found.
+        """
+        # Handle extensions and animation frame numbers
+        render_path = scene.render.filepath
+        candidates = [render_path] + [render_path + ext for ext in ['.png', '.jpg', '.jpeg', '.exr', '.tif', '.tga', '.bmp']]
+        candidates.append(scene.render.frame_path(frame=scene.frame_current))
+        return next((path for path in candidates if os.path.isfile(path)), None)
 
     def run(self):
         """Main execution loop for the background worker."""
@@ -868,93 +2191,116 @@ class BackgroundWorker:
 
         # Initialize Logger
         self.logger = RenderCueLogger.get_logger(os.path.dirname(self.status_path))
+        # Start reading pause commands before the (possibly long) setup
+        get_worker_control()
         version_compat.log_version_info()
         self.logger.info(f"Starting Background Render: {self.total_jobs} jobs")
+
+        if self.shared_memory:
+            try:
+                self.status_block = StatusBlockWriter(self.status_path)
+            except OSError as e:
+                self.logger.error(f"Cannot open status block, writing the status file instead: {e}")
         
         self.calculate_total_frames()
+        self.start_staging()
         self.start_time = time.time()
+        self.log_status(f"Starting Background Render: {self.total_jobs} jobs", etr="Calculating...", event=EVENT_BATCH)
         
         # Register Handlers (Only render_post for stats, render_pre is handled in loop)
         # Actually, with frame-by-frame, we can just call on_render_post manually or keep it.
         # But we need to be careful about when it's called. 
         # render(write_still=True) triggers handlers.
         bpy.app.handlers.render_post.append(self.on_render_post)
+        bpy.app.handlers.render_stats.append(self.on_render_stats)
+        bpy.app.handlers.render_write.append(self.on_render_write)
+        bpy.app.handlers.render_pre.append(self.on_render_pre)
         
-        global_output = self.manifest.get(MANIFEST_GLOBAL_OUTPUT, "//")
-        output_location = self.manifest.get(MANIFEST_OUTPUT_LOCATION, "BLEND")
-        
-        # Pre-calculate scene usage for unique folder naming
-        scene_usage_count = {}
-        
-        blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+        try:
+            self.render_jobs()
+        except RenderReleased:
+            self.released = True
+        finally:
+            # Rendered frames still reach the output when the batch stops early
+            self.stop_staging()
+            # Leave the scenes as we found them (a warm daemon renders the next batch from them)
+            for owner, attr, value, error in self.overrides.restore():
+                self.logger.warning(f"Cannot restore {attr}: {error}")
+            # A warm daemon runs many batches in one process, never stack handlers
+            if self.on_render_post in bpy.app.handlers.render_post:
+                bpy.app.handlers.render_post.remove(self.on_render_post)
+            if self.on_render_stats in bpy.app.handlers.render_stats:
+                bpy.app.handlers.render_stats.remove(self.on_render_stats)
+            if self.on_render_write in bpy.app.handlers.render_write:
+                bpy.app.handlers.render_write.remove(self.on_render_write)
+            if self.on_render_pre in bpy.app.handlers.render_pre:
+                bpy.app.handlers.render_pre.remove(self.on_render_pre)
+            if self.preview_encoder:
+                self.preview_encoder.close()
+                self.preview_encoder = None
+
+        if self.released:
+            self.log_status("Paused (memory released)", etr="Paused", flush=True)
+            self.logger.info("Background Render released, exiting until resumed")
+        elif self.draining:
+            self.log_status("Stopped after the current frame", finished=True)
+            self.logger.info("Background Render drained")
+        else:
+            self.log_status("All Jobs Completed", finished=True)
+            self.logger.info("Background Render Complete")
+        if self.status_block:
+            self.status_block.close()
+            self.status_block = None
 
-        for i, job in enumerate(self.jobs):
+    def render_jobs(self):
+        """Render every job in the manifest, as edited live from the UI."""
+        self.pending_jobs = [i for i in self.job_order if i not in self.cancelled_jobs]
+        while True:
+            self.apply_queue_commands()
+            if self.draining or not self.pending_jobs:
+                break
+            i = self.pending_jobs.pop(0)
+            job = self.jobs[i]
             self.current_job_index = i
+            self.job_interrupted = False
             scene_name = job[JOB_SCENE_NAME]
             
             if scene_name not in bpy.data.scenes:
                 self.log_status(f"Scene {scene_name} not found", error=True)
                 continue
                 
+            # Another pool worker already took this job
+            if not self.claim_job(i):
+                self.set_job_status(i, None)
+                continue
+
             scene = bpy.data.scenes[scene_name]
-            bpy.context.window.scene = scene
-            
-            # Track scene usage for naming
-            if scene_name not in scene_usage_count:
-                scene_usage_count[scene_name] = 0
-            scene_usage_count[scene_name] += 1
+            if self.job_pool:
+                self.count_skipped_frames(i, len(self.get_completed_frames(job, scene)))
             
             # Update Job Status
-            self.job_statuses[i] = 'RENDERING'
             self.job_timings[i]['start'] = time.time()
+            self.set_job_status(i, 'RENDERING')
             self.log_status(f"Starting Job {i+1}: {scene_name}", etr="Calculating...")
             
             # Apply Overrides
-            frame_start = scene.frame_start
-            frame_end = scene.frame_end
-            
-            if job[JOB_OVERRIDE_FRAME_RANGE]:
-                frame_start = job[JOB_FRAME_START]
-                frame_end = job[JOB_FRAME_END]
+            frame_start, frame_end, frame_step = get_job_frame_range(job, scene)
                 
             # Output Path Logic
-            if job[JOB_OVERRIDE_OUTPUT] and job.get(JOB_OUTPUT_PATH):
-                # Job Override takes precedence
-                output_dir = job[JOB_OUTPUT_PATH]
-            else:
-                # Determine Base Path
-                if output_location == 'CUSTOM':
-                    base_path = global_output
-                else:
-                    # Use Blend File Name + Suffix
-                    if not blend_name:
-                        blend_name = "Untitled"
-                    base_path = f"//{blend_name}_RenderCue"
-                    
-                if base_path.startswith("//"):
-                    base_path = bpy.path.abspath(base_path)
-                    
-                # Always Separate Folders
-                folder_name = scene_name
-                
-                # Handle Duplicates
-                if scene_usage_count[scene_name] > 1:
-                    folder_name = f"{scene_name}_Job{i+1}"
-                
-                output_dir = os.path.join(base_path, folder_name)
+            output_dir = get_job_output_dir(self.manifest, i, bpy.data.filepath)
 
             os.makedirs(output_dir, exist_ok=True)
             
+            # Overrides are staged and applied as a delta against the previous job,
+            # so nothing leaks into the next job and unchanged settings aren't rewritten
+            overrides = self.overrides
+            overrides.set(bpy.context.window, "scene", scene)
+            
             # Apply Render Settings Overrides
+            engine = overrides.original(scene.render, "engine")
             if job.get(JOB_OVERRIDE_ENGINE):
-                target_engine = job[JOB_RENDER_ENGINE]
-                try:
-                    current_engine = scene.render.engine
-                    scene.render.engine = target_engine
-                except (AttributeError, TypeError) as e:
-                    error_msg = f"Error: Cannot set render engine to '{target_engine}': {e}. Using scene default '{current_engine}'"
-                    self.logger.error(error_msg)
-                    self.log_status(error_msg, error=str(e))
+                engine = job[JOB_RENDER_ENGINE]
+                overrides.set(scene.render, "engine", engine)
             
             # Camera Override (Universal)
             if job.get(JOB_OVERRIDE_CAMERA, False):
@@ -962,163 +2308,403 @@ class BackgroundWorker:
                 if camera_name and camera_name in bpy.data.objects:
                     camera_obj = bpy.data.objects[camera_name]
                     if camera_obj and camera_obj.type == 'CAMERA':
-                        scene.camera = camera_obj
+                        overrides.set(scene, "camera", camera_obj)
                     else:
                         self.logger.warning(f"Overridden camera '{camera_name}' is invalid or not a camera.")
                 else:
                     self.logger.warning(f"Overridden camera '{camera_name}' not found.")
             
-            # Frame Step (Universal)
-            if job.get(JOB_OVERRIDE_FRAME_STEP, False):
-                frame_step = job.get(JOB_FRAME_STEP, 1)
-            else:
-                frame_step = scene.frame_step
-            
             # Transparent Background (Universal)
             if job.get(JOB_OVERRIDE_TRANSPARENT, False):
-                scene.render.film_transparent = job[JOB_FILM_TRANSPARENT]
+                overrides.set(scene.render, "film_transparent", job[JOB_FILM_TRANSPARENT])
             
             # Compositor (Universal)
             if job.get(JOB_OVERRIDE_COMPOSITOR, False):
-                scene.render.use_compositing = job[JOB_USE_COMPOSITOR]
+                overrides.set(scene.render, "use_compositing", job[JOB_USE_COMPOSITOR])
                 
             if job.get(JOB_OVERRIDE_VIEW_LAYER):
                 vl_name = job[JOB_VIEW_LAYER]
                 if vl_name and vl_name in scene.view_layers:
                     for vl in scene.view_layers:
-                        vl.use = (vl.name == vl_name)
+                        overrides.set(vl, "use", vl.name == vl_name)
                 elif vl_name:
                      available_layers = [vl.name for vl in scene.view_layers]
                      error_msg = f"Warning: View layer '{vl_name}' not found in scene '{scene.name}'. Available layers: {', '.join(available_layers)}"
                      self.logger.warning(error_msg)
 
             if job[JOB_OVERRIDE_RESOLUTION]:
-                scene.render.resolution_percentage = job[JOB_RESOLUTION_SCALE]
+                overrides.set(scene.render, "resolution_percentage", job[JOB_RESOLUTION_SCALE])
                 
             if job[JOB_OVERRIDE_FORMAT]:
-                scene.render.image_settings.file_format = job[JOB_RENDER_FORMAT]
+                overrides.set(scene.render.image_settings, "file_format", job[JOB_RENDER_FORMAT])
                 
             if job[JOB_OVERRIDE_SAMPLES]:
-                if scene.render.engine == 'CYCLES':
-                    scene.cycles.samples = job[JOB_SAMPLES]
-                elif version_compat.is_eevee_engine(scene.render.engine):
-                    version_compat.set_eevee_samples(scene, job[JOB_SAMPLES])
+                if engine == 'CYCLES':
+                    overrides.set(scene.cycles, "samples", job[JOB_SAMPLES])
+                elif version_compat.is_eevee_engine(engine):
+                    samples_property = version_compat.get_eevee_samples_property(scene)
+                    if samples_property:
+                        overrides.set(*samples_property, job[JOB_SAMPLES])
+                    else:
+                        self.logger.warning("Eevee has no samples setting in this Blender version, samples override ignored")
             
             # Cycles-Only Overrides
-            if scene.render.engine == 'CYCLES':
-                # Denoising (Risk #7: API Compatibility)
+            if engine == 'CYCLES':
                 if job.get(JOB_OVERRIDE_DENOISING, False):
-                    try:
-                        # Blender 3.0+
-                        scene.cycles.use_denoising = job[JOB_USE_DENOISING]
-                    except AttributeError:
-                        try:
-                            # Older versions might use different property or location
-                            # For now, we log if it fails but don't crash
-                            pass
-                        except Exception as e:
-                            self.logger.error(f"Failed to set denoising: {e}")
+                    overrides.set(scene.cycles, "use_denoising", job[JOB_USE_DENOISING])
                 
                 # Device (Risk #8: API Complexity)
                 if job.get(JOB_OVERRIDE_DEVICE, False):
-                    target_device = job[JOB_DEVICE] # 'CPU' or 'GPU'
-                    scene.cycles.device = target_device
-                    
-                    # If GPU is selected, we might need to ensure preferences are set correctly
-                    # But changing system preferences from a background job is risky/complex.
-                    # Setting scene.cycles.device is usually enough for the scene to *request* it.
-                    # However, if no GPU is configured in preferences, it might fall back to CPU.
-                    # We'll stick to setting the scene property as it's the safest per-job override.
+                    # Setting scene.cycles.device only *requests* the GPU. Changing system
+                    # preferences from a background job is risky, so if no GPU is configured
+                    # there, Cycles falls back to CPU.
+                    overrides.set(scene.cycles, "device", job[JOB_DEVICE])
                 
-                # Time Limit
                 if job.get(JOB_OVERRIDE_TIME_LIMIT, False):
-                    try:
-                        scene.cycles.time_limit = job[JOB_TIME_LIMIT]
-                    except AttributeError:
-                        pass
+                    overrides.set(scene.cycles, "time_limit", job[JOB_TIME_LIMIT])
                 
-                # Persistent Data
                 if job.get(JOB_OVERRIDE_PERSISTENT_DATA, False):
-                    try:
-                        scene.render.use_persistent_data = job[JOB_USE_PERSISTENT_DATA]
-                    except AttributeError:
-                        pass
+                    overrides.set(scene.render, "use_persistent_data", job[JOB_USE_PERSISTENT_DATA])
+            
+            # Scene Grouping: keep synced data around for the next job of the group
+            if job.get(JOB_SCENE_GROUP) is not None and not job.get(JOB_OVERRIDE_PERSISTENT_DATA, False):
+                overrides.set(scene.render, "use_persistent_data", True)
+            
+            # The render loop moves these, put them back once the batch is done
+            overrides.keep(scene, "frame_current")
+            overrides.keep(scene.render, "filepath")
+            
+            for owner, attr, value, error in overrides.apply():
+                error_msg = f"Cannot set {attr} to '{value}': {error}. Using the scene's setting"
+                self.logger.error(error_msg)
+                if attr == "engine":
+                    self.log_status(error_msg, error=str(error))
 
+            # Skip Existing: job override wins over the global setting
+            if job.get(JOB_OVERRIDE_SKIP_EXISTING, False):
+                skip_existing = job.get(JOB_SKIP_EXISTING, True)
+            else:
+                skip_existing = self.manifest.get(MANIFEST_SKIP_EXISTING, False)
+            
+            # Known once the format override is applied
+            extension = scene.render.file_extension if scene.render.use_file_extension else ""
+            # Movies are one growing file, atomic frame writes don't apply
+            atomic_writes = not scene.render.is_movie_format
+            
+            frames = self.get_job_frames(job, scene)
+            
+            # Renumbered frame step output is saved under gap-free numbers right away
+            sequential = None
+            if frame_step > 1 and uses_sequential_names(self.manifest):
+                sequential = (frame_start, frame_step)
+                try:
+                    write_frame_map(output_dir, f"{scene_name}_", frame_start, frame_end, frame_step)
+                except OSError as e:
+                    self.logger.warning(f"Cannot write frame map: {e}")
+            
+            # Local scratch first, copier threads move finished frames to the output
+            staged = atomic_writes and self.use_staging(output_dir)
+            self.job_copy_times = []
+            
+            # Animation Render Method: hand whole runs of frames to Blender instead.
+            # Blender writes those frames itself, without our atomic writes and claims,
+            # so jobs other workers or machines may touch render frame by frame
+            if self.manifest.get(MANIFEST_RENDER_METHOD) == 'ANIMATION':
+                if skip_existing or self.shard_count > 1:
+                    self.logger.info("Rendering frame by frame: skip existing and frame sharding need atomic writes and frame claims")
+                else:
+                    if not self.render_animation(i, scene, frames, output_dir, sequential):
+                        self.failed_jobs.add(i)
+                        self.set_job_status(i, 'FAILED')
+                    frames = []
+            
             # Render Loop
-            current_frame = frame_start
-            while current_frame <= frame_end:
+            for current_frame in frames:
                 # Check for Pause
                 self.check_pause()
+                self.collect_copies()
+                self.check_disk_space(i, output_dir)
                 
-                # Set Frame
-                scene.frame_set(current_frame)
+                # Skipped, cancelled or draining: stop before the next frame
+                self.apply_queue_commands()
+                if self.is_job_interrupted(i):
+                    self.job_interrupted = True
+                    break
                 
                 # Construct Filename
-                # Standard naming: SceneName_0001...
-                file_name = f"{scene_name}_{current_frame:04d}"
+                # Standard naming: SceneName_0001... (renumbered output by sequential number)
+                output_number = get_sequential_frame(current_frame, *sequential) if sequential else current_frame
+                file_name = f"{scene_name}_{output_number:04d}"
                 
                 full_path = os.path.join(output_dir, file_name)
-                scene.render.filepath = full_path
+                final_path = full_path + extension
+                
+                if skip_existing and atomic_writes:
+                    claim = self.claim_frame(final_path)
+                    if claim != 'RENDER':
+                        reason = "already exists" if claim == 'EXISTS' else "is being rendered elsewhere"
+                        self.logger.info(f"Skipping frame {current_frame}: {final_path} {reason}")
+                        self.count_skipped_frames(i, 1)
+                        continue
+                    self.claimed_frame_path = final_path
+                    self.last_claim_heartbeat = time.time()
+                
+                # Set Frame
+                scene.frame_set(current_frame)
+                
+                # Write to a hidden temp name and move it into place once complete,
+                # so a killed worker never leaves a truncated frame behind
+                if staged:
+                    # Prefixed by job, a frame whose copy failed stays put until the next batch
+                    scene.render.filepath = os.path.join(self.scratch_dir, f"{i}_{file_name}")
+                elif atomic_writes:
+                    scene.render.filepath = os.path.join(output_dir, f".{file_name}.{os.getpid()}.partial")
+                else:
+                    scene.render.filepath = full_path
                 
                 # Render Frame
+                self.start_frame(current_frame)
                 try:
-                    self.log_status(f"Rendering {scene_name} (Frame {current_frame})", etr="Calculating...")
-                    self.logger.info(f"Rendering frame {current_frame} to {full_path}")
+                    self.log_status(f"Rendering {scene_name} (Frame {current_frame})", etr="Calculating...", event=EVENT_FRAME_STARTED)
+                    self.logger.info(f"Rendering frame {current_frame} to {final_path}")
                     
                     bpy.ops.render.render(write_still=True)
                     
+                    if staged:
+                        # Raises like the move below if the render wrote nothing
+                        os.stat(scene.render.filepath + extension)
+                        # Journaled and the claim replaced once the copy arrived,
+                        # the placeholder is kept fresh until then
+                        if self.claimed_frame_path:
+                            self.staged_claims.add(final_path)
+                        self.stager.submit(scene.render.filepath + extension, final_path, (i, scene, current_frame))
+                    else:
+                        if atomic_writes:
+                            os.replace(scene.render.filepath + extension, final_path)
+                        if os.path.exists(final_path):
+                            self.frame_written(i, scene, current_frame, final_path)
+                    
                 except Exception as e:
                     msg = f"Error rendering {scene_name} frame {current_frame}: {str(e)}"
                     self.logger.error(msg)
                     self.log_status(msg, error=str(e))
-                    self.job_statuses[i] = 'FAILED'
-                
-                current_frame += frame_step
+                    self.set_job_status(i, 'FAILED')
+                    if self.claimed_frame_path:
+                        self.release_frame_claim(final_path)
+                finally:
+                    self.claimed_frame_path = None
+                    self.current_frame = None
 
-            # Job Finished
-            self.job_statuses[i] = 'COMPLETED'
+            # Job Finished once its frames reached the output
+            self.collect_copies(wait=True)
+            if self.job_copy_times:
+                self.logger.info(
+                    f"Copied {len(self.job_copy_times)} frames of job {i+1}: median "
+                    f"{statistics.median(self.job_copy_times):.2f}s, slowest {max(self.job_copy_times):.2f}s per frame")
             self.job_timings[i]['end'] = time.time()
+            if self.job_interrupted:
+                # A drained job stays pending, its finished frames are in the journal
+                self.drop_remaining_frames(i)
+                self.set_job_status(i, 'CANCELLED' if i in self.cancelled_jobs else 'PENDING')
+                continue
+            if i in self.failed_jobs:
+                continue
+            self.set_job_status(i, 'COMPLETED')
             
-            # Renumber Output if enabled
-            if self.manifest.get(MANIFEST_RENUMBER_OUTPUT, False) and frame_step > 1:
+            # Renumbered view of links, the frames keep their numbers
+            # (sharded renders get theirs from the UI once every shard is done)
+            if frame_step > 1 and builds_link_view(self.manifest) and self.shard_count == 1:
                 try:
-                    # Construct pattern based on scene name
-                    # We assume standard naming used in render loop: f"{scene_name}_{current_frame:04d}"
-                    pattern = f"{scene_name}_*"
-                    
-                    renumber_output_sequence(
-                        output_dir, 
-                        pattern, 
-                        frame_start, 
-                        frame_end, 
-                        frame_step
+                    # Standard naming used in render loop: f"{scene_name}_{current_frame:04d}"
+                    renumber_sequence(
+                        output_dir,
+                        f"{scene_name}_",
+                        frame_start,
+                        frames=range(frame_start, frame_end + 1, frame_step),
+                        mode=self.manifest[MANIFEST_RENUMBER_MODE]
                     )
-                except Exception as e:
+                except (RenumberError, OSError) as e:
                     self.logger.error(f"Renumbering failed: {e}")
 
-        self.log_status("All Jobs Completed", finished=True)
-        self.logger.info("Background Render Complete")
+    def check_pause(self, message="Paused"):
+        """Block between frames while the UI has the worker paused.
 
-    def check_pause(self):
-        """Check for pause signal file and block execution if found."""
+        Args:
+            message (str): Status message while paused.
+
+        Raises:
+            RenderReleased: If the pause releases memory. The batch stops here
+                and the UI restarts it from the resume journal on resume.
+        """
+        self.collect_suspended_time()
+        control = get_worker_control()
+        if control.pause_mode is None:
+            return
+        
+        if control.pause_mode == PAUSE_RELEASE:
+            self.logger.info("Render Paused, releasing memory (the batch resumes from the journal)")
+            raise RenderReleased()
+        
+        self.log_status(message, etr="Paused", flush=True)
+        self.logger.info("Render Paused...")
+        
+        pause_start = time.time()
+        # Copies keep landing while paused, their claims must not go stale
+        while not control.resumed.wait(timeout=FRAME_CLAIM_HEARTBEAT_SECONDS):
+            self.collect_copies()
+        
+        pause_duration = time.time() - pause_start
+        self.total_paused_duration += pause_duration
+        
+        self.logger.info(f"Render Resumed (Paused for {pause_duration:.1f}s)")
+        self.log_status("Resuming...", etr="Calculating...", flush=True)
+
+    def collect_suspended_time(self):
+        """Account the time the UI had this process suspended as paused time."""
+        seconds = get_worker_control().take_suspended_seconds()
+        if seconds <= 0:
+            return
+        self.total_paused_duration += seconds
+        # Suspended mid-frame, the frame didn't take that long
+        if self.frame_started_at is not None:
+            self.frame_started_at += seconds
+        self.logger.info(f"Render Resumed (Suspended for {seconds:.1f}s)")
+
+class WorkerDaemon:
+    """Long-lived background worker that keeps the .blend file loaded between batches.
+
+    The UI starts it once with the same command line as a regular worker and then
+    sends it manifests over an authenticated localhost connection. Each request
+    is answered once the batch is done. Batches restore the overrides they applied,
+    so the file is only reloaded when it changed on disk, preferably while the
+    daemon is idle. The daemon exits when the UI closes its stdin, or after a
+    batch paused with its memory released.
+    """
+
+    def __init__(self, address_path):
+        """Initialize the daemon.
+
+        Args:
+            address_path (str): File the listening address is published to.
+        """
+        self.address_path = address_path
+        self.blend_path = bpy.data.filepath
+        self.blend_mtime = self.get_blend_mtime()
+        self.requests = queue.Queue()
+        self.logger = RenderCueLogger.get_logger(os.path.dirname(address_path))
+
+    def get_blend_mtime(self):
+        """Get the modification time of the loaded .blend file (0 if unreadable)."""
         try:
-            pause_file = os.path.join(os.path.dirname(self.status_path), PAUSE_SIGNAL_FILENAME)
-            if os.path.exists(pause_file):
-                self.log_status("Paused", etr="Paused")
-                self.logger.info("Render Paused...")
-                
-                pause_start = time.time()
-                while os.path.exists(pause_file):
-                    time.sleep(1)
-                
-                pause_duration = time.time() - pause_start
-                self.total_paused_duration += pause_duration
-                
-                self.logger.info(f"Render Resumed (Paused for {pause_duration:.1f}s)")
-                self.log_status("Resuming...", etr="Calculating...")
-        except OSError as e:
-            if self.logger:
-                self.logger.error(f"Pause Check Error: {e}")
+            return os.path.getmtime(self.blend_path)
+        except OSError:
+            return 0
+
+    def reload_if_needed(self):
+        """Reload the .blend file if it changed on disk.
+
+        Batches restore the overrides they applied, so the loaded file stays
+        valid between them.
+
+        Returns:
+            bool: True if the file was reloaded.
+        """
+        mtime = self.get_blend_mtime()
+        if mtime == self.blend_mtime:
+            return False
+
+        self.logger.info(f"Reloading {os.path.basename(self.blend_path)} (changed on disk)")
+        bpy.ops.wm.open_mainfile(filepath=self.blend_path)
+        self.blend_mtime = mtime
+        return True
+
+    def watch_parent(self):
+        """Exit once the UI closes our stdin, so a crashed UI never leaves us behind."""
+        get_worker_control().closed.wait()
+        os._exit(0)
+
+    def accept_connections(self, listener):
+        """Accept UI connections off the main thread.
+
+        The authentication handshake happens here, so a UI connecting while the
+        main thread is busy reloading never blocks waiting for it.
+        """
+        while True:
+            try:
+                self.requests.put(listener.accept())
+            except Exception as e:
+                self.logger.warning(f"Rejected daemon connection: {e}")
+
+    def publish_address(self, address):
+        """Atomically write the listening address for the UI to pick up."""
+        temp_path = self.address_path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump({'host': address[0], 'port': address[1], 'pid': os.getpid()}, f)
+        os.replace(temp_path, self.address_path)
+
+    def serve(self):
+        """Serve render requests until the UI goes away."""
+        authkey = os.environ.pop(DAEMON_AUTHKEY_ENV, "")
+        if not authkey:
+            self.logger.error("Worker daemon started without an auth key")
+            return
+
+        threading.Thread(target=self.watch_parent, daemon=True).start()
+
+        with Listener(('localhost', 0), authkey=bytes.fromhex(authkey)) as listener:
+            threading.Thread(target=self.accept_connections, args=(listener,), daemon=True).start()
+            self.publish_address(listener.address)
+            self.logger.info(f"Worker daemon ready for {os.path.basename(self.blend_path)}")
+
+            while True:
+                conn = self.requests.get()
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    conn.close()
+                    continue
+
+                released = False
+                if request.get('command') == DAEMON_CMD_RENDER:
+                    released = self.handle_render(request)
+                    try:
+                        conn.send({'done': True})
+                    except OSError:
+                        pass
+                conn.close()
+
+                if released:
+                    # Give the memory back, the UI starts a fresh worker on resume
+                    self.logger.info("Worker daemon exiting, its batch was paused with memory released")
+                    return
+
+                # Pick up a file saved during the batch now, rather than when the next batch arrives
+                try:
+                    self.reload_if_needed()
+                except RuntimeError as e:
+                    self.logger.error(f"Reload failed: {e}")
+
+    def handle_render(self, request):
+        """Run one batch in this process.
+
+        Args:
+            request (dict): Render request holding the manifest and status paths.
+
+        Returns:
+            bool: True if the batch was paused with its memory released.
+        """
+        try:
+            self.reload_if_needed()
+        except RuntimeError as e:
+            self.logger.error(f"Reload failed: {e}")
+
+        worker = BackgroundWorker(request['manifest'], request['status'])
+        try:
+            worker.run()
+        except Exception as e:
+            self.logger.error(f"Batch failed in worker daemon: {e}")
+            worker.log_status(f"Worker error: {e}", finished=True, error=str(e))
+        return worker.released
 
 def register():
     # Don't register handlers by default
@@ -0,0 +1,117 @@
+"""
+RenderCue Disk Space Module
+
+This module projects how much space a batch's output needs:
+- Frame sizes measured from frames already in an output folder
+- Output grouped per drive, with the free space left on each
+- Byte counts formatted for the interface
+
+Used by the confirm dialog before a batch and by the workers while they
+render. Kept free of bpy.
+"""
+
+import os
+import shutil
+
+from .constants import DISK_SAMPLE_FRAMES
+from .renumber import list_names, scan_sequence
+
+
+def format_bytes(size):
+    """Format a byte count for display (e.g. "12.3 GB")."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def find_existing_dir(path):
+    """Get the nearest folder of a path that exists (output folders are only created when rendering)."""
+    path = os.path.abspath(path)
+    while not os.path.isdir(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def get_mount_point(path):
+    """Get the root of the drive a path is on, to name it in messages."""
+    path = find_existing_dir(path)
+    while not os.path.ismount(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def get_free_bytes(path):
+    """Get the free space on the drive of a (possibly not yet created) folder.
+
+    Raises:
+        OSError: If the drive can't be queried.
+    """
+    return shutil.disk_usage(find_existing_dir(path)).free
+
+
+def measure_frame_size(output_dir, name_prefix):
+    """Get the average size of the newest frames of a sequence already on disk.
+
+    Args:
+        output_dir (str): Output folder of the job.
+        name_prefix (str): Part of the file name before the frame number (e.g. "Scene_").
+
+    Returns:
+        float or None: Bytes per frame, None if there are no frames to measure.
+    """
+    try:
+        names = list_names(output_dir)
+    except OSError:
+        return None
+    sequences = scan_sequence(names, name_prefix)
+    if not sequences:
+        return None
+    sizes = []
+    for _, name, _ in max(sequences.values(), key=len)[-DISK_SAMPLE_FRAMES:]:
+        try:
+            size = os.path.getsize(os.path.join(output_dir, name))
+        except OSError:
+            continue
+        # Placeholders of frames claimed elsewhere say nothing about the size
+        if size > 0:
+            sizes.append(size)
+    return sum(sizes) / len(sizes) if sizes else None
+
+
+def group_by_drive(outputs):
+    """Sum the projected output of jobs per drive.
+
+    Args:
+        outputs (list): (job index, output folder, projected bytes) tuples.
+
+    Returns:
+        list: One dict per drive with its 'path' (mount point), 'free' and
+        projected 'bytes', and the 'jobs' writing to it. Drives that can't be
+        queried are left out.
+    """
+    drives = {}
+    for job_index, output_dir, size in outputs:
+        path = find_existing_dir(output_dir)
+        try:
+            device = os.stat(path).st_dev
+            drive = drives.get(device)
+            if drive is None:
+                drive = drives[device] = {
+                    'path': get_mount_point(path),
+                    'free': shutil.disk_usage(path).free,
+                    'bytes': 0,
+                    'jobs': [],
+                }
+        except OSError:
+            continue
+        drive['bytes'] += size
+        drive['jobs'].append(job_index)
+    return list(drives.values())
@@ -10,8 +10,20 @@ import bpy
 import logging
 import os
 import json
-from .core import StateManager
-from .constants import PAUSE_SIGNAL_FILENAME
+from .core import (
+    StateManager, get_journal_path, get_job_output_dir, get_job_frame_range,
+    get_job_frame_list, format_frame_list
+)
+from .renumber import (
+    renumber_sequence, recover_renumber, get_sequential_frame, RenumberError,
+    get_renumber_frames
+)
+from .disk_space import format_bytes
+from .audit import audit_sequence
+from .constants import (
+    MANIFEST_JOBS, MANIFEST_GLOBAL_OUTPUT, MANIFEST_OUTPUT_LOCATION, DISK_MIN_FREE_BYTES,
+    RENUMBER_MOVE, AUDIT_MISSING
+)
 from .properties import get_available_renderers
 from . import ui_helpers
 from . import version_compat
@@ -44,7 +56,9 @@ class RENDERCUE_OT_remove_job(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         """Check if operator can run."""
-        return context.window_manager.rendercue.jobs and context.window_manager.rendercue.active_job_index >= 0
+        settings = context.window_manager.rendercue
+        # Job indices are fixed while a batch renders
+        return settings.jobs and settings.active_job_index >= 0 and not settings.is_rendering
 
     def execute(self, context):
         """Execute the operator."""
@@ -69,7 +83,9 @@ class RENDERCUE_OT_move_job(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         """Check if operator can run."""
-        return context.window_manager.rendercue.jobs and context.window_manager.rendercue.active_job_index >= 0
+        settings = context.window_manager.rendercue
+        # Job indices are fixed while a batch renders
+        return settings.jobs and settings.active_job_index >= 0 and not settings.is_rendering
 
     def execute(self, context):
         """Execute the operator."""
@@ -95,7 +111,7 @@ class RENDERCUE_OT_move_job_to_top(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         settings = context.window_manager.rendercue
-        return settings.jobs and settings.active_job_index > 0
+        return settings.jobs and settings.active_job_index > 0 and not settings.is_rendering
 
     def execute(self, context):
         settings = context.window_manager.rendercue
@@ -116,7 +132,7 @@ class RENDERCUE_OT_move_job_to_bottom(bpy.types.Operator):
     @classmethod
     def poll(cls, context):
         settings = context.window_manager.rendercue
-        return settings.jobs and settings.active_job_index < len(settings.jobs) - 1
+        return settings.jobs and settings.active_job_index < len(settings.jobs) - 1 and not settings.is_rendering
 
     def execute(self, context):
         settings = context.window_manager.rendercue
@@ -184,6 +200,8 @@ class RENDERCUE_OT_apply_override_to_all(bpy.types.Operator):
     apply_denoising: bpy.props.BoolProperty(name="Denoising")
     apply_time_limit: bpy.props.BoolProperty(name="Time Limit")
     apply_persistent_data: bpy.props.BoolProperty(name="Persistent Data")
+    apply_frame_timeout: bpy.props.BoolProperty(name="Frame Timeout")
+    apply_skip_existing: bpy.props.BoolProperty(name="Skip Existing Frames")
 
     def invoke(self, context, event):
         """Show confirmation dialog with checkboxes."""
@@ -222,6 +240,8 @@ class RENDERCUE_OT_apply_override_to_all(bpy.types.Operator):
                 ("apply_denoising", "override_denoising"),
                 ("apply_time_limit", "override_time_limit"),
                 ("apply_persistent_data", "override_persistent_data"),
+                ("apply_frame_timeout", "override_frame_timeout"),
+                ("apply_skip_existing", "override_skip_existing"),
             ]
             
             for apply_prop, source_bool in mappings:
@@ -258,6 +278,8 @@ class RENDERCUE_OT_apply_override_to_all(bpy.types.Operator):
             ("apply_denoising", "override_denoising", "Denoising"),
             ("apply_time_limit", "override_time_limit", "Time Limit"),
             ("apply_persistent_data", "override_persistent_data", "Persistent Data"),
+            ("apply_frame_timeout", "override_frame_timeout", "Frame Timeout"),
+            ("apply_skip_existing", "override_skip_existing", "Skip Existing Frames"),
         ]
         
         has_options = False
@@ -295,6 +317,8 @@ class RENDERCUE_OT_apply_override_to_all(bpy.types.Operator):
             "apply_denoising": ("override_denoising", "use_denoising", "denoising"),
             "apply_time_limit": ("override_time_limit", "time_limit", "time_limit"),
             "apply_persistent_data": ("override_persistent_data", "use_persistent_data", "persistent_data"),
+            "apply_frame_timeout": ("override_frame_timeout", "frame_timeout", "frame_timeout"),
+            "apply_skip_existing": ("override_skip_existing", "skip_existing", "skip_existing"),
         }
         
         applied_count = 0
@@ -440,6 +464,203 @@ class RENDERCUE_OT_open_output_folder(bpy.types.Operator):
         bpy.ops.wm.path_open(filepath=target_path)
         return {'FINISHED'}
 
+class RENDERCUE_OT_renumber_output(bpy.types.Operator):
+    """Renumber the rendered frames of the selected job."""
+    bl_idname = "rendercue.renumber_output"
+    bl_label = "Renumber Output"
+    bl_description = "Renumber the rendered frames of the selected job so they run without gaps (frame step output). Finishes an interrupted renumbering first"
+
+    rollback: bpy.props.BoolProperty(
+        name="Undo Interrupted Renumbering",
+        description="Restore the original names of an interrupted renumbering instead of finishing it",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        """Check if operator can run."""
+        settings = context.window_manager.rendercue
+        if settings.is_rendering or not 0 <= settings.active_job_index < len(settings.jobs):
+            return False
+        return settings.jobs[settings.active_job_index].scene is not None
+
+    def execute(self, context):
+        """Execute the operator."""
+        settings = context.window_manager.rendercue
+        prefs = context.preferences.addons[__package__].preferences
+        index = settings.active_job_index
+        job = settings.jobs[index]
+        
+        # Resolve the folder the way the worker does
+        manifest = {
+            MANIFEST_GLOBAL_OUTPUT: settings.global_output_path,
+            MANIFEST_OUTPUT_LOCATION: settings.output_location,
+            MANIFEST_JOBS: [StateManager.serialize_job(j) for j in settings.jobs],
+        }
+        output_dir = get_job_output_dir(manifest, index, bpy.data.filepath)
+        if not os.path.isdir(output_dir):
+            self.report({'WARNING'}, f"Directory does not exist: {output_dir}")
+            return {'CANCELLED'}
+        
+        try:
+            if self.rollback:
+                if recover_renumber(output_dir, rollback=True):
+                    self.report({'INFO'}, "Restored the original frame names")
+                else:
+                    self.report({'INFO'}, "No interrupted renumbering found")
+                return {'FINISHED'}
+            
+            name_prefix = f"{job.scene.name}_"
+            frame_start, frame_end, frame_step = get_job_frame_range(manifest[MANIFEST_JOBS][index], job.scene)
+            frames = get_renumber_frames(output_dir, name_prefix, frame_start, frame_end, frame_step)
+            if frames is None:
+                # Named sequentially while rendering, renumbering would pick the wrong files
+                self.report({'INFO'}, "Output is already numbered sequentially")
+                return {'FINISHED'}
+            
+            count = renumber_sequence(
+                output_dir,
+                name_prefix,
+                frame_start,
+                frames=frames,
+                mode=prefs.renumber_mode
+            )
+        except (RenumberError, OSError) as e:
+            self.report({'ERROR'}, f"Renumbering failed: {e}")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"Renumbered {count} frames")
+        return {'FINISHED'}
+
+class RENDERCUE_OT_audit_output(bpy.types.Operator):
+    """Check the output of every job for missing or broken frames."""
+    bl_idname = "rendercue.audit_output"
+    bl_label = "Audit Output"
+    bl_description = "Check every job's output folder for missing, empty and corrupt frames, and queue only those frames for rendering"
+
+    deep: bpy.props.BoolProperty(
+        name="Deep Check",
+        description="Read every frame completely: PNG image data is decompressed and JPEGs must be complete. Much slower on network drives",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+    queue_gaps: bpy.props.BoolProperty(
+        name="Queue Missing Frames",
+        description="Turn the queue into jobs that render only the missing and broken frames. When off, they are only reported",
+        default=True,
+        options={'SKIP_SAVE'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        """Check if operator can run."""
+        settings = context.window_manager.rendercue
+        return not settings.is_rendering and len(settings.jobs) > 0
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self, width=350)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "deep")
+        layout.prop(self, "queue_gaps")
+        if self.queue_gaps:
+            layout.label(text="Checked jobs without gaps are removed from the queue", icon=version_compat.get_icon('INFO'))
+            layout.label(text="Movie jobs and jobs without a scene stay as they are", icon=version_compat.get_icon('INFO'))
+
+    def execute(self, context):
+        """Execute the operator."""
+        settings = context.window_manager.rendercue
+        prefs = context.preferences.addons[__package__].preferences
+        logger = logging.getLogger("RenderCue")
+        
+        # Resolve the folders and frames the way the worker does
+        manifest = {
+            MANIFEST_GLOBAL_OUTPUT: settings.global_output_path,
+            MANIFEST_OUTPUT_LOCATION: settings.output_location,
+            MANIFEST_JOBS: [StateManager.serialize_job(j) for j in settings.jobs],
+        }
+        
+        results = {}
+        skipped = []
+        checked = 0
+        wm = context.window_manager
+        wm.progress_begin(0, len(settings.jobs))
+        try:
+            for index, job in enumerate(settings.jobs):
+                wm.progress_update(index)
+                scene = job.scene
+                if not scene:
+                    skipped.append(f"job {index + 1} (no scene)")
+                    continue
+                # Movies are a single file, there are no frames to check
+                if (job.render_format == 'FFMPEG') if job.override_format else scene.render.is_movie_format:
+                    logger.info(f"Audit: skipped {scene.name}, it renders a movie")
+                    skipped.append(f"{scene.name} (movie)")
+                    continue
+                
+                job_data = manifest[MANIFEST_JOBS][index]
+                frame_start, frame_end, frame_step = get_job_frame_range(job_data, scene)
+                # Stepped frames are saved under sequential numbers, see BackgroundWorker
+                sequential = prefs.renumber_frame_step_output and prefs.renumber_mode == RENUMBER_MOVE and frame_step > 1
+                numbers = {
+                    frame: get_sequential_frame(frame, frame_start, frame_step) if sequential else frame
+                    for frame in get_job_frame_list(job_data, scene)
+                }
+                output_dir = get_job_output_dir(manifest, index, bpy.data.filepath)
+                try:
+                    problems = audit_sequence(output_dir, f"{scene.name}_", numbers, deep=self.deep)
+                except OSError as e:
+                    self.report({'ERROR'}, f"Cannot read {output_dir}: {e}")
+                    return {'CANCELLED'}
+                
+                checked += len(numbers)
+                results[index] = problems
+                if problems:
+                    missing = [frame for frame, problem in problems.items() if problem == AUDIT_MISSING]
+                    broken = [frame for frame, problem in problems.items() if problem != AUDIT_MISSING]
+                    logger.warning(
+                        f"Audit: {scene.name} in {output_dir}: "
+                        f"missing {format_frame_list(missing) or 'none'}, broken {format_frame_list(broken) or 'none'}")
+        finally:
+            wm.progress_end()
+        
+        bad_jobs = {index: problems for index, problems in results.items() if problems}
+        not_checked = f", not checked: {', '.join(skipped)}" if skipped else ""
+        if not bad_jobs:
+            self.report({'INFO'}, f"All {checked} frames of {len(results)} jobs are present and valid{not_checked}")
+            return {'FINISHED'}
+        
+        missing = sum(1 for problems in bad_jobs.values() for problem in problems.values() if problem == AUDIT_MISSING)
+        broken = sum(len(problems) for problems in bad_jobs.values()) - missing
+        message = f"{missing} missing and {broken} broken frames in {len(bad_jobs)} jobs"
+        if not self.queue_gaps:
+            self.report({'WARNING'}, f"Found {message}, see the log for the frames{not_checked}")
+            return {'FINISHED'}
+        
+        # Jobs keep their range and step, so the new frames get the names of the old ones
+        for index in reversed(range(len(settings.jobs))):
+            if index not in results:
+                # Not checked, so nothing is known to be complete
+                continue
+            problems = results[index]
+            if not problems:
+                settings.jobs.remove(index)
+                continue
+            job = settings.jobs[index]
+            job.override_frame_list = True
+            job.frame_list = format_frame_list(problems)
+            # Broken files are in the way of skip existing, they must be overwritten
+            job.override_skip_existing = True
+            job.skip_existing = False
+            job.render_status = 'PENDING'
+            job.error_message = ""
+        settings.active_job_index = min(settings.active_job_index, len(settings.jobs) - 1)
+        
+        self.report({'WARNING'}, f"Queued {message}{not_checked}")
+        return {'FINISHED'}
+
 class RENDERCUE_OT_validate_queue(bpy.types.Operator):
     """Check the queue for common errors before rendering."""
     bl_idname = "rendercue.validate_queue"
@@ -685,7 +906,7 @@ class RENDERCUE_OT_stop_render(bpy.types.Operator):
     """Stop the current render process and clear all progress."""
     bl_idname = "rendercue.stop_render"
     bl_label = "Stop & Clear Progress"
-    bl_description = "Stop rendering and clear all progress. Jobs will restart from beginning. Use PAUSE if you want to resume later."
+    bl_description = "Stop rendering and clear all progress. Finished frames are kept in the resume journal, use Resume Batch to continue from where it stopped"
     
     def execute(self, context):
         """Execute the operator."""
@@ -715,7 +936,7 @@ class RENDERCUE_OT_stop_render(bpy.types.Operator):
         except Exception as e:
             logging.getLogger("RenderCue").warning(f"Error clearing preview: {e}")
         
-        self.report({'INFO'}, "Stopping render... (Progress will be cleared on next render)")
+        self.report({'INFO'}, "Stopping render... (Use Resume Batch to continue later)")
         return {'FINISHED'}
 
 class RENDERCUE_OT_pause_render(bpy.types.Operator):
@@ -724,16 +945,27 @@ class RENDERCUE_OT_pause_render(bpy.types.Operator):
     bl_label = "Pause Render"
     bl_description = "Pause the current render process"
     
+    mode: bpy.props.EnumProperty(
+        name="Pause",
+        items=[
+            ('DEFAULT', "Default", "Use the pause mode from the preferences"),
+            ('IMMEDIATE', "Immediately", "Suspend the workers right away, even mid-frame"),
+            ('AFTER_FRAME', "After Frame", "Let the workers finish their current frame, then wait"),
+            ('RELEASE', "Release Memory", "Let the workers finish their frame and exit to free memory. Resume continues from the resume journal"),
+        ],
+        default='DEFAULT',
+        options={'SKIP_SAVE'}
+    )
+    
     def execute(self, context):
         """Execute the operator."""
-        context.window_manager.rendercue.is_paused = True
-        # Create pause signal file
-        pause_file = os.path.join(bpy.app.tempdir, PAUSE_SIGNAL_FILENAME)
-        try:
-            with open(pause_file, 'w') as f:
-                f.write("PAUSE")
-        except OSError:
-            pass
+        settings = context.window_manager.rendercue
+        mode = self.mode
+        if mode == 'DEFAULT':
+            mode = context.preferences.addons[__package__].preferences.pause_mode
+        settings.is_paused = True
+        # Picked up by the render operator, which controls the workers
+        settings.pause_request = mode
         return {'FINISHED'}
 
 class RENDERCUE_OT_resume_render(bpy.types.Operator):
@@ -745,13 +977,37 @@ class RENDERCUE_OT_resume_render(bpy.types.Operator):
     def execute(self, context):
         """Execute the operator."""
         context.window_manager.rendercue.is_paused = False
-        # Remove pause signal file
-        pause_file = os.path.join(bpy.app.tempdir, PAUSE_SIGNAL_FILENAME)
-        if os.path.exists(pause_file):
+        # Picked up by the render operator, which controls the workers
+        context.window_manager.rendercue.pause_request = 'RESUME'
+        return {'FINISHED'}
+
+class RENDERCUE_OT_resume_batch(bpy.types.Operator):
+    """Continue an interrupted batch, skipping frames that were already rendered."""
+    bl_idname = "rendercue.resume_batch"
+    bl_label = "Resume Batch"
+    bl_description = "Continue an interrupted batch (stopped, crashed or closed), skipping frames recorded in the resume journal"
+
+    @classmethod
+    def poll(cls, context):
+        settings = context.window_manager.rendercue
+        if settings.is_rendering or not settings.jobs or not bpy.data.filepath:
+            return False
+        try:
+            return os.path.getsize(get_journal_path(bpy.data.filepath)) > 0
+        except OSError:
+            return False
+
+    def execute(self, context):
+        """Execute the operator."""
+        # Same as starting from the confirm dialog
+        if bpy.data.is_dirty:
             try:
-                os.remove(pause_file)
-            except OSError:
-                pass
+                bpy.ops.wm.save_mainfile()
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to save: {e}")
+                return {'CANCELLED'}
+
+        bpy.ops.rendercue.batch_render('INVOKE_DEFAULT', resume=True)
         return {'FINISHED'}
 
 class RENDERCUE_OT_browse_path(bpy.types.Operator):
@@ -790,6 +1046,9 @@ class RENDERCUE_OT_confirm_render(bpy.types.Operator):
     # Store validation results
     warnings = []
     errors = []
+    # Disk space preflight (projected bytes per job, drives the output goes to)
+    output_jobs = {}
+    output_drives = []
     
     def invoke(self, context, event):
         settings = context.window_manager.rendercue
@@ -800,6 +1059,19 @@ class RENDERCUE_OT_confirm_render(bpy.types.Operator):
         # Run validation first
         self.warnings, self.errors = ui_helpers.validate_queue_for_render(context)
         
+        # Projected once here, the dialog redraws often
+        self.output_jobs, self.output_drives = ui_helpers.get_output_projection(context)
+        for drive in self.output_drives:
+            if drive['bytes'] + DISK_MIN_FREE_BYTES > drive['free']:
+                jobs = ", ".join(str(i + 1) for i in drive['jobs'])
+                if all(self.output_jobs[i][1] for i in drive['jobs']):
+                    needed = f"about {format_bytes(drive['bytes'])}"
+                else:
+                    needed = f"up to {format_bytes(drive['bytes'])} uncompressed"
+                self.warnings.append(
+                    f"{drive['path']} has {format_bytes(drive['free'])} free, jobs {jobs} need {needed}. "
+                    f"Rendering pauses when it runs out")
+        
         # Show dialog (wide width for better readability)
         return context.window_manager.invoke_props_dialog(self, width=650)
     
@@ -831,6 +1103,14 @@ class RENDERCUE_OT_confirm_render(bpy.types.Operator):
         col = split.column()
         col.label(text=f"Est. Frames: {summary['total_frames']}")
         
+        # Projected output per drive
+        col = box.column(align=True)
+        for drive in self.output_drives:
+            row = col.row()
+            row.alert = drive['bytes'] + DISK_MIN_FREE_BYTES > drive['free']
+            row.label(text=f"Est. Output: {format_bytes(drive['bytes'])} on {drive['path']} ({format_bytes(drive['free'])} free)",
+                      icon=version_compat.get_icon('DISK_DRIVE'))
+        
         if summary['is_dirty']:
             row = box.row()
             row.alert = True
@@ -874,6 +1154,12 @@ class RENDERCUE_OT_confirm_render(bpy.types.Operator):
             row.label(text=f"Res: {details['resolution_display']}")
             row.label(text=f"Frames: {details['range_display']} ({details['frames_display']})")
             
+            # Row 3: Projected Output Size
+            if i in self.output_jobs:
+                size, measured = self.output_jobs[i]
+                row = content.row()
+                row.label(text=f"Est. Size: {'~' if measured else 'up to '}{format_bytes(size)}")
+            
             # Overrides Indicator
             if details['has_overrides']:
                 row = content.row()
@@ -946,7 +1232,10 @@ class RENDERCUE_OT_show_summary_popup(bpy.types.Operator):
         
         # Title
         row = layout.row()
-        row.label(text="Render Job Completed", icon=version_compat.get_icon('CHECKMARK'))
+        if settings.last_render_status == 'STOPPED':
+            row.label(text="Render Stopped After Current Frame", icon=version_compat.get_icon('PAUSE'))
+        else:
+            row.label(text="Render Job Completed", icon=version_compat.get_icon('CHECKMARK'))
         
         layout.separator()
         
@@ -966,10 +1255,19 @@ class RENDERCUE_OT_show_summary_popup(bpy.types.Operator):
         row.alignment = 'LEFT'
         row.label(text=f"Jobs: {settings.summary_successful_jobs} / {settings.summary_total_jobs}")
         
+        if settings.summary_output_size:
+            row = col.row()
+            row.alignment = 'LEFT'
+            row.label(text=f"Output: {settings.summary_output_size}")
+        
         if settings.summary_failed_jobs > 0:
             row = col.row()
             row.alert = True
             row.label(text=f"Failed: {settings.summary_failed_jobs}", icon=version_compat.get_icon('ERROR'))
+        
+        if settings.last_render_status == 'STOPPED':
+            row = col.row()
+            row.label(text="Use Resume Batch to render the rest", icon=version_compat.get_icon('RECOVER_LAST'))
             
         layout.separator()
         
@@ -1024,6 +1322,8 @@ classes = (
     RENDERCUE_OT_apply_override_to_all,
     RENDERCUE_OT_remove_override,
     RENDERCUE_OT_open_output_folder,
+    RENDERCUE_OT_renumber_output,
+    RENDERCUE_OT_audit_output,
     RENDERCUE_OT_validate_queue,
     RENDERCUE_OT_save_preset,
     RENDERCUE_OT_load_preset,
@@ -1032,6 +1332,7 @@ classes = (
     RENDERCUE_OT_stop_render,
     RENDERCUE_OT_pause_render,
     RENDERCUE_OT_resume_render,
+    RENDERCUE_OT_resume_batch,
     RENDERCUE_OT_browse_path,
     RENDERCUE_OT_load_data,
     RENDERCUE_OT_show_summary_popup,
@@ -21,10 +21,195 @@ class RenderCuePreferences(bpy.types.AddonPreferences):
 
     renumber_frame_step_output: bpy.props.BoolProperty(
         name="Auto-Renumber Frame Step Output",
-        description="Automatically renumber output files sequentially when using Frame Step > 1 (for video editor compatibility)",
+        description="Number output files sequentially when using Frame Step > 1 (for video editor compatibility)",
         default=False
     )
 
+    renumber_mode: bpy.props.EnumProperty(
+        name="Renumber By",
+        items=[
+            ('MOVE', "Sequential Names", "Save the frames under gap-free numbers as they render. A frame map next to them lists the source frame of each number"),
+            ('SYMLINK', "Symbolic Links", "Leave the frames alone and build a renumbered sequence of symbolic links in a 'renumbered' subfolder"),
+            ('HARDLINK', "Hard Links", "Leave the frames alone and build a renumbered sequence of hard links in a 'renumbered' subfolder (same drive only)"),
+        ],
+        default='MOVE',
+        description="How frame step output is renumbered"
+    )
+
+    # Parallel Rendering
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes to render with at the same time",
+        default=1,
+        min=1,
+        soft_max=16,
+        max=64
+    )
+
+    parallel_mode: bpy.props.EnumProperty(
+        name="Split Work By",
+        items=[
+            ('FRAMES', "Frames", "Every worker renders every Nth frame of each job. Best for long animations"),
+            ('JOBS', "Jobs", "Workers take whole jobs from the queue as they free up. Best for many short jobs"),
+        ],
+        default='FRAMES',
+        description="How the queue is divided between parallel workers"
+    )
+
+    render_method: bpy.props.EnumProperty(
+        name="Render Method",
+        items=[
+            ('FRAME', "Frame by Frame", "Render every frame as a separate still. Writes are atomic and pause takes effect after any frame"),
+            ('ANIMATION', "Animation", "Render runs of frames with Blender's animation render, so scene sync and persistent data are reused between frames. Much faster for short frames. Jobs with skip existing frames, and frame sharding across workers, still render frame by frame"),
+        ],
+        default='FRAME',
+        description="How background workers render the frames of a job"
+    )
+
+    group_jobs_by_scene: bpy.props.BoolProperty(
+        name="Group Jobs by Scene",
+        description="Render jobs of the same scene back-to-back with persistent data on, when they only differ in camera, output, format or frames. Saves re-syncing the scene for every job",
+        default=False
+    )
+
+    status_channel: bpy.props.EnumProperty(
+        name="Worker Status",
+        items=[
+            ('EVENTS', "Event Stream", "Workers stream progress events to the UI over their output pipe. Nothing is lost and updates arrive right away"),
+            ('FILE', "Status File", "Workers rewrite a status file that the UI watches for changes. Use this if the event stream misbehaves on your system"),
+            ('SHARED_MEMORY', "Shared Memory", "Workers update a memory-mapped status block in place that the UI polls without parsing anything. Cheapest for very long queues"),
+        ],
+        default='EVENTS',
+        description="How background workers report progress to the UI"
+    )
+
+    pause_mode: bpy.props.EnumProperty(
+        name="Pause",
+        items=[
+            ('IMMEDIATE', "Immediately", "Suspend the workers right away, even mid-frame. They keep their memory (falls back to After Frame on Windows)"),
+            ('AFTER_FRAME', "After Frame", "Workers finish the frame they are rendering, then wait. They keep their memory"),
+            ('RELEASE', "Release Memory", "Workers finish their frame and exit, freeing their memory. Resume starts them again and skips every frame in the resume journal"),
+        ],
+        default='AFTER_FRAME',
+        description="What the Pause button does with the background workers"
+    )
+
+    preview_policy: bpy.props.EnumProperty(
+        name="Preview",
+        items=[
+            ('EVERY_FRAME', "Every Frame", "Update the preview after every frame"),
+            ('EVERY_NTH', "Every Nth Frame", "Update the preview after every Nth frame"),
+            ('INTERVAL', "Interval", "Update the preview at most once per interval. Keeps fast frames from waiting on the preview"),
+            ('FIRST_LAST', "First & Last Frame", "Only show the first and the last frame of each job"),
+            ('OFF', "Off", "No preview while rendering"),
+        ],
+        default='INTERVAL',
+        description="How often workers write the preview thumbnail of the last frame"
+    )
+
+    preview_every: bpy.props.IntProperty(
+        name="Every",
+        description="Frames between two preview updates",
+        default=10,
+        min=1,
+        soft_max=100
+    )
+
+    preview_interval: bpy.props.FloatProperty(
+        name="Interval",
+        description="Minimum time between two preview updates",
+        default=2.0,
+        min=0.0,
+        soft_max=60.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE'
+    )
+
+    worker_debug_log: bpy.props.BoolProperty(
+        name="Worker Debug Log",
+        description="Write preview diagnostics of the workers to worker_debug.log next to the status files",
+        default=False
+    )
+
+    use_output_staging: bpy.props.BoolProperty(
+        name="Stage Frames Locally",
+        description="Render frames to a local scratch folder and copy them to the output in the background, checksummed. Keeps slow network output from holding up the next frame",
+        default=False
+    )
+
+    staging_directory: bpy.props.StringProperty(
+        name="Scratch Folder",
+        description="Local folder frames are rendered to before they are copied out (empty = system temp folder)",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    staging_copy_threads: bpy.props.IntProperty(
+        name="Copy Threads",
+        description="Frames each worker copies to the output at the same time",
+        default=2,
+        min=1,
+        max=16
+    )
+
+    staging_copy_retries: bpy.props.IntProperty(
+        name="Copy Retries",
+        description="How often a failed copy is retried before the frame is left in the scratch folder. The delay doubles with every retry",
+        default=3,
+        min=0,
+        max=10
+    )
+
+    use_worker_daemon: bpy.props.BoolProperty(
+        name="Keep Workers Warm",
+        description="Keep background workers running between batches with the .blend loaded. They only reload the file when it changed on disk, so re-renders start in seconds. Uses memory while idle",
+        default=False
+    )
+
+    max_worker_restarts: bpy.props.IntProperty(
+        name="Crash Restarts",
+        description="How often a crashed worker is restarted to continue with its remaining frames (0 = stop the batch on the first crash)",
+        default=3,
+        min=0,
+        max=100
+    )
+
+    worker_restart_delay: bpy.props.FloatProperty(
+        name="Restart Delay",
+        description="Seconds to wait before restarting a crashed worker. Doubles with every further restart",
+        default=5.0,
+        min=0.0,
+        soft_max=300.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE'
+    )
+
+    stall_timeout: bpy.props.FloatProperty(
+        name="Stall Timeout",
+        description="Seconds without a sign of life from a rendering worker before it counts as hung and is restarted (0 = never)",
+        default=600.0,
+        min=0.0,
+        soft_max=3600.0,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE'
+    )
+
+    slow_frame_factor: bpy.props.FloatProperty(
+        name="Slow Frame Warning",
+        description="Flag frames that take this many times longer than the median frame of their worker (0 = off)",
+        default=3.0,
+        min=0.0,
+        soft_max=10.0
+    )
+
+    threads_per_worker: bpy.props.IntProperty(
+        name="Threads per Worker",
+        description="Render threads for each worker process (0 = split the available CPU cores evenly)",
+        default=0,
+        min=0,
+        max=1024
+    )
+
     def update_auto_save(self, context):
         if self.auto_save_queue:
             StateManager.register_handlers()
@@ -74,7 +259,57 @@ class RenderCuePreferences(bpy.types.AddonPreferences):
         layout.separator()
         layout.label(text="General:")
         layout.prop(self, "auto_save_queue")
-        layout.prop(self, "renumber_frame_step_output")
+        row = layout.row()
+        row.prop(self, "renumber_frame_step_output")
+        sub = row.row()
+        sub.enabled = self.renumber_frame_step_output
+        sub.prop(self, "renumber_mode", text="")
+        
+        # Performance
+        layout.separator()
+        layout.label(text="Performance:")
+        row = layout.row()
+        row.prop(self, "worker_count")
+        sub = row.row()
+        sub.enabled = self.worker_count > 1
+        sub.prop(self, "threads_per_worker", text="Threads")
+        row = layout.row()
+        row.enabled = self.worker_count > 1
+        row.prop(self, "parallel_mode", expand=True)
+        layout.prop(self, "render_method")
+        if self.render_method == 'ANIMATION':
+            settings = context.window_manager.rendercue
+            if settings.skip_existing_frames or (self.worker_count > 1 and self.parallel_mode == 'FRAMES'):
+                layout.label(text="Skip existing and frame sharding need frame by frame rendering, those jobs fall back to it",
+                             icon=version_compat.get_icon('INFO'))
+        layout.prop(self, "group_jobs_by_scene")
+        row = layout.row()
+        row.prop(self, "max_worker_restarts")
+        sub = row.row()
+        sub.enabled = self.max_worker_restarts > 0
+        sub.prop(self, "worker_restart_delay", text="Delay")
+        row = layout.row()
+        row.prop(self, "stall_timeout")
+        row.prop(self, "slow_frame_factor", text="Slow Frame ×")
+        layout.prop(self, "use_worker_daemon")
+        row = layout.row()
+        row.prop(self, "use_output_staging")
+        sub = row.row()
+        sub.enabled = self.use_output_staging
+        sub.prop(self, "staging_directory", text="")
+        row = layout.row()
+        row.enabled = self.use_output_staging
+        row.prop(self, "staging_copy_threads")
+        row.prop(self, "staging_copy_retries")
+        layout.prop(self, "status_channel")
+        layout.prop(self, "pause_mode")
+        row = layout.row()
+        row.prop(self, "preview_policy")
+        if self.preview_policy == 'EVERY_NTH':
+            row.prop(self, "preview_every", text="Frames")
+        elif self.preview_policy == 'INTERVAL':
+            row.prop(self, "preview_interval", text="")
+        layout.prop(self, "worker_debug_log")
         
         # Notifications
         layout.separator()
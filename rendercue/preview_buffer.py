@@ -0,0 +1,164 @@
+"""
+RenderCue Preview Buffer Module
+
+This module implements the shared-memory hand-off of preview thumbnails:
+- A memory-mapped file next to the status file, sized for the largest thumbnail
+- A seqlock, so the reader never copies a half-written thumbnail
+- 8-bit RGBA pixels, bottom row first like Blender's image buffers
+
+The UI creates the buffer before starting a worker, the worker writes every
+new thumbnail into it and the UI copies the pixels straight into a preview,
+without a file to encode, load or decode. Kept free of bpy so it can be used
+on both sides.
+"""
+
+import mmap
+import os
+import struct
+
+from .constants import PREVIEW_MAX_SIZE, PREVIEW_BUFFER_SUFFIX
+
+MAGIC = b"RCPB"
+VERSION = 1
+
+# Header: magic, version, seqlock, width, height, then the pixels
+_HEADER = struct.Struct("<4sHxxQII")
+_SEQ_OFFSET = 8
+_SEQ = struct.Struct("<Q")
+_SIZE = _HEADER.size + PREVIEW_MAX_SIZE * PREVIEW_MAX_SIZE * 4
+
+
+def get_buffer_path(status_path):
+    """Get the preview buffer file that belongs to a status file."""
+    return os.path.splitext(status_path)[0] + PREVIEW_BUFFER_SUFFIX
+
+
+def create_buffer(status_path):
+    """Create an empty preview buffer for a worker, replacing any previous one.
+
+    Args:
+        status_path (str): Status file of the worker, the buffer sits next to it.
+    """
+    with open(get_buffer_path(status_path), 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        f.write(b"\0" * (_SIZE - _HEADER.size))
+
+
+class PreviewBufferWriter:
+    """Worker side of the preview buffer."""
+
+    def __init__(self, status_path):
+        """Map the buffer the UI created for this worker.
+
+        Args:
+            status_path (str): Status file of the worker, the buffer sits next to it.
+
+        Raises:
+            OSError: If the buffer is missing or isn't a preview buffer.
+        """
+        self.path = get_buffer_path(status_path)
+        self.file = open(self.path, 'r+b')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0)
+        except ValueError as e:
+            self.file.close()
+            raise OSError(f"Empty preview buffer: {e}")
+        if len(self.map) < _SIZE:
+            self.close()
+            raise OSError("Not a RenderCue preview buffer")
+        magic, version, self.seq, _, _ = _HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise OSError("Not a RenderCue preview buffer")
+
+    def write(self, width, height, pixels):
+        """Publish a thumbnail.
+
+        Args:
+            width (int): Thumbnail width, at most PREVIEW_MAX_SIZE.
+            height (int): Thumbnail height, at most PREVIEW_MAX_SIZE.
+            pixels (bytes): width * height 8-bit RGBA pixels.
+        """
+        size = width * height * 4
+        if width > PREVIEW_MAX_SIZE or height > PREVIEW_MAX_SIZE or len(pixels) != size:
+            raise ValueError(f"Thumbnail of {width}x{height} doesn't fit the preview buffer")
+
+        # Seqlock: odd while writing
+        self.seq += 1
+        _SEQ.pack_into(self.map, _SEQ_OFFSET, self.seq)
+        self.map[_HEADER.size:_HEADER.size + size] = pixels
+        self.seq += 1
+        _HEADER.pack_into(self.map, 0, MAGIC, VERSION, self.seq, width, height)
+
+    def close(self):
+        """Unmap the buffer."""
+        try:
+            self.map.close()
+            self.file.close()
+        except (OSError, ValueError):
+            pass
+
+
+class PreviewBufferReader:
+    """UI side of the preview buffer.
+
+    ``read`` costs a single integer unpack while no new thumbnail arrived.
+    """
+
+    def __init__(self, status_path):
+        """Create a fresh buffer for a worker and map it.
+
+        Args:
+            status_path (str): Status file of the worker.
+        """
+        self.path = get_buffer_path(status_path)
+        self.file = None
+        self.map = None
+        self.last_seq = 0
+        create_buffer(status_path)
+        self.file = open(self.path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, retries=3):
+        """Copy out the latest thumbnail.
+
+        Args:
+            retries (int): How often to retry when a write is in progress.
+
+        Returns:
+            tuple or None: (width, height, pixels) with 8-bit RGBA pixels, or
+            None if no new thumbnail was written since the last read.
+        """
+        m = self.map
+        if m is None:
+            return None
+        for _ in range(retries):
+            seq = _SEQ.unpack_from(m, _SEQ_OFFSET)[0]
+            if seq == self.last_seq:
+                return None
+            if seq % 2:
+                continue
+
+            magic, version, _, width, height = _HEADER.unpack_from(m, 0)
+            if magic != MAGIC or version != VERSION or not width or not height:
+                return None
+            pixels = m[_HEADER.size:_HEADER.size + width * height * 4]
+
+            if _SEQ.unpack_from(m, _SEQ_OFFSET)[0] != seq:
+                # Overwritten while reading
+                continue
+            self.last_seq = seq
+            return width, height, pixels
+        return None
+
+    def close(self):
+        """Unmap the buffer."""
+        try:
+            if self.map is not None:
+                self.map.close()
+            if self.file is not None:
+                self.file.close()
+        except (OSError, ValueError):
+            pass
+        self.map = None
+        self.file = None
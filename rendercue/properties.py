@@ -50,6 +50,10 @@ def update_override_frame_step(self, context):
         if self.scene:
             self.frame_step = self.scene.frame_step
 
+def update_override_frame_list(self, context):
+    if self.override_frame_list:
+        context.window_manager.rendercue.ui_show_dimensions = True
+
 def update_override_transparent(self, context):
     if self.override_transparent:
         context.window_manager.rendercue.ui_show_job_output = True
@@ -107,6 +111,15 @@ def update_override_persistent_data(self, context):
             except AttributeError:
                 pass
 
+def update_override_frame_timeout(self, context):
+    if self.override_frame_timeout:
+        context.window_manager.rendercue.ui_show_render = True
+
+def update_override_skip_existing(self, context):
+    if self.override_skip_existing:
+        context.window_manager.rendercue.ui_show_job_output = True
+        self.skip_existing = not context.window_manager.rendercue.skip_existing_frames
+
 def update_override_output(self, context):
     if self.override_output:
         context.window_manager.rendercue.ui_show_job_output = True
@@ -239,6 +252,21 @@ class RenderCueJob(bpy.types.PropertyGroup):
         options={'SKIP_SAVE'}
     )
     
+    # Frame List Override (e.g. the gaps found by the output audit)
+    override_frame_list: bpy.props.BoolProperty(
+        name="Override Frame List",
+        default=False,
+        description="Render only the listed frames of this job",
+        update=update_override_frame_list,
+        options={'SKIP_SAVE'}
+    )
+    frame_list: bpy.props.StringProperty(
+        name="Frames",
+        default="",
+        description="Frames to render, as numbers and ranges (e.g. 1-10,15,20-30x5)",
+        options={'SKIP_SAVE'}
+    )
+    
     # Transparent Background Override
     override_transparent: bpy.props.BoolProperty(
         name="Override Transparency",
@@ -411,6 +439,38 @@ class RenderCueJob(bpy.types.PropertyGroup):
         options={'SKIP_SAVE'}
     )
     
+    # Frame Timeout Override
+    override_frame_timeout: bpy.props.BoolProperty(
+        name="Override Frame Timeout",
+        default=False,
+        description="Restart the worker when a single frame of this job takes too long",
+        update=update_override_frame_timeout,
+        options={'SKIP_SAVE'}
+    )
+    frame_timeout: bpy.props.FloatProperty(
+        name="Frame Timeout",
+        default=0.0,
+        min=0.0,
+        soft_max=86400.0,
+        description="Seconds a frame may take before it counts as stalled (0 = unlimited)",
+        options={'SKIP_SAVE'}
+    )
+    
+    # Skip Existing Override
+    override_skip_existing: bpy.props.BoolProperty(
+        name="Override Skip Existing",
+        default=False,
+        description="Use a custom skip existing frames setting for this job",
+        update=update_override_skip_existing,
+        options={'SKIP_SAVE'}
+    )
+    skip_existing: bpy.props.BoolProperty(
+        name="Skip Existing",
+        default=True,
+        description="Don't re-render frames that are already in the output folder",
+        options={'SKIP_SAVE'}
+    )
+    
 
 
     # Job status tracking
@@ -502,7 +562,7 @@ class RenderCueSettings(bpy.types.PropertyGroup):
     jobs: bpy.props.CollectionProperty(type=RenderCueJob, options={'SKIP_SAVE'})
     active_job_index: bpy.props.IntProperty(name="Active Job Index", default=0, options={'SKIP_SAVE'})
     
-    # Dynamic key for preview collection to force UI updates
+    # Key of the live preview in the preview collection
     preview_icon_key: bpy.props.StringProperty(
         name="Preview Icon Key",
         default="thumbnail",
@@ -530,6 +590,13 @@ class RenderCueSettings(bpy.types.PropertyGroup):
 
 
 
+    skip_existing_frames: bpy.props.BoolProperty(
+        name="Skip Existing Frames",
+        default=False,
+        description="Don't re-render frames that are already in the output folder. Several workers or RenderCue instances can then share one job without rendering the same frame twice",
+        options={'SKIP_SAVE'}
+    )
+
     presets_path: bpy.props.StringProperty(
         name="Presets Path",
         subtype='DIR_PATH',
@@ -556,6 +623,19 @@ class RenderCueSettings(bpy.types.PropertyGroup):
         default=False,
         options={'SKIP_SAVE'}
     )
+
+    pause_request: bpy.props.EnumProperty(
+        name="Pause Request",
+        items=[
+            ('NONE', "None", ""),
+            ('IMMEDIATE', "Immediately", ""),
+            ('AFTER_FRAME', "After Frame", ""),
+            ('RELEASE', "Release Memory", ""),
+            ('RESUME', "Resume", ""),
+        ],
+        default='NONE',
+        options={'SKIP_SAVE'}
+    )
     
     current_job_index: bpy.props.IntProperty(
         name="Current Job Index",
@@ -569,6 +649,13 @@ class RenderCueSettings(bpy.types.PropertyGroup):
         options={'SKIP_SAVE'}
     )
     
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of workers rendering the batch",
+        default=1,
+        options={'SKIP_SAVE'}
+    )
+    
     paused_duration: bpy.props.FloatProperty(
         name="Paused Duration",
         default=0.0,
@@ -624,7 +711,8 @@ class RenderCueSettings(bpy.types.PropertyGroup):
             ('NONE', "None", ""),
             ('SUCCESS', "Success", ""),
             ('FAILED', "Failed", ""),
-            ('CANCELLED', "Cancelled", "")
+            ('CANCELLED', "Cancelled", ""),
+            ('STOPPED', "Stopped", "Stopped after the current frame, Resume Batch continues")
         ],
         default='NONE',
         options={'SKIP_SAVE'}
@@ -650,6 +738,7 @@ class RenderCueSettings(bpy.types.PropertyGroup):
     summary_render_time: bpy.props.StringProperty(name="Total Render Time", default="", options={'SKIP_SAVE'})
     summary_blend_file: bpy.props.StringProperty(name="Blend File", default="", options={'SKIP_SAVE'})
     summary_output_path: bpy.props.StringProperty(name="Summary Output Path", default="", options={'SKIP_SAVE'})
+    summary_output_size: bpy.props.StringProperty(name="Summary Output Size", default="", options={'SKIP_SAVE'})
 
     # Queue Preview UI State
     show_queue_preview: bpy.props.BoolProperty(
@@ -658,6 +747,13 @@ class RenderCueSettings(bpy.types.PropertyGroup):
         description="Show mini queue status during rendering",
         options={'SKIP_SAVE'}
     )
+    
+    show_queue_editor: bpy.props.BoolProperty(
+        name="Show Queue Editor",
+        default=False,
+        description="Edit the queue of the running batch",
+        options={'SKIP_SAVE'}
+    )
 
     # UI State (Collapse/Expand)
     ui_show_global_output: bpy.props.BoolProperty(name="Show Global Output", default=False, options={'SKIP_SAVE'})
@@ -4,8 +4,8 @@ RenderCue Render Module
 This module handles the background rendering process.
 It defines the `RENDERCUE_OT_batch_render` operator which:
 - Prepares the render queue manifest
-- Spawns a background Blender process
-- Monitors progress via status files
+- Spawns background Blender processes (or reuses warm worker daemons)
+- Monitors progress via worker events (or status files)
 - Updates the UI and preview images
 """
 
@@ -17,30 +17,503 @@ import json
 import subprocess
 import sys
 import atexit
-from .core import StateManager, RenderCueLogger
+import glob
+import secrets
+import signal
+import queue
+import threading
+import numpy as np
+from multiprocessing.connection import Client
+from .core import (
+    StateManager, RenderCueLogger, format_etr, get_job_frame_range,
+    get_job_output_dir, get_journal_path,
+    read_journal, format_frame_list, parse_frame_list, get_job_frame_list
+)
 from .notifications import send_webhook, show_notification
+from .status_block import StatusBlockReader
+from .preview_buffer import PreviewBufferReader
+from .renumber import renumber_sequence, RenumberError, release_shard, builds_link_view
+from .disk_space import format_bytes, get_free_bytes
 from .constants import (
-    MANIFEST_FILENAME, STATUS_FILENAME, PAUSE_SIGNAL_FILENAME,
+    MANIFEST_FILENAME, STATUS_FILENAME,
     STATUS_MESSAGE, STATUS_ETR, STATUS_JOB_INDEX, STATUS_FINISHED_FRAMES,
     STATUS_TOTAL_FRAMES, STATUS_LAST_FRAME, STATUS_ERROR, STATUS_FINISHED,
     STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS,
     STATUS_TOTAL_JOBS, DEFAULT_PROGRESS_MESSAGE, DEFAULT_ETR,
-    STATUS_PAUSED_DURATION
+    STATUS_PAUSED_DURATION, STATUS_TIMESTAMP, MANIFEST_JOBS,
+    MANIFEST_SHARD_INDEX, MANIFEST_SHARD_COUNT,
+    MANIFEST_JOB_POOL, JOB_CLAIM_FILENAME_PREFIX, JOB_SCENE_NAME,
+    DAEMON_ADDRESS_FILENAME, DAEMON_AUTHKEY_ENV, DAEMON_CMD_RENDER,
+    MANIFEST_JOURNAL_PATH, JOB_COMPLETED_FRAMES, STATUS_SKIPPED_FRAMES,
+    JOB_FRAME_LIST, STATUS_CURRENT_FRAME, STATUS_FRAME_STARTED,
+    STATUS_MEDIAN_FRAME_TIME, STATUS_SYNC_SAVED, STATUS_COPY_TIME, EVENT_LINE_PREFIX, EVENT_TYPE,
+    EVENT_STATUS, EVENT_JOBS, EVENT_BATCH, STATUS_SEQ, STATUS_WATCH_INTERVAL,
+    TIMER_DEFAULT_INTERVAL, TIMER_MIN_INTERVAL, TIMER_MAX_INTERVAL, TIMER_TICKS_PER_FRAME,
+    STATUS_RELEASED, MANIFEST_PAUSED_DURATION, CONTROL_COMMAND, CONTROL_PAUSE,
+    CONTROL_RESUME, CONTROL_SUSPENDED, CONTROL_MODE, CONTROL_SECONDS,
+    PAUSE_IMMEDIATE, PAUSE_AFTER_FRAME, PAUSE_RELEASE, CONTROL_CANCEL_JOB,
+    CONTROL_PRIORITIZE_JOB, CONTROL_APPEND_JOBS, CONTROL_DRAIN, CONTROL_JOB,
+    CONTROL_JOBS, CONTROL_BATCH, MANIFEST_BATCH_ID, MANIFEST_JOB_ORDER,
+    JOB_CANCELLED, STATUS_BLOCK_SPARE_JOBS,
+    PREVIEW_BUFFER_SUFFIX, UI_PREVIEW_COLLECTION_KEY, UI_PREVIEW_IMAGE_KEY,
+    MANIFEST_RENUMBER_MODE, STATUS_OUTPUT_BYTES, STATUS_PROJECTED_BYTES,
+    STATUS_DISK_PAUSES
 )
 
 # Global reference for atexit
-_bg_process = None
+_bg_processes = []
+
+# Queue edits requested while rendering, (action, job index) tuples picked up by the render operator
+_queue_requests = []
+
+# Warm worker daemons, keyed by worker slot (they outlive a single batch)
+_daemons = {}
 
 def cleanup_process():
-    global _bg_process
-    if _bg_process:
+    for process in _bg_processes:
         try:
-            _bg_process.kill()
+            process.kill()
         except OSError:
             pass
+    shutdown_daemons()
 
 atexit.register(cleanup_process)
 
+def build_worker_command(python_code, threads=0):
+    """Build the command line for a headless Blender running worker code.
+
+    Args:
+        python_code (str): Code passed via ``--python-expr``.
+        threads (int): Render thread cap passed via ``-t`` (0 = Blender default).
+
+    Returns:
+        list: Command line for ``subprocess.Popen``.
+    """
+    # Add addon directory to sys.path so it can be imported
+    addon_dir = os.path.dirname(os.path.dirname(__file__))
+
+    # Build command: blender -b <file> [-t <threads>] --python-expr <worker code>
+    cmd = [bpy.app.binary_path, "-b", bpy.data.filepath]
+    if threads > 0:
+        cmd.extend(["-t", str(threads)])
+
+    cmd.append("--python-expr")
+    cmd.append(f"import sys; sys.path.insert(0, {repr(addon_dir)}); {python_code}")
+    return cmd
+
+class WorkerEventReader:
+    """Reads the stdout of a worker process on a thread and queues its events.
+
+    Event lines (``EVENT_LINE_PREFIX`` + JSON) are queued for the modal
+    operator; everything else Blender prints is passed through to our stdout.
+    """
+
+    def __init__(self, stream):
+        """Start reading.
+
+        Args:
+            stream: Binary stdout pipe of the worker process.
+        """
+        self.events = queue.Queue()
+        self.thread = threading.Thread(target=self.read, args=(stream,), daemon=True)
+        self.thread.start()
+
+    def read(self, stream):
+        for raw in iter(stream.readline, b''):
+            line = raw.decode('utf-8', errors='replace')
+            if line.startswith(EVENT_LINE_PREFIX):
+                try:
+                    self.events.put(json.loads(line[len(EVENT_LINE_PREFIX):]))
+                except ValueError:
+                    pass
+            elif sys.stdout:
+                sys.stdout.write(line)
+        stream.close()
+
+    def drain(self):
+        """Get every event received since the last call.
+
+        Returns:
+            list: Events in the order they were emitted.
+        """
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                return events
+
+class StatusFileWatcher:
+    """Watches the status files of the workers on a thread.
+
+    A file is only parsed when its modification time or size changed, and
+    parsed snapshots are queued for the modal operator, so the UI thread
+    never blocks on file I/O.
+    """
+
+    def __init__(self, status_files):
+        """Start watching.
+
+        Args:
+            status_files (list): Status file of every worker slot.
+        """
+        self.status_files = status_files
+        self.signatures = [None] * len(status_files)
+        self.snapshots = queue.Queue()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+        self.thread.start()
+
+    def watch(self):
+        while not self.stopped.wait(STATUS_WATCH_INTERVAL):
+            self.scan()
+
+    def scan(self):
+        """Queue a snapshot of every status file that changed since the last scan."""
+        for i, status_file in enumerate(self.status_files):
+            try:
+                stat = os.stat(status_file)
+            except OSError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if signature == self.signatures[i]:
+                continue
+            try:
+                with open(status_file, 'r') as f:
+                    status = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                # Partially written, the next write changes the signature again
+                continue
+            self.signatures[i] = signature
+            self.snapshots.put((i, status))
+
+    def drain(self):
+        """Get every snapshot parsed since the last call.
+
+        Returns:
+            list: (worker index, status) tuples, oldest first.
+        """
+        snapshots = []
+        while True:
+            try:
+                snapshots.append(self.snapshots.get_nowait())
+            except queue.Empty:
+                return snapshots
+
+    def stop(self):
+        """Stop watching, after picking up whatever the workers wrote last."""
+        self.stopped.set()
+        self.thread.join()
+        self.scan()
+
+def fold_worker_event(status, event):
+    """Fold a worker event into the status dict of that worker.
+
+    The result has the same layout as the status file, so it can be merged
+    and applied like one.
+
+    Args:
+        status (dict or None): Status folded so far.
+        event (dict): Event as emitted by ``BackgroundWorker.emit_event``.
+
+    Returns:
+        tuple: The updated status and the set of job indices the event changed.
+    """
+    if status is None or event.get(EVENT_TYPE) == EVENT_BATCH:
+        status = {STATUS_JOB_STATUSES: [], STATUS_JOB_PROGRESS: [], STATUS_JOB_TIMINGS: []}
+    status.update(event.get(EVENT_STATUS) or {})
+    if event.get(EVENT_TYPE) == EVENT_BATCH:
+        return status, set(range(len(status[STATUS_JOB_STATUSES])))
+    
+    changed = set()
+    for key, (job_status, progress, timing) in (event.get(EVENT_JOBS) or {}).items():
+        index = int(key)
+        if index < len(status[STATUS_JOB_STATUSES]):
+            status[STATUS_JOB_STATUSES][index] = job_status
+            status[STATUS_JOB_PROGRESS][index] = progress
+            status[STATUS_JOB_TIMINGS][index] = timing
+            changed.add(index)
+    return status, changed
+
+def get_changed_jobs(old, new):
+    """Get the jobs whose state differs between two status file reads.
+
+    Args:
+        old (dict or None): Previous status of a worker.
+        new (dict): Current status of the same worker.
+
+    Returns:
+        set: Indices of the jobs that changed.
+    """
+    keys = (STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS)
+    count = len(new.get(STATUS_JOB_STATUSES, []))
+    if old is None:
+        return set(range(count))
+    changed = set()
+    for key in keys:
+        old_values, new_values = old.get(key, []), new.get(key, [])
+        changed.update(i for i in range(len(new_values))
+                       if i >= len(old_values) or old_values[i] != new_values[i])
+    return changed
+
+def get_job_entry(values, index):
+    """Get a job's entry from a per-job status field.
+
+    Single workers report lists, merged statuses dicts keyed by job index.
+    """
+    if isinstance(values, dict):
+        return values.get(index)
+    return values[index] if index < len(values) else None
+
+def set_if_changed(owner, attr, value):
+    """Assign an RNA property only if its value differs, to avoid needless updates and redraws.
+
+    Returns:
+        bool: True if the property was assigned.
+    """
+    if getattr(owner, attr) != value:
+        setattr(owner, attr, value)
+        return True
+    return False
+
+class WorkerDaemonHandle:
+    """UI-side handle of a warm worker daemon (see ``core.WorkerDaemon``)."""
+
+    def __init__(self, process, address_file, authkey, blend_file, threads):
+        self.process = process
+        self.events = WorkerEventReader(process.stdout)
+        self.address_file = address_file
+        self.authkey = authkey
+        self.blend_file = blend_file
+        self.threads = threads
+
+    def is_reusable(self, blend_file, threads):
+        """Check whether the daemon is alive and was started for the same file and thread cap."""
+        return (self.process.poll() is None
+                and self.blend_file == blend_file
+                and self.threads == threads)
+
+    def send_render(self, manifest_file, status_file):
+        """Hand a batch to the daemon once it has published its address.
+
+        Args:
+            manifest_file (str): Manifest the daemon should render.
+            status_file (str): Where the daemon writes its status.
+
+        Returns:
+            Connection or None: Connection that receives a message when the
+            batch is done, or None if the daemon is still starting up.
+        """
+        try:
+            with open(self.address_file, 'r') as f:
+                address = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        conn = Client((address['host'], address['port']), authkey=self.authkey)
+        conn.send({
+            'command': DAEMON_CMD_RENDER,
+            'manifest': manifest_file,
+            'status': status_file,
+        })
+        return conn
+
+    def shutdown(self):
+        """Stop the daemon by closing its stdin."""
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+
+def get_worker_daemon(worker_index, threads=0):
+    """Get a warm daemon for a worker slot, starting one if needed.
+
+    A daemon started for another file or thread cap is replaced.
+
+    Args:
+        worker_index (int): 0-based worker slot.
+        threads (int): Render thread cap (0 = Blender default).
+
+    Returns:
+        WorkerDaemonHandle: The daemon for this slot.
+    """
+    blend_file = bpy.data.filepath
+    handle = _daemons.get(worker_index)
+    if handle and handle.is_reusable(blend_file, threads):
+        return handle
+    if handle:
+        handle.shutdown()
+
+    base, ext = os.path.splitext(os.path.join(bpy.app.tempdir, DAEMON_ADDRESS_FILENAME))
+    address_file = f"{base}_{worker_index}{ext}"
+    if os.path.exists(address_file):
+        try:
+            os.remove(address_file)
+        except OSError:
+            pass
+
+    authkey = secrets.token_bytes(32)
+    env = dict(os.environ)
+    env[DAEMON_AUTHKEY_ENV] = authkey.hex()
+
+    python_code = (
+        f"from rendercue.core import WorkerDaemon; "
+        f"WorkerDaemon({repr(address_file)}).serve()"
+    )
+    process = subprocess.Popen(build_worker_command(python_code, threads),
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env)
+
+    handle = WorkerDaemonHandle(process, address_file, authkey, blend_file, threads)
+    _daemons[worker_index] = handle
+    logging.getLogger("RenderCue").info(f"Started worker daemon {worker_index + 1} for {os.path.basename(blend_file)}")
+    return handle
+
+def shutdown_daemons(keep=0):
+    """Stop warm daemons.
+
+    Args:
+        keep (int): Number of worker slots to keep running.
+    """
+    for worker_index in [i for i in _daemons if i >= keep]:
+        _daemons.pop(worker_index).shutdown()
+
+def get_worker_path(path, worker_index, worker_count):
+    """Get the per-worker variant of a temp file path.
+
+    A single worker keeps the plain filename so the layout is unchanged;
+    parallel workers get ``name_<N>.ext``.
+    """
+    if worker_count <= 1:
+        return path
+    base, ext = os.path.splitext(path)
+    return f"{base}_{worker_index}{ext}"
+
+def record_queue_edit(manifest, command):
+    """Apply a queue edit sent to the workers to a worker manifest.
+
+    Args:
+        manifest (dict): The worker's manifest, edited in place.
+        command (dict): A CONTROL_CANCEL_JOB, CONTROL_PRIORITIZE_JOB or
+            CONTROL_APPEND_JOBS command. Others leave the manifest alone.
+    """
+    name = command.get(CONTROL_COMMAND)
+    job_index = command.get(CONTROL_JOB)
+    if name == CONTROL_CANCEL_JOB:
+        manifest[MANIFEST_JOBS][job_index][JOB_CANCELLED] = True
+    elif name == CONTROL_PRIORITIZE_JOB:
+        order = manifest.get(MANIFEST_JOB_ORDER) or list(range(len(manifest[MANIFEST_JOBS])))
+        order.remove(job_index)
+        manifest[MANIFEST_JOB_ORDER] = [job_index] + order
+    elif name == CONTROL_APPEND_JOBS:
+        # A manifest that already has the jobs (or misses earlier ones) is left alone
+        if len(manifest[MANIFEST_JOBS]) != job_index:
+            return
+        new_jobs = command[CONTROL_JOBS]
+        manifest[MANIFEST_JOBS].extend(new_jobs)
+        if MANIFEST_JOB_ORDER in manifest:
+            manifest[MANIFEST_JOB_ORDER].extend(range(job_index, job_index + len(new_jobs)))
+
+def merge_job_status(values, job_pool=False):
+    """Merge the status one job has in each worker into a single status.
+
+    Args:
+        values (list): The job's status as reported by every worker.
+            Pool workers report None for jobs another worker claimed.
+        job_pool (bool): True when workers own whole jobs. The owner's state
+            then wins over workers that simply haven't reached the job yet.
+    """
+    values = [v for v in values if v is not None]
+    if job_pool:
+        values = [v for v in values if v != 'PENDING'] or ['PENDING']
+    if not values:
+        return 'PENDING'
+    if 'FAILED' in values:
+        return 'FAILED'
+    if all(v == 'COMPLETED' for v in values):
+        return 'COMPLETED'
+    if all(v == 'PENDING' for v in values):
+        return 'PENDING'
+    if all(v in ('COMPLETED', 'CANCELLED') for v in values):
+        return 'CANCELLED'
+    return 'RENDERING'
+
+def merge_worker_status(statuses, start_time, job_pool=False, job_indices=()):
+    """Merge the status files of parallel workers into one status dict.
+
+    Frame counters are summed, job states are combined per job and the ETR is
+    recomputed from the overall throughput since the batch started.
+
+    Args:
+        statuses (list): Status dicts, one per worker.
+        start_time (float): Timestamp when the batch was launched.
+        job_pool (bool): True when workers claim whole jobs instead of
+            splitting every job's frames.
+        job_indices (iterable): Jobs to merge. Only these are looked at, so
+            the cost doesn't grow with the length of the queue.
+
+    Returns:
+        dict: A status dict with the same keys a single worker writes. The
+        per-job entries are dicts keyed by job index instead of lists.
+    """
+    latest = max(statuses, key=lambda s: s.get(STATUS_TIMESTAMP, 0))
+    merged = dict(latest)
+
+    finished = sum(s.get(STATUS_FINISHED_FRAMES, 0) for s in statuses)
+    merged[STATUS_FINISHED_FRAMES] = finished
+    merged[STATUS_FINISHED] = all(s.get(STATUS_FINISHED) for s in statuses)
+    merged[STATUS_ERROR] = next((s[STATUS_ERROR] for s in statuses if s.get(STATUS_ERROR)), None)
+    merged[STATUS_PAUSED_DURATION] = max(s.get(STATUS_PAUSED_DURATION, 0) for s in statuses)
+    merged[STATUS_SKIPPED_FRAMES] = sum(s.get(STATUS_SKIPPED_FRAMES, 0) for s in statuses)
+    merged[STATUS_SYNC_SAVED] = sum(s.get(STATUS_SYNC_SAVED, 0) for s in statuses)
+    merged[STATUS_OUTPUT_BYTES] = sum(s.get(STATUS_OUTPUT_BYTES, 0) for s in statuses)
+    merged[STATUS_PROJECTED_BYTES] = sum(s.get(STATUS_PROJECTED_BYTES, 0) for s in statuses)
+
+    # Most recent preview from any worker
+    with_preview = [s for s in statuses if s.get(STATUS_LAST_FRAME)]
+    if with_preview:
+        merged[STATUS_LAST_FRAME] = max(with_preview, key=lambda s: s.get(STATUS_TIMESTAMP, 0))[STATUS_LAST_FRAME]
+
+    # Per-job state
+    job_statuses = {}
+    job_progress = {}
+    job_timings = {}
+    for i in job_indices:
+        values = [s[STATUS_JOB_STATUSES][i] for s in statuses if i < len(s.get(STATUS_JOB_STATUSES, []))]
+        job_status = merge_job_status(values, job_pool)
+        job_statuses[i] = job_status
+
+        # Shards each own part of a job's frames, pool workers all know its full size
+        progress = [s[STATUS_JOB_PROGRESS][i] for s in statuses if i < len(s.get(STATUS_JOB_PROGRESS, []))]
+        totals = [p.get('total', 0) for p in progress]
+        job_progress[i] = {
+            'done': sum(p.get('done', 0) for p in progress),
+            'total': (max(totals) if job_pool else sum(totals)) if totals else 0,
+        }
+
+        timings = [s[STATUS_JOB_TIMINGS][i] for s in statuses if i < len(s.get(STATUS_JOB_TIMINGS, []))]
+        starts = [t['start'] for t in timings if t.get('start', 0) > 0]
+        ends = [t.get('end', 0) for t in timings]
+        job_timings[i] = {
+            'start': min(starts) if starts else 0.0,
+            # Only finished once every worker involved has finished
+            'end': max(ends) if ends and job_status in ('COMPLETED', 'FAILED', 'CANCELLED') else 0.0,
+        }
+
+    merged[STATUS_JOB_STATUSES] = job_statuses
+    merged[STATUS_JOB_PROGRESS] = job_progress
+    merged[STATUS_JOB_TIMINGS] = job_timings
+
+    # Same rule as per job: shards add up, pool workers each count the whole queue
+    totals = [s.get(STATUS_TOTAL_FRAMES, 0) for s in statuses]
+    total = max(totals) if job_pool else sum(totals)
+    merged[STATUS_TOTAL_FRAMES] = total
+    elapsed = time.time() - start_time - merged[STATUS_PAUSED_DURATION]
+    rendered = finished - merged[STATUS_SKIPPED_FRAMES]
+    if rendered > 0 and total > 0:
+        merged[STATUS_ETR] = format_etr(elapsed / rendered * (total - finished))
+
+    return merged
+
 class RENDERCUE_OT_batch_render(bpy.types.Operator):
     """Start background rendering of all jobs in the queue. Blender will remain responsive."""
     
@@ -49,6 +522,13 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
     bl_description = "Start background rendering of all jobs in the queue. Blender will remain responsive."
     bl_options = {'REGISTER'}
 
+    resume: bpy.props.BoolProperty(
+        name="Resume",
+        description="Skip frames an interrupted batch already finished, as recorded in the resume journal",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
     _timer = None
     _job_index = 0
     _rendering = False
@@ -58,10 +538,44 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
     _total_jobs = 0
     _start_time = None
     _total_frames_to_render = 0
-    _background_process = None
-    _status_file = None
+    _background_processes = []
+    _status_files = []
+    _worker_statuses = []
+    _event_readers = []
+    _status_blocks = []
+    _preview_buffers = []
+    _status_watcher = None
+    _timer_interval = TIMER_DEFAULT_INTERVAL
+    _ui_changed = False
+    _changed_jobs = set()
+    _status_channel = 'EVENTS'
+    _worker_done = []
+    _use_daemon = False
+    _daemon_handles = []
+    _daemon_requests = []
+    _daemon_connections = []
+    _threads = 0
+    _worker_manifests = []
+    _restart_counts = []
+    _restart_at = []
+    _crash_handled = []
+    _worker_started = []
+    _stall_causes = []
+    _slow_frames = set()
+    _disk_pauses = []
+    _crash_counts = {}
+    _dropped_frames = {}
+    _journal_path = None
     _manifest_file = None
+    _parallel_mode = 'FRAMES'
     _last_finished_frames = -1
+    _preview_mtime = None
+    _pause_mode = None
+    _paused_at = 0.0
+    _resumed_at = 0.0
+    _batch_id = None
+    _draining = False
+    _job_capacity = 0
 
     def modal(self, context, event):
         """Handle modal events (timer ticks) to check render progress."""
@@ -72,114 +586,770 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
                 context.window_manager.rendercue.stop_requested = False # Reset flag
                 
             if self._stop:
-                if self._background_process:
-                    self._background_process.kill()
+                # Daemons are killed too, a batch can't be interrupted any other way
+                for process in self._background_processes:
+                    process.kill()
                 self.finish(context)
                 return {'CANCELLED'}
 
-            # Check Background Process
-            if self._background_process:
+            # Pause/Resume Requests (the pause operators can't reach the workers)
+            settings = context.window_manager.rendercue
+            if settings.pause_request != 'NONE':
+                request, settings.pause_request = settings.pause_request, 'NONE'
+                if request == 'RESUME':
+                    self.resume_workers(context)
+                else:
+                    self.pause_workers(context, request)
+            
+            # Queue edits (skip, cancel, render next, append, drain)
+            while _queue_requests:
+                self.apply_queue_request(context, *_queue_requests.pop(0))
+
+            # A suspended daemon can't answer the connection handshake
+            if self._use_daemon and self._pause_mode != PAUSE_IMMEDIATE:
+                self.dispatch_to_daemons()
+
+            # Check Background Processes
+            if self._background_processes:
                 # Read Status first (to ensure we get the latest state even if it just finished)
-                if self._status_file and os.path.exists(self._status_file):
-                    try:
-                        with open(self._status_file, 'r') as f:
-                            status = json.load(f)
-                            context.window_manager.rendercue.progress_message = status.get(STATUS_MESSAGE, DEFAULT_PROGRESS_MESSAGE)
-                            
-                            # Sync pause state from worker status
-                            msg = status.get(STATUS_MESSAGE, "")
-                            if "Paused" in msg:
-                                context.window_manager.rendercue.is_paused = True
-                            elif "Resuming" in msg or "Rendering" in msg:
-                                context.window_manager.rendercue.is_paused = False
-
-                            # Check for Error
-                            if status.get(STATUS_ERROR):
-                                # Send desktop notification
-                                prefs = context.preferences.addons[__package__].preferences
-                                if prefs.show_notifications:
-                                    show_notification("RenderCue Error", status[STATUS_ERROR])
-                                
-                                self._stop = True
-
-                            # Update Progress Stats
-                            settings = context.window_manager.rendercue
-                            
-                            if STATUS_FINISHED_FRAMES in status:
-                                settings.finished_frames_count = status[STATUS_FINISHED_FRAMES]
-                            
-                            if STATUS_TOTAL_FRAMES in status:
-                                settings.total_frames_to_render = status[STATUS_TOTAL_FRAMES]
-                                
-                            if STATUS_ETR in status:
-                                settings.etr = status[STATUS_ETR]
-                                
-                            if STATUS_JOB_INDEX in status:
-                                # STATUS_JOB_INDEX is 1-based from worker, convert to 0-based
-                                settings.current_job_index = status[STATUS_JOB_INDEX] - 1
-                                
-                            if STATUS_TOTAL_JOBS in status:
-                                settings.total_jobs_count = status[STATUS_TOTAL_JOBS]
-
-                            # Update job-level status and progress
-                            job_statuses = status.get(STATUS_JOB_STATUSES, [])
-                            job_progress = status.get(STATUS_JOB_PROGRESS, [])
-                            job_timings = status.get(STATUS_JOB_TIMINGS, [])
-
-                            for i, job in enumerate(settings.jobs):
-                                if i < len(job_statuses):
-                                    job.render_status = job_statuses[i]
-                                
-                                if i < len(job_progress):
-                                    progress = job_progress[i]
-                                    if isinstance(progress, dict):
-                                        job.completed_frames = progress.get('done', 0)
-                                        job.total_frames = progress.get('total', 0)
-                                
-                                if i < len(job_timings):
-                                    timing = job_timings[i]
-                                    if isinstance(timing, dict):
-                                        if 'start' in timing and timing['start'] > 0:
-                                            job.start_time = timing['start']
-                                        if 'end' in timing and timing['end'] > 0:
-                                            job.end_time = timing['end']
-                            
-                            # Update Preview
-                            # Use finished_frames count to detect new frames because path is constant
-                            current_finished = status.get(STATUS_FINISHED_FRAMES, 0)
-                            last_frame_path = status.get(STATUS_LAST_FRAME)
-                            
-                            if last_frame_path and current_finished > self._last_finished_frames:
-                                self._last_finished_frames = current_finished
-                                self.update_preview(context, last_frame_path)
-
-                            # Check for Completion (Fix for UI Freeze)
-                            # If worker says it's finished, we trust it and stop waiting for process exit
-                            if status.get(STATUS_FINISHED):
-                                if self._background_process:
-                                    try:
-                                        self._background_process.kill() # Force kill to prevent hangs
-                                    except OSError:
-                                        pass
-                                self.finish(context)
-                                return {'FINISHED'}
-                    except (OSError, json.JSONDecodeError):
-                        # File might be locked or partially written, just skip this update
-                        pass
+                result = self.read_status()
+                if result is not None and self.apply_status(context, *result):
+                    if not self._use_daemon:
+                        for process in self._background_processes:
+                            try:
+                                process.kill() # Force kill to prevent hangs
+                            except OSError:
+                                pass
+                    self.finish(context)
+                    return {'FINISHED'}
 
-            if self._background_process.poll() is not None:
-                # Process finished
+            self.check_disk_pauses(context)
+            self.watch_workers(context)
+            self.supervise_workers(context)
+
+            if all(self.is_worker_done(i) for i in range(len(self._background_processes))):
+                # Process finished, pick up whatever it reported last
+                if self._status_watcher:
+                    self._status_watcher.stop()
+                result = self.read_status()
+                if result is not None:
+                    self.apply_status(context, *result)
                 self.finish(context)
                 return {'FINISHED'}
 
-            # Force UI Redraw (Fix for freeze/lag)
-            for window in context.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type in {'PROPERTIES', 'VIEW_3D'}:
-                        area.tag_redraw()
+            # Only redraw when something shown in the UI changed
+            if self._ui_changed:
+                self._ui_changed = False
+                for window in context.window_manager.windows:
+                    for area in window.screen.areas:
+                        if area.type in {'PROPERTIES', 'VIEW_3D'}:
+                            area.tag_redraw()
+
+            self.adapt_timer(context)
 
         return {'PASS_THROUGH'}
 
+    def read_status(self):
+        """Collect the status of every worker.
+
+        Folds the events queued by each worker's event reader, the snapshots
+        of the status file watcher, or polls the status blocks. Jobs that
+        changed are collected until the next apply, so only those have to be
+        touched.
+
+        Returns:
+            tuple or None: The (merged) status and the indices of the jobs that
+            changed, or None if nothing new arrived.
+        """
+        updated = False
+        if self._status_channel == 'EVENTS':
+            for i, reader in enumerate(self._event_readers):
+                for event in reader.drain():
+                    self._worker_statuses[i], changed = fold_worker_event(self._worker_statuses[i], event)
+                    self._changed_jobs |= changed
+                    updated = True
+        elif self._status_channel == 'SHARED_MEMORY':
+            for i, block in enumerate(self._status_blocks):
+                changed = block.read() if block else None
+                if changed is None:
+                    continue
+                self._worker_statuses[i] = block.status
+                self._changed_jobs |= changed
+                updated = True
+        elif self._status_watcher:
+            for i, status in self._status_watcher.drain():
+                previous = self._worker_statuses[i]
+                self._worker_statuses[i] = status
+                # A heartbeat only refreshes the timestamp
+                if previous is not None and previous.get(STATUS_SEQ) == status.get(STATUS_SEQ):
+                    continue
+                self._changed_jobs |= get_changed_jobs(previous, status)
+                updated = True
+
+        if not updated:
+            return None
+        statuses = [s for s in self._worker_statuses if s is not None]
+        if len(self._status_files) == 1:
+            status = statuses[0]
+        elif len(statuses) < len(self._status_files):
+            # Wait until every worker has reported before merging
+            return None
+        else:
+            status = merge_worker_status(statuses, self._start_time, self._parallel_mode == 'JOBS', self._changed_jobs)
+        changed, self._changed_jobs = self._changed_jobs, set()
+        return status, changed
+
+    def apply_status(self, context, status, changed_jobs=()):
+        """Fold a worker status into the UI settings.
+
+        Only the given jobs are updated, and properties are only assigned when
+        their value changed, so the cost per tick doesn't grow with the queue.
+
+        Args:
+            context (bpy.types.Context): Blender context.
+            status (dict): Status as written by the worker.
+            changed_jobs (iterable): Indices of the jobs that changed.
+
+        Returns:
+            bool: True if the worker reports the batch as finished.
+        """
+        settings = context.window_manager.rendercue
+        # While a pause is pending, keep saying so until the worker reports it
+        message = status.get(STATUS_MESSAGE, DEFAULT_PROGRESS_MESSAGE)
+        changed = False
+        if not self._pause_mode or "Paused" in message:
+            changed = set_if_changed(settings, "progress_message", message)
+        changed |= set_if_changed(settings, "paused_duration", status.get(STATUS_PAUSED_DURATION, 0.0))
+
+        # Check for Error
+        if status.get(STATUS_ERROR) and not self._stop:
+            # Send desktop notification
+            prefs = context.preferences.addons[__package__].preferences
+            if prefs.show_notifications:
+                show_notification("RenderCue Error", status[STATUS_ERROR])
+
+            self._stop = True
+
+        # Update Progress Stats
+        if STATUS_FINISHED_FRAMES in status:
+            changed |= set_if_changed(settings, "finished_frames_count", status[STATUS_FINISHED_FRAMES])
+
+        if STATUS_TOTAL_FRAMES in status:
+            changed |= set_if_changed(settings, "total_frames_to_render", status[STATUS_TOTAL_FRAMES])
+
+        if STATUS_ETR in status:
+            changed |= set_if_changed(settings, "etr", status[STATUS_ETR])
+
+        if STATUS_JOB_INDEX in status:
+            # STATUS_JOB_INDEX is 1-based from worker, convert to 0-based
+            changed |= set_if_changed(settings, "current_job_index", status[STATUS_JOB_INDEX] - 1)
+
+        if STATUS_TOTAL_JOBS in status:
+            changed |= set_if_changed(settings, "total_jobs_count", status[STATUS_TOTAL_JOBS])
+
+        # Update job-level status and progress
+        job_statuses = status.get(STATUS_JOB_STATUSES, [])
+        job_progress = status.get(STATUS_JOB_PROGRESS, [])
+        job_timings = status.get(STATUS_JOB_TIMINGS, [])
+
+        for i in changed_jobs:
+            if i >= len(settings.jobs):
+                continue
+            job = settings.jobs[i]
+            
+            job_status = get_job_entry(job_statuses, i)
+            if job_status is not None:
+                changed |= set_if_changed(job, "render_status", job_status)
+
+            progress = get_job_entry(job_progress, i)
+            if isinstance(progress, dict):
+                changed |= set_if_changed(job, "completed_frames", progress.get('done', 0))
+                changed |= set_if_changed(job, "total_frames", progress.get('total', 0))
+
+            timing = get_job_entry(job_timings, i)
+            if isinstance(timing, dict):
+                if timing.get('start', 0) > 0:
+                    changed |= set_if_changed(job, "start_time", timing['start'])
+                if timing.get('end', 0) > 0:
+                    changed |= set_if_changed(job, "end_time", timing['end'])
+
+        # Update Preview
+        # Use finished_frames count to detect new frames because path is constant
+        current_finished = status.get(STATUS_FINISHED_FRAMES, 0)
+        last_frame_path = status.get(STATUS_LAST_FRAME)
+
+        if last_frame_path and current_finished > self._last_finished_frames:
+            self._last_finished_frames = current_finished
+            changed |= self.update_preview(context, last_frame_path)
+
+        if changed:
+            self._ui_changed = True
+
+        # Check for Completion (Fix for UI Freeze)
+        # If worker says it's finished, we trust it and stop waiting for process exit
+        return bool(status.get(STATUS_FINISHED))
+
+    def spawn_worker(self, manifest_file, status_file, threads=0):
+        """Launch a headless Blender process running the background worker.
+
+        Args:
+            manifest_file (str): Manifest the worker should render.
+            status_file (str): Where the worker writes its status.
+            threads (int): Render thread cap passed via ``-t`` (0 = Blender default).
+
+        Returns:
+            subprocess.Popen: The worker process.
+        """
+        # Worker execution code
+        python_code = (
+            f"from rendercue.core import BackgroundWorker; "
+            f"worker = BackgroundWorker({repr(manifest_file)}, {repr(status_file)}); "
+            f"worker.run()"
+        )
+
+        process = subprocess.Popen(build_worker_command(python_code, threads),
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        _bg_processes.append(process)
+        return process
+
+    def start_worker(self, worker_index, manifest_file, status_file):
+        """Start the worker of a slot, as a new process or on its warm daemon.
+
+        Args:
+            worker_index (int): 0-based worker slot.
+            manifest_file (str): Manifest the worker should render.
+            status_file (str): Where the worker writes its status.
+        """
+        if self._use_daemon:
+            daemon = get_worker_daemon(worker_index, self._threads)
+            self._daemon_handles[worker_index] = daemon
+            self._daemon_requests[worker_index] = (manifest_file, status_file)
+            self._daemon_connections[worker_index] = None
+            process = daemon.process
+            events = daemon.events
+            # Leftovers of the daemon's previous batch
+            events.drain()
+            self.send_control(process, {CONTROL_COMMAND: CONTROL_RESUME})
+        else:
+            process = self.spawn_worker(manifest_file, status_file, self._threads)
+            events = WorkerEventReader(process.stdout)
+        self._background_processes[worker_index] = process
+        self._event_readers[worker_index] = events
+        if self._status_channel == 'SHARED_MEMORY':
+            self.open_status_block(worker_index, status_file)
+        self.open_preview_buffer(worker_index, status_file)
+        self._worker_done[worker_index] = False
+        self._worker_started[worker_index] = time.time()
+        self._stall_causes[worker_index] = None
+
+    def send_control(self, process, command):
+        """Write a control command to a worker's stdin (see ``core.WorkerControl``)."""
+        try:
+            process.stdin.write((json.dumps(command) + "\n").encode('utf-8'))
+            process.stdin.flush()
+        except (OSError, ValueError, AttributeError):
+            # Worker already gone, the supervisor deals with it
+            pass
+
+    def pause_workers(self, context, mode):
+        """Pause every worker.
+
+        Args:
+            context (bpy.types.Context): Blender context.
+            mode (str): ``PAUSE_IMMEDIATE`` suspends the processes right away,
+                ``PAUSE_AFTER_FRAME`` lets them finish their frame first and
+                ``PAUSE_RELEASE`` also makes them exit, to be restarted from the
+                resume journal on resume.
+        """
+        if self._pause_mode:
+            return
+        if mode == PAUSE_IMMEDIATE and not hasattr(signal, 'SIGSTOP'):
+            logging.getLogger("RenderCue").info("Processes can't be suspended on this platform, pausing after the current frame")
+            mode = PAUSE_AFTER_FRAME
+        
+        for process in self._background_processes:
+            if process.poll() is not None:
+                continue
+            if mode == PAUSE_IMMEDIATE:
+                try:
+                    os.kill(process.pid, signal.SIGSTOP)
+                except OSError as e:
+                    logging.getLogger("RenderCue").warning(f"Could not suspend worker: {e}")
+            else:
+                self.send_control(process, {CONTROL_COMMAND: CONTROL_PAUSE, CONTROL_MODE: mode})
+        
+        self._pause_mode = mode
+        self._paused_at = time.time()
+        settings = context.window_manager.rendercue
+        settings.is_paused = True
+        settings.progress_message = {
+            PAUSE_IMMEDIATE: "Paused",
+            PAUSE_AFTER_FRAME: "Pausing after the current frame...",
+            PAUSE_RELEASE: "Pausing after the current frame, releasing memory...",
+        }[mode]
+        self._ui_changed = True
+        logging.getLogger("RenderCue").info(f"Pausing workers ({mode})")
+
+    def resume_workers(self, context):
+        """Resume workers paused by ``pause_workers``.
+
+        Suspended processes are continued and told how long they were stopped.
+        Released workers are restarted by ``supervise_workers``.
+        """
+        if not self._pause_mode:
+            return
+        now = time.time()
+        for process in self._background_processes:
+            if process.poll() is not None:
+                continue
+            if self._pause_mode == PAUSE_IMMEDIATE:
+                try:
+                    os.kill(process.pid, signal.SIGCONT)
+                except OSError as e:
+                    logging.getLogger("RenderCue").warning(f"Could not continue worker: {e}")
+                self.send_control(process, {CONTROL_COMMAND: CONTROL_SUSPENDED, CONTROL_SECONDS: now - self._paused_at})
+            else:
+                self.send_control(process, {CONTROL_COMMAND: CONTROL_RESUME})
+        
+        self._pause_mode = None
+        self._resumed_at = now
+        settings = context.window_manager.rendercue
+        settings.is_paused = False
+        settings.progress_message = "Resuming..."
+        self._ui_changed = True
+        logging.getLogger("RenderCue").info(f"Resuming workers (paused for {now - self._paused_at:.1f}s)")
+
+    def apply_queue_request(self, context, action, job_index):
+        """Send a queue edit to every worker and record it in their manifests.
+
+        The manifests are edited as well, so a worker that is restarted later
+        (after a crash or a pause that released memory) renders the edited queue.
+
+        Args:
+            context (bpy.types.Context): Blender context.
+            action (str): SKIP, CANCEL, PRIORITIZE, APPEND or DRAIN.
+            job_index (int): Queue index of the job the edit is about.
+        """
+        settings = context.window_manager.rendercue
+        logger = logging.getLogger("RenderCue")
+        command = {CONTROL_BATCH: self._batch_id}
+        
+        if action == 'DRAIN':
+            if self._draining:
+                return
+            self._draining = True
+            command[CONTROL_COMMAND] = CONTROL_DRAIN
+            # A paused worker has to run to see it
+            self.resume_workers(context)
+            settings.progress_message = "Stopping after the current frame..."
+        
+        elif action == 'APPEND':
+            new_jobs = [StateManager.serialize_job(job) for job in settings.jobs[self._total_jobs:]]
+            if not new_jobs:
+                return
+            if self._status_channel == 'SHARED_MEMORY' and self._total_jobs + len(new_jobs) > self._job_capacity:
+                logger.warning(f"Cannot add {len(new_jobs)} jobs, the status block has room for {self._job_capacity - self._total_jobs} more")
+                settings.progress_message = "Too many new jobs for this batch, render them in the next one"
+                self._ui_changed = True
+                return
+            first_index = self._total_jobs
+            command.update({CONTROL_COMMAND: CONTROL_APPEND_JOBS, CONTROL_JOB: first_index, CONTROL_JOBS: new_jobs})
+            self._total_jobs += len(new_jobs)
+            logger.info(f"Appending {len(new_jobs)} jobs to the running batch")
+        
+        else:
+            if not 0 <= job_index < self._total_jobs:
+                return
+            job = settings.jobs[job_index]
+            if action in ('SKIP', 'CANCEL'):
+                if job.render_status in ('COMPLETED', 'FAILED', 'CANCELLED'):
+                    return
+                command.update({CONTROL_COMMAND: CONTROL_CANCEL_JOB, CONTROL_JOB: job_index})
+                job.render_status = 'CANCELLED'
+                logger.info(f"Cancelling job {job_index + 1}")
+            elif action == 'PRIORITIZE':
+                if job.render_status != 'PENDING':
+                    return
+                command.update({CONTROL_COMMAND: CONTROL_PRIORITIZE_JOB, CONTROL_JOB: job_index})
+                logger.info(f"Rendering job {job_index + 1} next")
+            else:
+                return
+        
+        # Manifests first, a worker started in between then has the edit either way
+        if command[CONTROL_COMMAND] != CONTROL_DRAIN:
+            for manifest_file in self._worker_manifests:
+                try:
+                    with open(manifest_file, 'r') as f:
+                        manifest = json.load(f)
+                    record_queue_edit(manifest, command)
+                    with open(manifest_file, 'w') as f:
+                        json.dump(manifest, f, indent=4)
+                except (OSError, json.JSONDecodeError, ValueError, IndexError) as e:
+                    logger.warning(f"Could not record queue edit in {manifest_file}: {e}")
+        
+        for process in self._background_processes:
+            if process.poll() is None:
+                self.send_control(process, command)
+        self._ui_changed = True
+
+    def open_status_block(self, worker_index, status_file):
+        """Create a fresh status block for a worker, replacing a restarted worker's."""
+        if self._status_blocks[worker_index]:
+            self._status_blocks[worker_index].close()
+            self._status_blocks[worker_index] = None
+        try:
+            # With room for jobs appended while rendering
+            self._status_blocks[worker_index] = StatusBlockReader(status_file, self._total_jobs + STATUS_BLOCK_SPARE_JOBS)
+        except (OSError, ValueError) as e:
+            logging.getLogger("RenderCue").error(f"Cannot create status block for worker {worker_index + 1}: {e}")
+
+    def open_preview_buffer(self, worker_index, status_file):
+        """Create a fresh preview buffer for a worker, replacing a restarted worker's."""
+        if self._preview_buffers[worker_index]:
+            self._preview_buffers[worker_index].close()
+            self._preview_buffers[worker_index] = None
+        try:
+            self._preview_buffers[worker_index] = PreviewBufferReader(status_file)
+        except (OSError, ValueError) as e:
+            # The worker falls back to JPEG previews
+            logging.getLogger("RenderCue").warning(f"Cannot create preview buffer for worker {worker_index + 1}: {e}")
+
+    def supervise_workers(self, context):
+        """Restart workers that crashed before finishing their part of the batch.
+
+        A crashed worker is restarted after a backoff delay with a manifest
+        trimmed to its remaining frames, until its restart budget runs out.
+        """
+        prefs = context.preferences.addons[__package__].preferences
+        now = time.time()
+        
+        for i, process in enumerate(self._background_processes):
+            # Draining: whatever stopped stays stopped
+            if self._draining:
+                self._restart_at[i] = None
+                if self._worker_statuses[i]:
+                    self._worker_statuses[i][STATUS_RELEASED] = False
+                continue
+            
+            # Nothing is (re)started while paused
+            if self._restart_at[i] is not None:
+                if now >= self._restart_at[i] and not self._pause_mode:
+                    self._restart_at[i] = None
+                    self.restart_worker(i)
+                continue
+            
+            # Released on pause, continue from the journal (doesn't use up restarts)
+            if (self._worker_statuses[i] or {}).get(STATUS_RELEASED):
+                if process.poll() is not None and not self._pause_mode:
+                    self.restart_worker(i)
+                    self._worker_statuses[i][STATUS_RELEASED] = False
+                continue
+            
+            # Only look at each dead process once
+            if process.poll() is None or process.returncode == 0 or self._crash_handled[i] is process:
+                continue
+            status = self._worker_statuses[i] or {}
+            if status.get(STATUS_FINISHED):
+                continue
+            self._crash_handled[i] = process
+            self.record_crash(context, i, status, process.returncode)
+            
+            attempts = self._restart_counts[i]
+            if attempts >= prefs.max_worker_restarts:
+                logging.getLogger("RenderCue").error(f"Worker {i + 1} crashed, no restarts left")
+                continue
+            
+            delay = prefs.worker_restart_delay * (2 ** attempts)
+            self._restart_counts[i] += 1
+            self._restart_at[i] = now + delay
+            context.window_manager.rendercue.progress_message = f"Worker crashed, restarting in {delay:.0f}s..."
+            self._ui_changed = True
+            logging.getLogger("RenderCue").warning(
+                f"Worker {i + 1} crashed (code {process.returncode}), restart {attempts + 1}/{prefs.max_worker_restarts} in {delay:.0f}s"
+            )
+
+    def adapt_timer(self, context):
+        """Match the timer interval to how fast frames finish.
+
+        The timer ticks a few times per expected frame, from the workers'
+        median frame times, so fast renders update smoothly while long frames
+        and pauses don't wake Blender up for nothing.
+        """
+        if context.window_manager.rendercue.is_paused:
+            interval = TIMER_MAX_INTERVAL
+        else:
+            # Frames per second of all workers together
+            rate = sum(1.0 / status[STATUS_MEDIAN_FRAME_TIME] for status in self._worker_statuses
+                       if status and status.get(STATUS_MEDIAN_FRAME_TIME))
+            if not rate:
+                return
+            interval = min(TIMER_MAX_INTERVAL, max(TIMER_MIN_INTERVAL, 1.0 / (rate * TIMER_TICKS_PER_FRAME)))
+        
+        # Re-adding the timer has a cost too, ignore small changes
+        if abs(interval - self._timer_interval) < self._timer_interval * 0.25:
+            return
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        self._timer = wm.event_timer_add(interval, window=context.window)
+        self._timer_interval = interval
+
+    def watch_workers(self, context):
+        """Kill workers whose frame hangs, and flag unusually slow frames.
+
+        A worker counts as stalled when its status heartbeat is older than the
+        stall timeout, or its current frame runs past the job's frame timeout.
+        Stalled workers are killed and go through the crash restart path, so
+        the frame is requeued (and dropped if it stalls twice).
+        """
+        if self._pause_mode:
+            return
+        prefs = context.preferences.addons[__package__].preferences
+        jobs = context.window_manager.rendercue.jobs
+        now = time.time()
+        
+        for i, process in enumerate(self._background_processes):
+            if self._worker_done[i] or self._restart_at[i] is not None or process.poll() is not None:
+                continue
+            if self._use_daemon and self._daemon_connections[i] is None:
+                continue
+            status = self._worker_statuses[i]
+            if not status or status.get(STATUS_FINISHED) or not status.get(STATUS_CURRENT_FRAME):
+                continue
+            
+            # Ignore what a previous process of this slot wrote, and time spent paused
+            started = max(self._worker_started[i], self._resumed_at)
+            heartbeat_age = now - max(status.get(STATUS_TIMESTAMP) or 0, started)
+            frame_elapsed = now - max(status.get(STATUS_FRAME_STARTED) or 0, started)
+            job_index, frame = status[STATUS_CURRENT_FRAME]
+            job = jobs[job_index] if job_index < len(jobs) else None
+            
+            cause = None
+            if prefs.stall_timeout > 0 and heartbeat_age > prefs.stall_timeout:
+                cause = f"stalled (no progress for {heartbeat_age:.0f}s)"
+            elif job and job.override_frame_timeout and job.frame_timeout > 0 and frame_elapsed > job.frame_timeout:
+                cause = f"timed out after {frame_elapsed:.0f}s"
+            
+            if cause:
+                self._stall_causes[i] = cause
+                logging.getLogger("RenderCue").warning(f"Worker {i + 1}: job {job_index + 1} frame {frame} {cause}, killing worker")
+                process.kill()
+                context.window_manager.rendercue.progress_message = f"Frame {frame} {cause}"
+                self._ui_changed = True
+                send_webhook(
+                    prefs.webhook_url,
+                    f"Job {job_index + 1}, frame {frame} {cause}. The worker was killed and the frame requeued.",
+                    title="RenderCue: Frame Stalled",
+                    color=0xffa500
+                )
+                continue
+            
+            # Outliers are only flagged, a slow frame is still a frame
+            median = status.get(STATUS_MEDIAN_FRAME_TIME)
+            key = (job_index, frame)
+            if (prefs.slow_frame_factor > 0 and median and key not in self._slow_frames
+                    and frame_elapsed > prefs.slow_frame_factor * median):
+                self._slow_frames.add(key)
+                note = f"Frame {frame} is slow ({frame_elapsed:.0f}s, median {median:.0f}s)"
+                if job:
+                    job.error_message = note
+                    self._ui_changed = True
+                logging.getLogger("RenderCue").warning(f"Job {job_index + 1}: {note}")
+
+    def check_disk_pauses(self, context):
+        """Pause the batch when a worker paused itself because its output drive is nearly full.
+
+        Workers count these pauses in their status. The worker that ran out of
+        room waits on its own, the others are paused here so the user can free
+        up space and resume them all.
+        """
+        prefs = context.preferences.addons[__package__].preferences
+        for i, status in enumerate(self._worker_statuses):
+            count = (status or {}).get(STATUS_DISK_PAUSES, 0)
+            if count == self._disk_pauses[i]:
+                continue
+            # A restarted worker counts from zero again
+            self._disk_pauses[i] = count
+            if not count:
+                continue
+            message = status.get(STATUS_MESSAGE) or "Paused: output drive is full"
+            logging.getLogger("RenderCue").warning(f"Worker {i + 1}: {message}")
+            self.pause_workers(context, PAUSE_AFTER_FRAME)
+            context.window_manager.rendercue.progress_message = message
+            self._ui_changed = True
+            if prefs.show_notifications:
+                show_notification("RenderCue Paused", message)
+            send_webhook(
+                prefs.webhook_url,
+                f"{message}. Free up space and resume the batch.",
+                title="RenderCue: Output Drive Full",
+                color=0xffa500
+            )
+
+    def record_crash(self, context, worker_index, status, returncode):
+        """Note a worker crash on the job it was rendering.
+
+        A frame that takes the worker down twice (crash or stall) is dropped
+        from the restart, so one broken frame can't burn the whole restart budget.
+        """
+        cause = self._stall_causes[worker_index] or f"crashed (code {returncode})"
+        self._stall_causes[worker_index] = None
+        current = status.get(STATUS_CURRENT_FRAME)
+        if not current:
+            return
+        
+        job_index, frame = current
+        key = (job_index, frame)
+        self._crash_counts[key] = self._crash_counts.get(key, 0) + 1
+        
+        if self._crash_counts[key] >= 2:
+            self._dropped_frames.setdefault(job_index, set()).add(frame)
+            note = f"Frame {frame} skipped, it took the worker down {self._crash_counts[key]} times (last: {cause})"
+        else:
+            note = f"Worker restarted after frame {frame} {cause}"
+        
+        jobs = context.window_manager.rendercue.jobs
+        if job_index < len(jobs):
+            jobs[job_index].error_message = note
+            self._ui_changed = True
+        logging.getLogger("RenderCue").warning(f"Job {job_index + 1}: {note}")
+
+    def restart_worker(self, worker_index):
+        """Restart a crashed worker on the frames it has left."""
+        manifest_file = self.write_restart_manifest(worker_index)
+        if not manifest_file:
+            return
+        
+        # Let the restarted worker (or any other) take over jobs the dead one claimed
+        status_dir, status_name = os.path.split(self._status_files[worker_index])
+        for claim_file in glob.glob(os.path.join(status_dir, f"{JOB_CLAIM_FILENAME_PREFIX}*")):
+            try:
+                with open(claim_file, 'r') as f:
+                    owner = f.read().strip()
+                if owner == status_name:
+                    os.remove(claim_file)
+            except OSError:
+                pass
+        
+        self.start_worker(worker_index, manifest_file, self._status_files[worker_index])
+        if self._use_daemon:
+            self.dispatch_to_daemons()
+
+    def write_restart_manifest(self, worker_index):
+        """Write a manifest holding only the frames a crashed worker has left.
+
+        Every job gets an explicit frame list with the frames originally assigned
+        to the worker (its shard, if sharded), minus dropped frames. Frames found
+        in the resume journal are marked completed so progress carries over.
+
+        Returns:
+            str or None: Path of the new manifest, or None if it couldn't be written.
+        """
+        try:
+            with open(self._worker_manifests[worker_index], 'r') as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.getLogger("RenderCue").error(f"Cannot restart worker {worker_index + 1}: {e}")
+            return None
+        
+        jobs = manifest.get(MANIFEST_JOBS, [])
+        journaled = read_journal(self._journal_path, [job.get(JOB_SCENE_NAME) for job in jobs])
+        shard_index, shard_count = release_shard(manifest)
+        
+        for job_index, job in enumerate(jobs):
+            scene = bpy.data.scenes.get(job.get(JOB_SCENE_NAME) or "")
+            if not scene:
+                continue
+            frames = get_job_frame_list(job, scene)
+            try:
+                resumed = set(parse_frame_list(job.get(JOB_COMPLETED_FRAMES) or "")).intersection(frames)
+            except ValueError:
+                resumed = set()
+            
+            # Same split the worker did, resumed frames are accounted to the first shard
+            assigned = set([f for f in frames if f not in resumed][shard_index::shard_count])
+            if shard_index == 0:
+                assigned |= resumed
+            done = resumed.union(journaled.get(job_index, set())).intersection(assigned)
+            dropped = self._dropped_frames.get(job_index, set())
+            
+            job[JOB_FRAME_LIST] = format_frame_list(assigned - dropped)
+            job[JOB_COMPLETED_FRAMES] = format_frame_list(done)
+        
+        # Carry the paused time over, including the time a released worker was gone
+        status = self._worker_statuses[worker_index] or {}
+        paused = status.get(STATUS_PAUSED_DURATION, 0.0)
+        if status.get(STATUS_RELEASED):
+            paused += max(0.0, time.time() - (status.get(STATUS_TIMESTAMP) or time.time()))
+        manifest[MANIFEST_PAUSED_DURATION] = paused
+        
+        base, ext = os.path.splitext(self._manifest_file)
+        manifest_file = f"{base}_restart_{worker_index}{ext}"
+        try:
+            with open(manifest_file, 'w') as f:
+                json.dump(manifest, f, indent=4)
+        except OSError as e:
+            logging.getLogger("RenderCue").error(f"Cannot restart worker {worker_index + 1}: {e}")
+            return None
+        return manifest_file
+
+    def dispatch_to_daemons(self):
+        """Send pending batches to daemons that have finished starting up."""
+        for i, request in enumerate(self._daemon_requests):
+            if request is None or self._worker_done[i]:
+                continue
+            try:
+                conn = self._daemon_handles[i].send_render(*request)
+            except (OSError, EOFError) as e:
+                logging.getLogger("RenderCue").error(f"Could not reach worker daemon {i + 1}: {e}")
+                self._daemon_handles[i].shutdown()
+                self._worker_done[i] = True
+                continue
+            if conn is not None:
+                self._daemon_connections[i] = conn
+                self._daemon_requests[i] = None
+                self._worker_started[i] = time.time()
+
+    def is_worker_done(self, worker_index):
+        """Check whether a worker has finished its part of the batch.
+
+        Plain workers are done when their process exits. Daemons stay alive
+        and report back over their connection instead.
+        """
+        if self._restart_at[worker_index] is not None:
+            return False
+        # Released on pause, it's restarted on resume
+        if (self._worker_statuses[worker_index] or {}).get(STATUS_RELEASED):
+            return False
+        if self._worker_done[worker_index]:
+            return True
+        if self._background_processes[worker_index].poll() is not None:
+            # Wait for the reader to see EOF, so the last events aren't lost
+            reader = self._event_readers[worker_index]
+            if not self._use_daemon and reader.thread.is_alive():
+                return False
+            self._worker_done[worker_index] = True
+            return True
+
+        conn = self._daemon_connections[worker_index] if self._use_daemon else None
+        if conn is not None:
+            try:
+                if conn.poll():
+                    conn.recv()
+                    self._worker_done[worker_index] = True
+            except (EOFError, OSError):
+                self._worker_done[worker_index] = True
+        return self._worker_done[worker_index]
+
+    def close_daemon_connections(self):
+        """Close connections to daemons (the daemons themselves stay warm)."""
+        for conn in self._daemon_connections:
+            if conn is not None:
+                try:
+                    conn.close()
+                except OSError:
+                    pass
+        self._daemon_connections = [None] * len(self._daemon_connections)
+
     def execute(self, context):
         """Initialize and start the background render process."""
         wm = context.window_manager
@@ -190,6 +1360,7 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
         # Reset state
         self._last_preview_path = None
         self._last_finished_frames = -1
+        self._preview_mtime = None
             
         if not bpy.data.filepath:
             self.report({'ERROR'}, "Please save the file before rendering")
@@ -222,58 +1393,143 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
         # Setup Paths
         temp_dir = bpy.app.tempdir
         self._manifest_file = os.path.join(temp_dir, MANIFEST_FILENAME)
-        self._status_file = os.path.join(temp_dir, STATUS_FILENAME)
-        
-        # Cleanup old pause signal
-        pause_file = os.path.join(temp_dir, PAUSE_SIGNAL_FILENAME)
-        if os.path.exists(pause_file):
-            try:
-                os.remove(pause_file)
-                logging.getLogger("RenderCue").info("Cleaned up stale pause signal")
-            except OSError:
-                pass
+        status_file = os.path.join(temp_dir, STATUS_FILENAME)
         
         # Reset Pause State
         context.window_manager.rendercue.is_paused = False
+        context.window_manager.rendercue.pause_request = 'NONE'
+        self._pause_mode = None
+        self._resumed_at = 0.0
+        self._draining = False
+        _queue_requests.clear()
         
         # Save Manifest
         StateManager.save_state(context, self._manifest_file)
         
-        # Spawn Process
-        blend_file = bpy.data.filepath
+        # Parallel Workers: either each one renders every Nth frame of every job,
+        # or they share the queue and claim whole jobs as they free up
+        prefs = context.preferences.addons[__package__].preferences
+        worker_count = max(1, prefs.worker_count)
+        self._parallel_mode = prefs.parallel_mode
+        threads = 0
+        if worker_count > 1:
+            threads = prefs.threads_per_worker or max(1, (os.cpu_count() or 1) // worker_count)
+            
+        with open(self._manifest_file, 'r') as f:
+            manifest = json.load(f)
         
-        # Build Python expression to run worker directly
-        # Add addon directory to sys.path so it can be imported
-        addon_dir = os.path.dirname(os.path.dirname(__file__))
+        # Resume Journal: a fresh start forgets the previous batch, a resume skips its frames
+        journal_path = get_journal_path(bpy.data.filepath)
+        if self.resume:
+            jobs = manifest.get(MANIFEST_JOBS, [])
+            completed = read_journal(journal_path, [job.get(JOB_SCENE_NAME) for job in jobs])
+            for job_index, frames in completed.items():
+                jobs[job_index][JOB_COMPLETED_FRAMES] = format_frame_list(frames)
+            logging.getLogger("RenderCue").info(
+                f"Resuming batch: {sum(len(f) for f in completed.values())} frames already rendered"
+            )
+        elif os.path.exists(journal_path):
+            try:
+                os.remove(journal_path)
+            except OSError as e:
+                logging.getLogger("RenderCue").warning(f"Could not clear resume journal: {e}")
+        manifest[MANIFEST_JOURNAL_PATH] = journal_path
+        # Tags queue edits, so a warm daemon never applies them to its next batch
+        self._batch_id = secrets.token_hex(8)
+        manifest[MANIFEST_BATCH_ID] = self._batch_id
+        with open(self._manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=4)
         
-        # Build command: blender -b <file> --python-expr <worker code>
-        cmd = [bpy.app.binary_path, "-b", blend_file]
+        # Release job claims left over from a previous pool render
+        for claim_file in glob.glob(os.path.join(temp_dir, f"{JOB_CLAIM_FILENAME_PREFIX}*")):
+            try:
+                os.remove(claim_file)
+            except OSError:
+                pass
+        
+        self._background_processes = [None] * worker_count
+        self._status_files = []
+        self._worker_manifests = []
+        self._worker_statuses = [None] * worker_count
+        self._event_readers = [None] * worker_count
+        self._status_blocks = [None] * worker_count
+        self._preview_buffers = [None] * worker_count
+        self._status_watcher = None
+        self._ui_changed = False
+        self._changed_jobs = set()
+        self._status_channel = prefs.status_channel
+        self._total_jobs = len(manifest.get(MANIFEST_JOBS, []))
+        self._job_capacity = self._total_jobs + STATUS_BLOCK_SPARE_JOBS
+        self._worker_done = [False] * worker_count
+        self._daemon_handles = [None] * worker_count
+        self._daemon_requests = [None] * worker_count
+        self._daemon_connections = [None] * worker_count
+        self._restart_counts = [0] * worker_count
+        self._restart_at = [None] * worker_count
+        self._crash_handled = [None] * worker_count
+        self._worker_started = [0] * worker_count
+        self._stall_causes = [None] * worker_count
+        self._slow_frames = set()
+        self._disk_pauses = [0] * worker_count
+        self._crash_counts = {}
+        self._dropped_frames = {}
+        self._journal_path = journal_path
+        self._threads = threads
+        _bg_processes.clear()
+        
+        # Warm Workers: reuse resident daemons that already have the file loaded
+        self._use_daemon = prefs.use_worker_daemon
+        if self._use_daemon:
+            shutdown_daemons(keep=worker_count)
+        else:
+            shutdown_daemons()
+        
+        for worker_index in range(worker_count):
+            manifest_file = get_worker_path(self._manifest_file, worker_index, worker_count)
+            worker_status_file = get_worker_path(status_file, worker_index, worker_count)
             
-        # Worker execution code
-        python_code = (
-            f"import sys; "
-            f"sys.path.insert(0, {repr(addon_dir)}); "
-            f"from rendercue.core import BackgroundWorker; "
-            f"worker = BackgroundWorker({repr(self._manifest_file)}, {repr(self._status_file)}); "
-            f"worker.run()"
-        )
+            if worker_count > 1:
+                if self._parallel_mode == 'JOBS':
+                    manifest[MANIFEST_JOB_POOL] = True
+                else:
+                    manifest[MANIFEST_SHARD_INDEX] = worker_index
+                    manifest[MANIFEST_SHARD_COUNT] = worker_count
+                with open(manifest_file, 'w') as f:
+                    json.dump(manifest, f, indent=4)
+            
+            # Never pick up the status of a previous batch
+            if os.path.exists(worker_status_file):
+                try:
+                    os.remove(worker_status_file)
+                except OSError:
+                    pass
+            
+            self._status_files.append(worker_status_file)
+            self._worker_manifests.append(manifest_file)
+            self.start_worker(worker_index, manifest_file, worker_status_file)
         
-        cmd.append("--python-expr")
-        cmd.append(python_code)
+        if self._status_channel == 'FILE':
+            self._status_watcher = StatusFileWatcher(self._status_files)
         
-        global _bg_process
-        self._background_process = subprocess.Popen(cmd)
-        _bg_process = self._background_process
+        if self._use_daemon:
+            # Warm daemons start right away, new ones are picked up by modal()
+            self.dispatch_to_daemons()
+        
+        if worker_count > 1:
+            mode_label = "job pool" if self._parallel_mode == 'JOBS' else "frame shards"
+            logging.getLogger("RenderCue").info(f"Started {worker_count} render workers as {mode_label} ({threads} threads each)")
         
         context.window_manager.rendercue.is_rendering = True
         context.window_manager.rendercue.total_jobs_count = len(context.window_manager.rendercue.jobs)
+        context.window_manager.rendercue.worker_count = worker_count
         context.window_manager.rendercue.progress_message = "Starting Background Render..."
         
         # Track start time
         self._start_time = time.time()
         
         wm.modal_handler_add(self)
-        self._timer = wm.event_timer_add(1.0, window=context.window)
+        self._timer_interval = TIMER_DEFAULT_INTERVAL
+        self._timer = wm.event_timer_add(self._timer_interval, window=context.window)
         return {'RUNNING_MODAL'}
 
     def finish(self, context):
@@ -282,6 +1538,19 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
         prefs = context.preferences.addons[__package__].preferences
         settings = context.window_manager.rendercue
         
+        self.close_daemon_connections()
+        for block in self._status_blocks:
+            if block:
+                block.close()
+        self._status_blocks = []
+        for buffer in self._preview_buffers:
+            if buffer:
+                buffer.close()
+        self._preview_buffers = []
+        if self._status_watcher:
+            self._status_watcher.stop()
+            self._status_watcher = None
+        
         # Clean up timer and progress bar
         if self._timer:
             wm.event_timer_remove(self._timer)
@@ -290,6 +1559,11 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
         
         # Reset rendering state
         settings.is_rendering = False
+        if self._draining:
+            # Whatever didn't finish is left for Resume Batch
+            for job in settings.jobs:
+                if job.render_status == 'RENDERING':
+                    job.render_status = 'PENDING'
         # Generate summary (only if jobs were actually rendered)
         if len(settings.jobs) > 0:
             total_jobs = len(settings.jobs)
@@ -331,6 +1605,19 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
 
             settings.summary_output_path = actual_output_path
             
+            # Output size, with the projection for frames that weren't rendered
+            written = sum((s or {}).get(STATUS_OUTPUT_BYTES, 0) for s in self._worker_statuses)
+            projected = sum((s or {}).get(STATUS_PROJECTED_BYTES, 0) for s in self._worker_statuses)
+            output_size = format_bytes(written)
+            if projected > written:
+                output_size += f" of {format_bytes(projected)} projected"
+            try:
+                output_size += f", {format_bytes(get_free_bytes(actual_output_path))} free"
+            except OSError:
+                pass
+            settings.summary_output_size = output_size
+            logging.getLogger("RenderCue").info(f"Output: {output_size}")
+            
             # Store completion timestamp for Status Bar
             settings.completion_statusbar_timestamp = time.time()
             
@@ -370,75 +1657,185 @@ class RENDERCUE_OT_batch_render(bpy.types.Operator):
             frames = context.window_manager.rendercue.finished_frames_count
             
             msg = f"File: {filename}\nFrames: {frames}\nTime: {time_str}"
-            show_notification("RenderCue Complete", msg)
+            show_notification("RenderCue Stopped" if self._draining else "RenderCue Complete", msg)
             
         # Update Status
         if not self._stop: # Only if not cancelled/error
             # Check return code for unexpected crashes
-            if self._background_process and self._background_process.returncode != 0:
+            crash_codes = [p.returncode for p in self._background_processes if p.returncode not in (None, 0)]
+            if crash_codes:
                  context.window_manager.rendercue.last_render_status = 'FAILED'
-                 context.window_manager.rendercue.last_render_message = f"Process crashed (Code {self._background_process.returncode})"
+                 context.window_manager.rendercue.last_render_message = f"Process crashed (Code {crash_codes[0]})"
                  # Override notification if it was generic success
                  if prefs.show_notifications:
-                     show_notification("RenderCue Failed", f"Background process crashed with code {self._background_process.returncode}")
+                     show_notification("RenderCue Failed", f"Background process crashed with code {crash_codes[0]}")
+            elif self._draining:
+                # Finished frames are in the resume journal, the rest is still to render
+                remaining = sum(1 for j in settings.jobs if j.render_status == 'PENDING')
+                context.window_manager.rendercue.last_render_status = 'STOPPED'
+                context.window_manager.rendercue.last_render_message = "Stopped after current frame, use Resume Batch to continue"
+                logging.getLogger("RenderCue").info(f"Batch stopped after the current frame, {remaining} jobs left to resume")
             else:
                 context.window_manager.rendercue.last_render_status = 'SUCCESS'
                 context.window_manager.rendercue.last_render_message = "Finished successfully"
+                notes = []
+                restarts = sum(self._restart_counts)
+                if restarts:
+                    notes.append(f"{restarts} worker restarts")
+                sync_saved = sum((s or {}).get(STATUS_SYNC_SAVED, 0) for s in self._worker_statuses)
+                if sync_saved >= 1:
+                    notes.append(f"scene grouping saved {sync_saved:.0f}s of sync")
+                    logging.getLogger("RenderCue").info(f"Scene grouping saved {sync_saved:.1f}s of scene sync")
+                copy_times = [s[STATUS_COPY_TIME] for s in self._worker_statuses if s and s.get(STATUS_COPY_TIME) is not None]
+                if copy_times:
+                    notes.append(f"frames copied out in {max(copy_times):.1f}s")
+                    logging.getLogger("RenderCue").info(f"Median copy time per frame: {max(copy_times):.2f}s (slowest worker)")
+                if notes:
+                    context.window_manager.rendercue.last_render_message += f" ({', '.join(notes)})"
+                
+                # Nothing left to resume
+                if all(j.render_status == 'COMPLETED' for j in settings.jobs):
+                    try:
+                        os.remove(get_journal_path(bpy.data.filepath))
+                    except OSError:
+                        pass
+                
+                if len(self._background_processes) > 1 and self._parallel_mode == 'FRAMES':
+                    self.renumber_sharded_output()
+
+    def renumber_sharded_output(self):
+        """Build the renumbered link views of frame step output once every shard has finished.
+
+        Parallel workers cannot build them per job themselves because each one
+        only holds part of the sequence.
+        """
+        try:
+            with open(self._manifest_file, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.getLogger("RenderCue").error(f"Renumbering failed: {e}")
+            return
+            
+        # Renamed output is numbered sequentially as it renders, only link views are left
+        if not builds_link_view(manifest):
+            return
+            
+        for i, job in enumerate(manifest.get(MANIFEST_JOBS, [])):
+            scene = bpy.data.scenes.get(job.get(JOB_SCENE_NAME) or "")
+            if not scene:
+                continue
+            frame_start, frame_end, frame_step = get_job_frame_range(job, scene)
+            if frame_step <= 1:
+                continue
+            try:
+                output_dir = get_job_output_dir(manifest, i, bpy.data.filepath)
+                renumber_sequence(output_dir, f"{scene.name}_", frame_start,
+                                  frames=range(frame_start, frame_end + 1, frame_step),
+                                  mode=manifest[MANIFEST_RENUMBER_MODE])
+            except (RenumberError, OSError) as e:
+                logging.getLogger("RenderCue").error(f"Renumbering failed: {e}")
 
     def update_preview(self, context, filepath):
         """Update the preview image in the UI.
 
+        Thumbnails from a worker's preview buffer are copied straight into the
+        preview, no file is read or decoded. JPEG previews (from workers
+        without a buffer) are reloaded when the file was rewritten. Either
+        way the preview keeps one fixed key.
+
         Args:
             context (bpy.types.Context): Blender context.
-            filepath (str): Path to the preview image file.
+            filepath (str): Path to the preview buffer or image file.
+
+        Returns:
+            bool: True if the preview changed.
         """
-        if not filepath or not os.path.exists(filepath):
-            return
-            
         settings = context.window_manager.rendercue
-        # Update UI Preview Collection
         try:
             from . import ui
-            if "main" in ui.preview_collections:
-                pcoll = ui.preview_collections["main"]
-                
-                # Dynamic Key Strategy:
-                # Force UI update by using a new key every time.
-                # This defeats Blender's icon caching mechanism.
-                old_key = settings.preview_icon_key
-                new_key = f"thumbnail_{int(time.time() * 1000)}"
-                
-                # Load new preview
-                pcoll.load(new_key, filepath, 'IMAGE')
-                
-                # Update property so UI knows what to show
-                settings.preview_icon_key = new_key
-                settings.has_preview_image = True
-                
-                # Cleanup old key to prevent memory leaks
-                if old_key and old_key in pcoll and old_key != new_key:
-                    del pcoll[old_key]
-                
-                # Periodic full cleanup every 100 frames to prevent memory accumulation
-                if settings.finished_frames_count % 100 == 0 and settings.finished_frames_count > 0:
-                    # Keep only the current preview
-                    current_key = settings.preview_icon_key
-                    keys_to_remove = [k for k in pcoll.keys() if k != current_key and k.startswith('thumbnail_')]
-                    for key in keys_to_remove:
-                        del pcoll[key]
-                    logging.getLogger("RenderCue").debug(f"Cleaned up {len(keys_to_remove)} old preview thumbnails")
+            pcoll = ui.preview_collections.get(UI_PREVIEW_COLLECTION_KEY)
+            if pcoll is None:
+                return False
+            
+            if filepath.endswith(PREVIEW_BUFFER_SUFFIX):
+                buffer = next((b for b in self._preview_buffers if b and b.path == filepath), None)
+                thumbnail = buffer.read() if buffer else None
+                if thumbnail is None:
+                    return False
+                width, height, pixels = thumbnail
+                preview = pcoll.get(UI_PREVIEW_IMAGE_KEY) or pcoll.new(UI_PREVIEW_IMAGE_KEY)
+                preview.image_size = (width, height)
+                # One packed RGBA int per pixel, the same layout as the buffer
+                preview.image_pixels.foreach_set(np.frombuffer(pixels, dtype=np.int32))
+            else:
+                # The preview policy may skip frames, only reload a preview that was rewritten
+                try:
+                    preview_mtime = os.stat(filepath).st_mtime_ns
+                except OSError:
+                    return False
+                if preview_mtime == self._preview_mtime:
+                    return False
+                self._preview_mtime = preview_mtime
+                if UI_PREVIEW_IMAGE_KEY in pcoll:
+                    del pcoll[UI_PREVIEW_IMAGE_KEY]
+                pcoll.load(UI_PREVIEW_IMAGE_KEY, filepath, 'IMAGE', force_reload=True)
+            
+            # Update property so UI knows what to show
+            settings.preview_icon_key = UI_PREVIEW_IMAGE_KEY
+            settings.has_preview_image = True
+            return True
                     
         except Exception as e:
             logging.getLogger("RenderCue").error(f"Preview Collection Error: {e}")
-        
-        # Force UI redraw
-        for window in context.window_manager.windows:
-            for area in window.screen.areas:
-                if area.type in {'PROPERTIES', 'VIEW_3D'}:
-                    area.tag_redraw()
+            return False
+
+class RENDERCUE_OT_queue_command(bpy.types.Operator):
+    """Edit the queue of the running batch."""
+    bl_idname = "rendercue.queue_command"
+    bl_label = "Edit Running Queue"
+    bl_description = "Change the queue of the running batch"
+    bl_options = {'REGISTER'}
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('SKIP', "Skip Job", "Stop the job that is rendering after its current frame and go on with the next one"),
+            ('CANCEL', "Cancel Job", "Take the selected job out of the batch. If it is rendering, it stops after its current frame"),
+            ('PRIORITIZE', "Render Next", "Render the selected job as soon as a worker is free"),
+            ('APPEND', "Add to Batch", "Render the jobs added to the queue since the batch started"),
+            ('DRAIN', "Finish Frame & Stop", "Stop once the frames being rendered are written. Resume Batch continues from there"),
+        ],
+        options={'SKIP_SAVE'}
+    )
+
+    @classmethod
+    def poll(cls, context):
+        """Check if operator can run."""
+        return context.window_manager.rendercue.is_rendering
+
+    @classmethod
+    def description(cls, context, properties):
+        """Describe the chosen action."""
+        items = cls.bl_rna.properties['action'].enum_items
+        return items[properties.action].description
+
+    def execute(self, context):
+        """Queue the edit for the render operator."""
+        settings = context.window_manager.rendercue
+        if self.action == 'SKIP' and settings.worker_count > 1:
+            # Every worker renders its own job, there is no single current job to skip
+            self.report({'WARNING'}, "Skip Job needs a single worker, cancel the job in the queue instead")
+            return {'CANCELLED'}
+        job_index = settings.current_job_index if self.action == 'SKIP' else settings.active_job_index
+        _queue_requests.append((self.action, job_index))
+        return {'FINISHED'}
+
 
 def register():
     bpy.utils.register_class(RENDERCUE_OT_batch_render)
+    bpy.utils.register_class(RENDERCUE_OT_queue_command)
 
 def unregister():
+    shutdown_daemons()
+    bpy.utils.unregister_class(RENDERCUE_OT_queue_command)
     bpy.utils.unregister_class(RENDERCUE_OT_batch_render)
@@ -0,0 +1,393 @@
+"""
+RenderCue Renumber Module
+
+This module closes the gaps frame step leaves in an output sequence:
+- Lists the output folder in one os.scandir pass and keeps the original padding
+- Plans every rename up front and refuses to overwrite files it doesn't own
+- Journals the plan next to the frames, so an interrupted renumbering is
+  rolled back or replayed instead of leaving temp files behind
+- Can build a view of hard or symbolic links instead of moving the frames
+- Numbers stepped frames sequentially at render time, with a sidecar map
+  back to the source frames, so most output never needs renumbering
+
+Kept free of bpy so it can run in workers and the UI alike.
+"""
+
+import json
+import logging
+import os
+
+from .constants import (
+    RENUMBER_MOVE, RENUMBER_SYMLINK,
+    RENUMBER_JOURNAL_FILENAME, RENUMBER_TEMP_PREFIX, RENUMBER_VIEW_DIRNAME,
+    RENUMBER_MAP_SUFFIX, MANIFEST_RENUMBER_OUTPUT, MANIFEST_RENUMBER_MODE,
+    MANIFEST_SEQUENTIAL_NAMES, MANIFEST_RENUMBER_VIEW, MANIFEST_SHARD_INDEX,
+    MANIFEST_SHARD_COUNT
+)
+
+# Journal phases of a move: sources are being moved to temp names, or temp names to targets
+_STAGING = "staging"
+_FINISHING = "finishing"
+
+
+class RenumberError(Exception):
+    """Raised when a renumbering can't be planned or carried out safely."""
+
+
+def get_renumber_flags(enabled, mode):
+    """Split the renumber preference into what the workers do with it.
+
+    Args:
+        enabled (bool): Whether frame step output is renumbered.
+        mode (str): RENUMBER_MOVE, RENUMBER_SYMLINK or RENUMBER_HARDLINK.
+
+    Returns:
+        dict: Manifest entries for naming frames sequentially at render time
+        and for building a view of links after the job.
+    """
+    return {
+        MANIFEST_SEQUENTIAL_NAMES: bool(enabled) and mode == RENUMBER_MOVE,
+        MANIFEST_RENUMBER_VIEW: bool(enabled) and mode != RENUMBER_MOVE,
+    }
+
+
+def uses_sequential_names(manifest):
+    """Check whether a manifest's stepped frames are saved under sequential numbers."""
+    if MANIFEST_SEQUENTIAL_NAMES in manifest:
+        return manifest[MANIFEST_SEQUENTIAL_NAMES]
+    # Manifests written before the flags were split
+    return get_renumber_flags(manifest.get(MANIFEST_RENUMBER_OUTPUT, False),
+                              manifest.get(MANIFEST_RENUMBER_MODE, RENUMBER_MOVE))[MANIFEST_SEQUENTIAL_NAMES]
+
+
+def builds_link_view(manifest):
+    """Check whether a renumbered view of links is built after a manifest's jobs."""
+    if MANIFEST_RENUMBER_VIEW in manifest:
+        return manifest[MANIFEST_RENUMBER_VIEW]
+    return get_renumber_flags(manifest.get(MANIFEST_RENUMBER_OUTPUT, False),
+                              manifest.get(MANIFEST_RENUMBER_MODE, RENUMBER_MOVE))[MANIFEST_RENUMBER_VIEW]
+
+
+def get_output_frame(manifest, frame, frame_start, frame_step):
+    """Get the number a frame of a job is saved under, as the worker names it."""
+    if frame_step > 1 and uses_sequential_names(manifest):
+        return get_sequential_frame(frame, frame_start, frame_step)
+    return frame
+
+
+def release_shard(manifest):
+    """Take the shard split out of a manifest, for a worker restarted with its frames listed.
+
+    The restarted worker names frames like its sibling shards, which are still
+    writing into the same sequences. Only the link view is left to the UI,
+    which builds it once every shard is done.
+
+    Returns:
+        tuple: (shard index, shard count) the worker had.
+    """
+    shard_index = manifest.pop(MANIFEST_SHARD_INDEX, 0)
+    shard_count = manifest.pop(MANIFEST_SHARD_COUNT, 1)
+    manifest[MANIFEST_SEQUENTIAL_NAMES] = uses_sequential_names(manifest)
+    manifest[MANIFEST_RENUMBER_VIEW] = builds_link_view(manifest) and shard_count <= 1
+    return shard_index, shard_count
+
+
+def get_sequential_frame(frame, frame_start, frame_step):
+    """Get the gap-free number a frame of a stepped sequence is saved under.
+
+    Frame ``frame_start + n * frame_step`` becomes ``frame_start + n``, so
+    parallel workers and resumed batches agree on the names on their own.
+    """
+    return frame_start + (frame - frame_start) // frame_step
+
+
+def get_frame_map_path(output_dir, name_prefix):
+    """Get the path of the sidecar that marks a sequence as sequentially numbered."""
+    return os.path.join(output_dir, name_prefix + RENUMBER_MAP_SUFFIX)
+
+
+def get_renumber_frames(output_dir, name_prefix, frame_start, frame_end, frame_step):
+    """Get the file numbers of a stepped sequence that renumbering should take.
+
+    Output named sequentially at render time has a frame map next to it and
+    is left alone. Without one the files carry their source frame numbers,
+    whatever the renumber preference says now.
+
+    Returns:
+        range or None: The source frames, None if the output is already sequential.
+    """
+    if os.path.exists(get_frame_map_path(output_dir, name_prefix)):
+        return None
+    return range(frame_start, frame_end + 1, frame_step)
+
+
+def write_frame_map(output_dir, name_prefix, frame_start, frame_end, frame_step):
+    """Write the sidecar that maps sequential frame numbers to source frames.
+
+    Workers rendering the same job write identical content, so the file is
+    simply replaced.
+
+    Args:
+        output_dir (str): Output directory of the job.
+        name_prefix (str): Part of the file name before the frame number (e.g. "Scene_").
+        frame_start (int): First frame of the job.
+        frame_end (int): Last frame of the job.
+        frame_step (int): Frame step of the job.
+
+    Returns:
+        str: Path of the sidecar.
+    """
+    path = get_frame_map_path(output_dir, name_prefix)
+    frames = range(frame_start, frame_end + 1, frame_step)
+    data = {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "frame_step": frame_step,
+        "frames": {str(get_sequential_frame(frame, frame_start, frame_step)): frame for frame in frames},
+    }
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=1)
+    os.replace(temp_path, path)
+    return path
+
+
+def list_names(output_dir):
+    """List the entry names of a folder in one streaming pass.
+
+    Entry types are left alone: on network shares every type check can cost
+    a round trip, and folders named like frames don't occur in practice.
+    """
+    with os.scandir(output_dir) as entries:
+        return [entry.name for entry in entries]
+
+
+def scan_sequence(names, name_prefix, frames=None):
+    """Find the frame files of a sequence.
+
+    Args:
+        names (list): Entry names of the output folder, from ``list_names``.
+        name_prefix (str): Part of the file name before the frame number (e.g. "Scene_").
+        frames (iterable, optional): Only take files of these frame numbers.
+
+    Returns:
+        dict: Per file extension, a list of (frame, file name, digits) tuples
+        sorted by frame.
+    """
+    prefix_length = len(name_prefix)
+    # Ranges answer membership tests without building a set
+    wanted = frames if frames is None or isinstance(frames, range) else set(frames)
+    sequences = {}
+    # Plain string checks, a regex per entry is the slow part on huge folders
+    for name in names:
+        if not name.startswith(name_prefix):
+            continue
+        digits, dot, ext = name[prefix_length:].partition(".")
+        if not dot or not digits.isdigit() or "." in ext:
+            continue
+        frame = int(digits)
+        if wanted is not None and frame not in wanted:
+            continue
+        sequences.setdefault(dot + ext, []).append((frame, name, len(digits)))
+    for files in sequences.values():
+        files.sort()
+    return sequences
+
+
+def detect_padding(files):
+    """Get the zero padding of a sequence (numbers wider than it just grow)."""
+    return min(digits for _, _, digits in files) if files else 4
+
+
+def plan_renumber(output_dir, name_prefix, start_frame, frames=None):
+    """Plan the renames that make a sequence contiguous from its start frame.
+
+    Args:
+        output_dir (str): Directory containing the rendered files.
+        name_prefix (str): Part of the file name before the frame number.
+        start_frame (int): Number of the first frame after renumbering.
+        frames (iterable, optional): Only take files of these frame numbers.
+
+    Returns:
+        list: (source name, target name) pairs, files that keep their name left out.
+
+    Raises:
+        RenumberError: If a target name is taken by a file outside the sequence.
+    """
+    names = list_names(output_dir)
+    renames = []
+    for ext, files in scan_sequence(names, name_prefix, frames).items():
+        target_name = f"{name_prefix}{{:0{detect_padding(files)}d}}{ext}".format
+        for target_frame, (_, name, _) in enumerate(files, start_frame):
+            target = target_name(target_frame)
+            if target != name:
+                renames.append((name, target))
+
+    # Targets may only replace files that are moved away themselves
+    sources = {source for source, _ in renames}
+    taken = set(names).difference(sources)
+    for _, target in renames:
+        if target in taken:
+            raise RenumberError(f"{target} already exists in {output_dir}")
+    return renames
+
+
+def _journal_path(output_dir):
+    return os.path.join(output_dir, RENUMBER_JOURNAL_FILENAME)
+
+
+def _write_journal(output_dir, journal):
+    path = _journal_path(output_dir)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(journal, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def _move(output_dir, source, target):
+    """Move a file if it's still at its source, report whether it is at the target."""
+    source_path = os.path.join(output_dir, source)
+    if os.path.lexists(source_path):
+        os.replace(source_path, os.path.join(output_dir, target))
+    return os.path.lexists(os.path.join(output_dir, target))
+
+
+def recover_renumber(output_dir, rollback=False):
+    """Finish or undo a renumbering that was interrupted.
+
+    Args:
+        output_dir (str): Directory of the sequence.
+        rollback (bool): Restore the original names instead of completing
+            the renumbering.
+
+    Returns:
+        bool: True if an interrupted renumbering was found.
+    """
+    path = _journal_path(output_dir)
+    try:
+        with open(path, 'r') as f:
+            journal = json.load(f)
+    except FileNotFoundError:
+        return False
+    except (OSError, json.JSONDecodeError) as e:
+        # Written atomically, so a broken journal wasn't ours
+        raise RenumberError(f"Unreadable renumber journal {path}: {e}")
+
+    renames = journal.get("renames", [])
+    if rollback:
+        # Everything back to its temp name first, a target may be another file's source
+        if journal.get("phase") == _FINISHING:
+            for source, temp, target in renames:
+                _move(output_dir, target, temp)
+        for source, temp, target in renames:
+            _move(output_dir, temp, source)
+    else:
+        if journal.get("phase") != _FINISHING:
+            for source, temp, target in renames:
+                _move(output_dir, source, temp)
+            journal["phase"] = _FINISHING
+            _write_journal(output_dir, journal)
+        for source, temp, target in renames:
+            _move(output_dir, temp, target)
+
+    os.remove(path)
+    logging.getLogger("RenderCue").info(
+        f"{'Rolled back' if rollback else 'Completed'} interrupted renumbering of {len(renames)} files in {output_dir}")
+    return True
+
+
+def move_renames(output_dir, renames):
+    """Carry out planned renames in place, journaled.
+
+    Every file is first moved to a temp name and then to its target, so
+    targets that are also sources never collide. On an error the renames
+    done so far are rolled back.
+
+    Args:
+        output_dir (str): Directory of the sequence.
+        renames (list): (source name, target name) pairs from ``plan_renumber``.
+    """
+    journal = {
+        "phase": _STAGING,
+        "renames": [(source, f"{RENUMBER_TEMP_PREFIX}{target}", target) for source, target in renames],
+    }
+    _write_journal(output_dir, journal)
+    try:
+        for source, temp, target in journal["renames"]:
+            os.replace(os.path.join(output_dir, source), os.path.join(output_dir, temp))
+        journal["phase"] = _FINISHING
+        _write_journal(output_dir, journal)
+        for source, temp, target in journal["renames"]:
+            os.replace(os.path.join(output_dir, temp), os.path.join(output_dir, target))
+    except OSError:
+        recover_renumber(output_dir, rollback=True)
+        raise
+    os.remove(_journal_path(output_dir))
+
+
+def link_renames(output_dir, renames, files, mode):
+    """Build a renumbered view of a sequence out of links, leaving the frames alone.
+
+    Args:
+        output_dir (str): Directory of the sequence.
+        renames (list): (source name, target name) pairs from ``plan_renumber``.
+        files (list): Names of the sequence files that keep their number.
+        mode (str): RENUMBER_SYMLINK or RENUMBER_HARDLINK.
+
+    Returns:
+        str: Directory of the view.
+    """
+    view_dir = os.path.join(output_dir, RENUMBER_VIEW_DIRNAME)
+    os.makedirs(view_dir, exist_ok=True)
+    for source, target in list(renames) + [(name, name) for name in files]:
+        link_path = os.path.join(view_dir, target)
+        # Rebuilding a view replaces its old links
+        if os.path.lexists(link_path):
+            os.remove(link_path)
+        if mode == RENUMBER_SYMLINK:
+            os.symlink(os.path.join(os.pardir, source), link_path)
+        else:
+            os.link(os.path.join(output_dir, source), link_path)
+    return view_dir
+
+
+def renumber_sequence(output_dir, name_prefix, start_frame, frames=None, mode=RENUMBER_MOVE):
+    """Renumber a frame sequence so it runs without gaps from its start frame.
+
+    An interrupted renumbering left in the folder is completed first.
+
+    Args:
+        output_dir (str): Directory containing the rendered files.
+        name_prefix (str): Part of the file name before the frame number (e.g. "Scene_").
+        start_frame (int): Number of the first frame after renumbering.
+        frames (iterable, optional): Only take files of these frame numbers,
+            e.g. the frames a job with frame step rendered.
+        mode (str): RENUMBER_MOVE renames the frames, RENUMBER_SYMLINK and
+            RENUMBER_HARDLINK build a view of links in a subfolder instead.
+
+    Returns:
+        int: Number of files that got a new number.
+
+    Raises:
+        RenumberError: If the renumbering would overwrite other files.
+        OSError: If a file can't be moved or linked.
+    """
+    logger = logging.getLogger("RenderCue")
+    if mode == RENUMBER_MOVE:
+        recover_renumber(output_dir)
+
+    renames = plan_renumber(output_dir, name_prefix, start_frame, frames)
+    if mode == RENUMBER_MOVE:
+        if renames:
+            move_renames(output_dir, renames)
+    else:
+        moved = {source for source, _ in renames}
+        files = [name for sequence in scan_sequence(list_names(output_dir), name_prefix, frames).values()
+                 for _, name, _ in sequence if name not in moved]
+        view_dir = link_renames(output_dir, renames, files, mode)
+        logger.info(f"Linked renumbered view in {view_dir}")
+
+    logger.info(f"Renumbered {len(renames)} files in {output_dir}")
+    return len(renames)
@@ -0,0 +1,187 @@
+"""
+RenderCue Staging Module
+
+This module copies frames rendered to a local scratch folder out to their output:
+- A small pool of copier threads, so slow network writes overlap the next frame
+- Copies go to a hidden temp name, are checksummed against the scratch file and
+  only then moved into place, so the output never holds a partial frame
+- Failed copies are retried with backoff, the scratch file is kept if all fail
+- The copy time of every frame, for the worker's log and the batch summary
+
+Kept free of bpy: the worker hands over finished files and collects the
+results between frames, on its own thread.
+"""
+
+import hashlib
+import os
+import queue
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .constants import STAGING_DIRNAME, STAGING_CHUNK_SIZE, STAGING_RETRY_DELAY
+
+
+def get_scratch_dir(base_dir=""):
+    """Get the scratch folder of this worker process, created if missing.
+
+    Args:
+        base_dir (str): Local folder to stage in, the system temp folder if empty.
+
+    Returns:
+        str: Path of the scratch folder.
+    """
+    path = os.path.join(base_dir or tempfile.gettempdir(), STAGING_DIRNAME, str(os.getpid()))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def is_same_drive(path, other):
+    """Check whether two existing paths are on the same drive, where staging gains nothing."""
+    try:
+        return os.stat(path).st_dev == os.stat(other).st_dev
+    except OSError:
+        return False
+
+
+def file_checksum(path):
+    """Get the BLAKE2 digest of a file."""
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(STAGING_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.digest()
+
+
+def copy_verified(source, target):
+    """Copy a file to its target, verified and atomically.
+
+    The checksum of the source is taken while copying, so it is read only
+    once; the copy is read back and compared before it replaces the target.
+
+    Args:
+        source (str): File to copy.
+        target (str): Final path of the copy.
+
+    Raises:
+        OSError: If the copy fails or doesn't match the source.
+    """
+    temp_path = os.path.join(os.path.dirname(target), f".{os.path.basename(target)}.{os.getpid()}.copy")
+    digest = hashlib.blake2b()
+    try:
+        with open(source, 'rb') as src, open(temp_path, 'wb') as dst:
+            while True:
+                chunk = src.read(STAGING_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        if file_checksum(temp_path) != digest.digest():
+            raise OSError(f"Checksum mismatch after copying to {target}")
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+class StagedCopy:
+    """A frame on its way from the scratch folder to the output."""
+
+    def __init__(self, source, target, tag=None):
+        self.source = source
+        self.target = target
+        # Whatever the caller needs to know which frame this was
+        self.tag = tag
+        self.attempts = 0
+        self.seconds = 0.0
+        self.error = None
+
+
+class OutputStager:
+    """Copies staged frames to their output on a pool of threads.
+
+    ``submit`` and ``collect`` are only called from the worker's thread;
+    the copier threads report back through a queue.
+    """
+
+    def __init__(self, threads=2, retries=3):
+        """Start the copier threads.
+
+        Args:
+            threads (int): Number of copies running at the same time.
+            retries (int): How often a failed copy is retried, with doubling delays.
+        """
+        self.retries = max(0, retries)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, threads), thread_name_prefix="RenderCueCopy")
+        self.done = queue.Queue()
+        self.pending = 0
+
+    def submit(self, source, target, tag=None):
+        """Queue a copy. The source file is removed once it arrived.
+
+        Args:
+            source (str): Rendered file in the scratch folder.
+            target (str): Final path of the frame.
+            tag (object, optional): Handed back with the result.
+        """
+        self.pending += 1
+        self.executor.submit(self._copy, StagedCopy(source, target, tag))
+
+    def _copy(self, copy):
+        started = time.monotonic()
+        delay = STAGING_RETRY_DELAY
+        try:
+            while True:
+                copy.attempts += 1
+                try:
+                    copy_verified(copy.source, copy.target)
+                    copy.error = None
+                    break
+                except OSError as e:
+                    copy.error = str(e)
+                    if copy.attempts > self.retries or not os.path.exists(copy.source):
+                        break
+                    time.sleep(delay)
+                    delay *= 2
+            if copy.error is None:
+                try:
+                    os.remove(copy.source)
+                except OSError:
+                    pass
+        except Exception as e:
+            copy.error = str(e)
+        finally:
+            copy.seconds = time.monotonic() - started
+            self.done.put(copy)
+
+    def collect(self, timeout=0):
+        """Take the copies that finished since the last call.
+
+        Args:
+            timeout (float): Seconds to wait for at least one copy to finish,
+                0 to only take the ones that are already done.
+
+        Returns:
+            list: Finished StagedCopy objects, with ``error`` set if they failed.
+        """
+        copies = []
+        while self.pending:
+            try:
+                copy = self.done.get(timeout=timeout) if timeout and not copies else self.done.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            copies.append(copy)
+        return copies
+
+    def close(self):
+        """Wait for the copies in flight and stop the copier threads."""
+        self.executor.shutdown(wait=True)
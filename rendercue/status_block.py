@@ -0,0 +1,325 @@
+"""
+RenderCue Status Block Module
+
+This module implements the shared-memory status channel:
+- A fixed-layout status region in a memory-mapped file next to the status file
+- A seqlock, so readers never see a half-written update
+- Job states as a byte array plus per-job progress and timings
+- A ring of recent events, which tells the reader which jobs changed
+
+The UI creates the block before starting a worker, the worker updates it in
+place and the UI polls it without opening, reading or parsing a file. Kept
+free of bpy so it can be used on both sides.
+"""
+
+import math
+import mmap
+import os
+import struct
+import time
+
+from .constants import (
+    STATUS_JOB_INDEX, STATUS_TOTAL_JOBS, STATUS_MESSAGE, STATUS_ETR,
+    STATUS_FINISHED, STATUS_ERROR, STATUS_TIMESTAMP, STATUS_FINISHED_FRAMES,
+    STATUS_TOTAL_FRAMES, STATUS_LAST_FRAME, STATUS_PAUSED_DURATION,
+    STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS,
+    STATUS_SKIPPED_FRAMES, STATUS_CURRENT_FRAME, STATUS_FRAME_STARTED,
+    STATUS_MEDIAN_FRAME_TIME, STATUS_SYNC_SAVED, STATUS_COPY_TIME, STATUS_SEQ, STATUS_RELEASED,
+    STATUS_OUTPUT_BYTES, STATUS_PROJECTED_BYTES, STATUS_DISK_PAUSES,
+    EVENT_BATCH, EVENT_PROGRESS, EVENT_FRAME_STARTED, EVENT_FRAME_DONE,
+    EVENT_JOB_STATE, EVENT_ERROR, EVENT_HEARTBEAT, STATUS_BLOCK_SUFFIX,
+    STATUS_BLOCK_RING_SIZE
+)
+
+MAGIC = b"RCSB"
+VERSION = 3
+
+# Header: magic, version, job count, ring size, seqlock, event head, then the status fields
+_HEADER = struct.Struct(
+    "<4sHxxIIQQ"    # magic, version, job_count, ring_size, seq, event_head
+    "qqqiiiiiI"     # finished, total, skipped frames, job index, total jobs, status seq, current job, current frame, flags
+    "dddddd"        # timestamp, frame started, paused duration, median frame time, sync saved, copy time
+    "qqI"           # output bytes, projected bytes, disk pauses
+    "16s256s256s512s"  # etr, message, error, last frame
+)
+_SEQ_OFFSET = 16
+_SEQ = struct.Struct("<Q")
+_EVENT = struct.Struct("<B3xiid")  # type, job, frame, time
+_PROGRESS = struct.Struct("<II")   # done, total
+_TIMING = struct.Struct("<dd")     # start, end
+
+_NO_FRAME = -2 ** 31
+_FLAG_FINISHED = 1
+_FLAG_FRAME = 2
+_FLAG_RELEASED = 4
+
+# Byte codes of job states and event types
+JOB_STATES = (None, 'PENDING', 'RENDERING', 'COMPLETED', 'FAILED', 'CANCELLED')
+EVENT_TYPES = (EVENT_BATCH, EVENT_PROGRESS, EVENT_FRAME_STARTED, EVENT_FRAME_DONE,
+               EVENT_JOB_STATE, EVENT_ERROR, EVENT_HEARTBEAT)
+
+
+def get_block_path(status_path):
+    """Get the status block file that belongs to a status file."""
+    return os.path.splitext(status_path)[0] + STATUS_BLOCK_SUFFIX
+
+
+def _layout(job_count, ring_size):
+    """Get the offsets of the job arrays and the event ring, and the block size."""
+    states = _HEADER.size
+    progress = states + job_count + (-job_count % 8)
+    timings = progress + job_count * _PROGRESS.size
+    ring = timings + job_count * _TIMING.size
+    return states, progress, timings, ring, ring + ring_size * _EVENT.size
+
+
+def create_block(status_path, job_count, ring_size=STATUS_BLOCK_RING_SIZE):
+    """Create an empty status block for a worker, replacing any previous one.
+
+    Args:
+        status_path (str): Status file of the worker, the block sits next to it.
+        job_count (int): Number of jobs in the manifest.
+        ring_size (int): Number of recent events kept.
+    """
+    size = _layout(job_count, ring_size)[4]
+    with open(get_block_path(status_path), 'wb') as f:
+        f.write(MAGIC + struct.pack("<HxxII", VERSION, job_count, ring_size))
+        f.write(b"\0" * (size - 16))
+
+
+def _text(value, size):
+    return (value or "").encode('utf-8')[:size]
+
+
+def _untext(value):
+    return value.split(b"\0", 1)[0].decode('utf-8', errors='replace')
+
+
+class StatusBlockWriter:
+    """Worker side of the status block."""
+
+    def __init__(self, status_path):
+        """Map the block the UI created for this worker.
+
+        Args:
+            status_path (str): Status file of the worker, the block sits next to it.
+
+        Raises:
+            OSError: If the block is missing or isn't a status block.
+        """
+        self.file = open(get_block_path(status_path), 'r+b')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0)
+        except ValueError as e:
+            self.file.close()
+            raise OSError(f"Empty status block: {e}")
+        if len(self.map) < _HEADER.size:
+            self.close()
+            raise OSError("Not a RenderCue status block")
+        magic, version, self.job_count, self.ring_size = struct.unpack_from("<4sHxxII", self.map, 0)
+        self.states_offset, self.progress_offset, self.timings_offset, self.ring_offset, size = _layout(self.job_count, self.ring_size)
+        if magic != MAGIC or version != VERSION or len(self.map) < size:
+            self.close()
+            raise OSError("Not a RenderCue status block")
+        self.seq = 0
+        self.event_head = 0
+
+    def write(self, status, event_type, job_indices, job_statuses, job_progress, job_timings):
+        """Update the block in place.
+
+        Args:
+            status (dict): Status fields as built by ``BackgroundWorker.log_status``.
+            event_type (str): Event type of the update, recorded in the ring.
+            job_indices (iterable): Jobs that changed, their state is copied over.
+            job_statuses (list): State of every job.
+            job_progress (list): Progress dicts of every job.
+            job_timings (list): Timing dicts of every job.
+        """
+        m = self.map
+        now = status.get(STATUS_TIMESTAMP) or time.time()
+        current = status.get(STATUS_CURRENT_FRAME)
+        flags = ((_FLAG_FINISHED if status.get(STATUS_FINISHED) else 0) | (_FLAG_FRAME if current else 0)
+                 | (_FLAG_RELEASED if status.get(STATUS_RELEASED) else 0))
+        median = status.get(STATUS_MEDIAN_FRAME_TIME)
+        copy_time = status.get(STATUS_COPY_TIME)
+
+        # Seqlock: odd while writing
+        self.seq += 1
+        _SEQ.pack_into(m, _SEQ_OFFSET, self.seq)
+
+        # The block may have room for jobs appended later
+        job_count = min(self.job_count, len(job_statuses))
+        if event_type == EVENT_BATCH:
+            job_indices = range(job_count)
+        for i in job_indices:
+            if not 0 <= i < job_count:
+                continue
+            m[self.states_offset + i] = JOB_STATES.index(job_statuses[i]) if job_statuses[i] in JOB_STATES else 0
+            _PROGRESS.pack_into(m, self.progress_offset + i * _PROGRESS.size,
+                                job_progress[i].get('done', 0), job_progress[i].get('total', 0))
+            _TIMING.pack_into(m, self.timings_offset + i * _TIMING.size,
+                              job_timings[i].get('start', 0.0), job_timings[i].get('end', 0.0))
+            self._add_event(EVENT_JOB_STATE, i, _NO_FRAME, now)
+        self._add_event(event_type, current[0] if current else -1, current[1] if current else _NO_FRAME, now)
+
+        _HEADER.pack_into(
+            m, 0, MAGIC, VERSION, self.job_count, self.ring_size, self.seq, self.event_head,
+            status.get(STATUS_FINISHED_FRAMES, 0), status.get(STATUS_TOTAL_FRAMES, 0),
+            status.get(STATUS_SKIPPED_FRAMES, 0), status.get(STATUS_JOB_INDEX, 0),
+            status.get(STATUS_TOTAL_JOBS, 0), status.get(STATUS_SEQ, 0),
+            current[0] if current else -1, current[1] if current else _NO_FRAME, flags,
+            now, status.get(STATUS_FRAME_STARTED) or 0.0, status.get(STATUS_PAUSED_DURATION, 0.0),
+            median if median is not None else math.nan, status.get(STATUS_SYNC_SAVED, 0.0),
+            copy_time if copy_time is not None else math.nan,
+            status.get(STATUS_OUTPUT_BYTES, 0), status.get(STATUS_PROJECTED_BYTES, 0),
+            status.get(STATUS_DISK_PAUSES, 0),
+            _text(status.get(STATUS_ETR), 16), _text(status.get(STATUS_MESSAGE), 256),
+            _text(status.get(STATUS_ERROR), 256), _text(status.get(STATUS_LAST_FRAME), 512),
+        )
+
+        self.seq += 1
+        _SEQ.pack_into(m, _SEQ_OFFSET, self.seq)
+
+    def _add_event(self, event_type, job_index, frame, timestamp):
+        slot = self.event_head % self.ring_size
+        _EVENT.pack_into(self.map, self.ring_offset + slot * _EVENT.size,
+                         EVENT_TYPES.index(event_type), job_index, frame, timestamp)
+        self.event_head += 1
+
+    def close(self):
+        """Unmap the block."""
+        try:
+            self.map.close()
+            self.file.close()
+        except (OSError, ValueError):
+            pass
+
+
+class StatusBlockReader:
+    """UI side of the status block.
+
+    ``read`` costs a single integer unpack while nothing changed. Updates are
+    folded into ``status``, which has the layout of the status file.
+    """
+
+    def __init__(self, status_path, job_count):
+        """Create a fresh block for a worker and map it.
+
+        Args:
+            status_path (str): Status file of the worker.
+            job_count (int): Number of jobs in the worker's manifest.
+        """
+        self.path = get_block_path(status_path)
+        self.file = None
+        self.map = None
+        self.last_seq = 0
+        self.last_event_head = 0
+        self.status = None
+        create_block(status_path, job_count)
+        self.file = open(self.path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, retries=3):
+        """Pick up the latest update.
+
+        Args:
+            retries (int): How often to retry when a write is in progress.
+
+        Returns:
+            set or None: Indices of the jobs that changed, or None if nothing new
+            was written (or the block isn't there yet).
+        """
+        m = self.map
+        if m is None:
+            return None
+        for _ in range(retries):
+            seq = _SEQ.unpack_from(m, _SEQ_OFFSET)[0]
+            if seq == self.last_seq:
+                return None
+            if seq % 2:
+                continue
+
+            header = _HEADER.unpack_from(m, 0)
+            if header[0] != MAGIC or header[1] != VERSION:
+                return None
+            job_count, ring_size, event_head = header[2], header[3], header[5]
+            states, progress, timings, ring, _ = _layout(job_count, ring_size)
+
+            # The ring tells which jobs changed, unless it wrapped since the last read
+            if self.status is None or event_head - self.last_event_head > ring_size:
+                changed = set(range(job_count))
+            else:
+                changed = set()
+                for n in range(self.last_event_head, event_head):
+                    event = _EVENT.unpack_from(m, ring + (n % ring_size) * _EVENT.size)
+                    if EVENT_TYPES[event[0]] == EVENT_JOB_STATE:
+                        changed.add(event[1])
+
+            jobs = {i: (JOB_STATES[m[states + i]],
+                        _PROGRESS.unpack_from(m, progress + i * _PROGRESS.size),
+                        _TIMING.unpack_from(m, timings + i * _TIMING.size))
+                    for i in changed if 0 <= i < job_count}
+
+            if _SEQ.unpack_from(m, _SEQ_OFFSET)[0] != seq:
+                # Overwritten while reading
+                continue
+
+            self.last_seq = seq
+            self.last_event_head = event_head
+            self.fold(header, job_count, jobs)
+            return changed
+        return None
+
+    def fold(self, header, job_count, jobs):
+        """Fold a consistent read into ``status``."""
+        if self.status is None:
+            self.status = {
+                STATUS_JOB_STATUSES: ['PENDING'] * job_count,
+                STATUS_JOB_PROGRESS: [{'done': 0, 'total': 0} for _ in range(job_count)],
+                STATUS_JOB_TIMINGS: [{'start': 0.0, 'end': 0.0} for _ in range(job_count)],
+            }
+        (_, _, _, _, _, _, finished, total, skipped, job_index, total_jobs, status_seq,
+         current_job, current_frame, flags, timestamp, frame_started, paused, median,
+         sync_saved, copy_time, output_bytes, projected_bytes, disk_pauses,
+         etr, message, error, last_frame) = header
+
+        status = self.status
+        status[STATUS_FINISHED_FRAMES] = finished
+        status[STATUS_TOTAL_FRAMES] = total
+        status[STATUS_SKIPPED_FRAMES] = skipped
+        status[STATUS_JOB_INDEX] = job_index
+        status[STATUS_TOTAL_JOBS] = total_jobs
+        status[STATUS_SEQ] = status_seq
+        status[STATUS_CURRENT_FRAME] = [current_job, current_frame] if flags & _FLAG_FRAME else None
+        status[STATUS_FINISHED] = bool(flags & _FLAG_FINISHED)
+        status[STATUS_RELEASED] = bool(flags & _FLAG_RELEASED)
+        status[STATUS_TIMESTAMP] = timestamp
+        status[STATUS_FRAME_STARTED] = frame_started if flags & _FLAG_FRAME else None
+        status[STATUS_PAUSED_DURATION] = paused
+        status[STATUS_MEDIAN_FRAME_TIME] = None if math.isnan(median) else median
+        status[STATUS_SYNC_SAVED] = sync_saved
+        status[STATUS_COPY_TIME] = None if math.isnan(copy_time) else copy_time
+        status[STATUS_OUTPUT_BYTES] = output_bytes
+        status[STATUS_PROJECTED_BYTES] = projected_bytes
+        status[STATUS_DISK_PAUSES] = disk_pauses
+        status[STATUS_ETR] = _untext(etr)
+        status[STATUS_MESSAGE] = _untext(message)
+        status[STATUS_ERROR] = _untext(error) or None
+        status[STATUS_LAST_FRAME] = _untext(last_frame)
+
+        for i, (state, (done, total_frames), (start, end)) in jobs.items():
+            status[STATUS_JOB_STATUSES][i] = state
+            status[STATUS_JOB_PROGRESS][i] = {'done': done, 'total': total_frames}
+            status[STATUS_JOB_TIMINGS][i] = {'start': start, 'end': end}
+
+    def close(self):
+        """Unmap the block."""
+        try:
+            if self.map is not None:
+                self.map.close()
+            if self.file is not None:
+                self.file.close()
+        except (OSError, ValueError):
+            pass
+        self.map = None
+        self.file = None
@@ -86,10 +86,16 @@ class RENDER_UL_render_cue_jobs(bpy.types.UIList):
         else:
             frame_count = end - start + 1
         
+        list_count = ui_helpers.get_frame_list_count(item)
+        if list_count is not None:
+            frame_count = list_count
+        
         # Compact frame display
         sub = row.row()
         sub.alignment = 'RIGHT'
-        if start == end:
+        if list_count is not None:
+            sub.label(text=f"List ({frame_count}f)")
+        elif start == end:
             sub.label(text=f"{start}")
         else:
             sub.label(text=f"{start}-{end} ({frame_count}f)")
@@ -180,6 +186,16 @@ class RenderCuePanelMixin:
         if settings.show_queue_preview:
             self.draw_queue_preview(box, settings, context)
         
+        # Live Queue Editing (COLLAPSIBLE)
+        editor_header = box.row()
+        editor_header.prop(settings, "show_queue_editor",
+                          text="Edit Queue",
+                          icon=version_compat.get_icon('TRIA_DOWN') if settings.show_queue_editor else version_compat.get_icon('TRIA_RIGHT'),
+                          emboss=False)
+        
+        if settings.show_queue_editor:
+            self.draw_queue_editor(box, settings, context)
+        
         # Thumbnail
         if settings.has_preview_image:
             # box.separator() # Removed extra padding
@@ -194,7 +210,7 @@ class RenderCuePanelMixin:
                 # This uses the preview collection loaded in render.py
                 if UI_PREVIEW_COLLECTION_KEY in preview_collections:
                     pcoll = preview_collections[UI_PREVIEW_COLLECTION_KEY]
-                    # Use dynamic key from settings to ensure we get the latest icon
+                    # Key of the live preview, set by render.py
                     icon_key = settings.preview_icon_key
                     if icon_key in pcoll:
                         col = box.column()
@@ -209,8 +225,34 @@ class RenderCuePanelMixin:
             controls.operator("rendercue.resume_render", icon=version_compat.get_icon('PLAY'), text="Resume")
         else:
             controls.operator("rendercue.pause_render", icon=version_compat.get_icon('PAUSE'), text="Pause")
+            controls.operator_menu_enum("rendercue.pause_render", "mode", text="", icon=version_compat.get_icon('DOWNARROW_HLT'))
         
         controls.operator("rendercue.stop_render", icon=version_compat.get_icon('CANCEL'), text="Stop")
+        
+        queue_controls = box.row(align=True)
+        # Parallel workers each render their own job, those are cancelled in the queue
+        skip = queue_controls.row(align=True)
+        skip.enabled = settings.worker_count <= 1
+        skip.operator("rendercue.queue_command", icon=version_compat.get_icon('FF'), text="Skip Job").action = 'SKIP'
+        queue_controls.operator("rendercue.queue_command", icon=version_compat.get_icon('SNAP_FACE'), text="Finish Frame & Stop").action = 'DRAIN'
+    
+    def draw_queue_editor(self, layout, settings, context):
+        """Draw the queue with the edits a running batch accepts."""
+        row = layout.row()
+        row.template_list("RENDER_UL_render_cue_jobs", "", settings, "jobs", settings, "active_job_index", rows=4)
+        
+        col = row.column(align=True)
+        col.operator("rendercue.add_job", icon=version_compat.get_icon('ADD'), text="")
+        col.separator()
+        col.operator("rendercue.queue_command", icon=version_compat.get_icon('TRIA_UP_BAR'), text="").action = 'PRIORITIZE'
+        col.operator("rendercue.queue_command", icon=version_compat.get_icon('X'), text="").action = 'CANCEL'
+        
+        # Jobs added since the batch started
+        new_jobs = len(settings.jobs) - settings.total_jobs_count
+        if new_jobs > 0:
+            layout.operator("rendercue.queue_command", 
+                           icon=version_compat.get_icon('ADD'), 
+                           text=f"Add {new_jobs} New Job{'s' if new_jobs > 1 else ''} to Batch").action = 'APPEND'
     
     def draw_queue_preview(self, layout, settings, context):
         """Draw mini queue list (SMART TRUNCATION)."""
@@ -399,6 +441,9 @@ class RenderCuePanelMixin:
                 row.label(text="Path: // [Scene Name] /", icon=version_compat.get_icon('FILE_BLEND'))
             else:
                 row.label(text="Path: [Custom] / [Scene Name] /", icon=version_compat.get_icon('FILE_FOLDER'))
+            
+            col = box.column(align=True)
+            col.prop(settings, "skip_existing_frames")
         
         # Selected Job Settings (Overrides)
         if settings.jobs:
@@ -471,6 +516,12 @@ class RenderCuePanelMixin:
                     ov_row.scale_y = 0.7
                     ov_row.label(text=f"⚡ {', '.join(other_overrides)}", icon=version_compat.get_icon('MODIFIER'))
             
+            # Worker crashes and dropped frames from the last batch
+            if job.error_message:
+                err_row = summary_box.row()
+                err_row.alert = job.render_status == 'FAILED'
+                err_row.label(text=job.error_message, icon=version_compat.get_icon('ERROR'))
+            
             # Inline Error (if file not saved)
             validation = ui_helpers.get_queue_validation_summary(context)
             if validation['errors']:
@@ -647,7 +698,8 @@ class RenderCuePanelMixin:
                 
                 # Group: Output Settings
                 is_output_active = (job.override_output or job.override_camera or 
-                                   job.override_transparent or job.override_compositor)
+                                   job.override_transparent or job.override_compositor or
+                                   job.override_skip_existing)
                 col = draw_collapsible_box(parent_col, settings, "ui_show_job_output", "Output Settings", version_compat.get_icon('FILE_FOLDER'), is_active=is_output_active)
                 
                 if col:
@@ -702,12 +754,24 @@ class RenderCuePanelMixin:
                         sub_col.use_property_split = True
                         sub_col.use_property_decorate = False
                         sub_col.prop(job, "use_compositor", text="Enable")
+                    
+
+
+                    # Skip Existing
+                    row = col.row(align=True)
+                    row.prop(job, "override_skip_existing", text="Skip Existing Frames")
+                    
+                    if job.override_skip_existing:
+                        sub_col = col.column(align=True)
+                        sub_col.use_property_split = True
+                        sub_col.use_property_decorate = False
+                        sub_col.prop(job, "skip_existing", text="Skip")
                         
 
                 
                 # Group: Range & Resolution
                 is_dim_active = (job.override_frame_range or job.override_frame_step or 
-                                job.override_resolution)
+                                job.override_frame_list or job.override_resolution)
                 col = draw_collapsible_box(parent_col, settings, "ui_show_dimensions", "Range & Resolution", version_compat.get_icon('SETTINGS'), is_active=is_dim_active)
 
                 if col:
@@ -745,6 +809,24 @@ class RenderCuePanelMixin:
                     
 
 
+                    # Frame List
+                    row = col.row(align=True)
+                    row.prop(job, "override_frame_list", text="Frame List")
+                    
+                    if job.override_frame_list:
+                        sub_col = col.column(align=True)
+                        sub_col.use_property_split = True
+                        sub_col.use_property_decorate = False
+                        sub_col.prop(job, "frame_list", text="Frames")
+                        
+                        list_count = ui_helpers.get_frame_list_count(job)
+                        if list_count:
+                            sub_col.label(text=f"Renders {list_count} frames", icon=version_compat.get_icon('INFO'))
+                        else:
+                            sub_col.label(text="Enter frames like 1-10,15,20-30x5", icon=version_compat.get_icon('ERROR'))
+                    
+
+
                     # Resolution
                     row = col.row(align=True)
                     row.prop(job, "override_resolution", text="Resolution")
@@ -782,7 +864,7 @@ class RenderCuePanelMixin:
                 is_render_active = (job.override_engine or job.override_view_layer or
                                    job.override_samples or job.override_denoising or
                                    job.override_device or job.override_time_limit or
-                                   job.override_persistent_data)
+                                   job.override_persistent_data or job.override_frame_timeout)
                 col = draw_collapsible_box(parent_col, settings, "ui_show_render", "Render", version_compat.get_icon('RESTRICT_RENDER_OFF'), is_active=is_render_active)
 
                 if col:
@@ -864,6 +946,15 @@ class RenderCuePanelMixin:
                             sub_col.use_property_decorate = False
                             sub_col.prop(job, "use_persistent_data", text="Persistent Data")
 
+                    # Frame Timeout (watchdog, any engine)
+                    col.separator()
+                    row = col.row(align=True)
+                    row.prop(job, "override_frame_timeout", text="Frame Timeout")
+                    if job.override_frame_timeout:
+                        sub_col = col.column(align=True)
+                        sub_col.use_property_split = True
+                        sub_col.use_property_decorate = False
+                        sub_col.prop(job, "frame_timeout", text="Timeout")
                     
 
 
@@ -891,6 +982,11 @@ class RenderCuePanelMixin:
         row = layout.row()
         row.scale_y = 2.0
         row.operator("rendercue.confirm_render", icon=version_compat.get_icon('RENDER_ANIMATION'), text="START RENDER QUEUE")
+        
+        # Only offered when an interrupted batch left a journal behind
+        if bpy.ops.rendercue.resume_batch.poll():
+            row = layout.row()
+            row.operator("rendercue.resume_batch", icon=version_compat.get_icon('RECOVER_LAST'), text="Resume Interrupted Batch")
 
 class RENDERCUE_MT_apply_to_all_menu(bpy.types.Menu):
     bl_label = "Apply to All Jobs"
@@ -916,6 +1012,7 @@ class RENDERCUE_MT_apply_to_all_menu(bpy.types.Menu):
         add_item("override_camera", "camera", "Camera")
         add_item("override_transparent", "film_transparent", "Transparent Background")
         add_item("override_compositor", "use_compositor", "Compositor")
+        add_item("override_skip_existing", "skip_existing", "Skip Existing Frames")
         add_item("override_frame_range", "frame_range", "Frame Range")
         add_item("override_frame_step", "frame_step", "Frame Step")
         add_item("override_resolution", "resolution_scale", "Resolution")
@@ -925,6 +1022,7 @@ class RENDERCUE_MT_apply_to_all_menu(bpy.types.Menu):
         add_item("override_denoising", "use_denoising", "Denoising")
         add_item("override_device", "device", "Device")
         add_item("override_time_limit", "time_limit", "Time Limit")
+        add_item("override_frame_timeout", "frame_timeout", "Frame Timeout")
         add_item("override_persistent_data", "use_persistent_data", "Persistent Data")
         add_item("override_view_layer", "view_layer", "View Layer")
 
@@ -949,6 +1047,10 @@ class RENDERCUE_MT_job_context_menu(bpy.types.Menu):
         if settings.active_job_index >= 0 and settings.active_job_index < len(settings.jobs):
             op = layout.operator("rendercue.switch_to_job_scene", text="Switch to Scene", icon=version_compat.get_icon('VIEW3D'))
             op.index = settings.active_job_index
+            layout.operator("rendercue.renumber_output", icon=version_compat.get_icon('LINENUMBERS_ON'))
+            layout.operator("rendercue.renumber_output", text="Undo Interrupted Renumbering", icon=version_compat.get_icon('LOOP_BACK')).rollback = True
+        
+        layout.operator("rendercue.audit_output", icon=version_compat.get_icon('VIEWZOOM'))
         
         layout.separator()
         
@@ -1007,6 +1109,8 @@ class RENDER_PT_render_cue_dashboard(RenderCuePanelMixin, bpy.types.Panel):
                 icon = 'ERROR'
             elif settings.last_render_status == 'CANCELLED':
                 icon = 'CANCEL'
+            elif settings.last_render_status == 'STOPPED':
+                icon = 'PAUSE'
             
             row = box.row()
             row.label(text=settings.last_render_message, icon=version_compat.get_icon(icon))
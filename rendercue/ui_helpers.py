@@ -1,16 +1,20 @@
 """Helper functions for RenderCue UI feedback."""
 import bpy
+import math
 import os
 from . import version_compat
+from .core import StateManager, get_job_output_dir, get_job_frame_list, parse_frame_list
+from .disk_space import measure_frame_size, group_by_drive
+from .constants import MANIFEST_GLOBAL_OUTPUT, MANIFEST_OUTPUT_LOCATION, MANIFEST_JOBS
 
 # =============================================================================
 # OVERRIDE GROUPING & METADATA
 # =============================================================================
 
 OVERRIDE_GROUPS = [
-    ('Render', ['engine', 'samples', 'device', 'denoising', 'time_limit', 'persistent_data']),
-    ('Dimensions', ['frame_range', 'frame_step', 'resolution']),
-    ('Output', ['output', 'format', 'transparent', 'compositor']),
+    ('Render', ['engine', 'samples', 'device', 'denoising', 'time_limit', 'persistent_data', 'frame_timeout']),
+    ('Dimensions', ['frame_range', 'frame_step', 'frame_list', 'resolution']),
+    ('Output', ['output', 'format', 'transparent', 'compositor', 'skip_existing']),
     ('Scene', ['camera', 'view_layer']),
 ]
 
@@ -60,6 +64,12 @@ OVERRIDE_METADATA = {
         'val': 'use_persistent_data', 
         'apply': 'universal'
     },
+    'frame_timeout': {
+        'display': 'Frame Timeout', 
+        'bool': 'override_frame_timeout', 
+        'val': 'frame_timeout', 
+        'apply': 'universal'
+    },
     'frame_range': {
         'display': 'Frame Range', 
         'bool': 'override_frame_range', 
@@ -72,6 +82,12 @@ OVERRIDE_METADATA = {
         'val': 'frame_step', 
         'apply': 'universal'
     },
+    'frame_list': {
+        'display': 'Frame List', 
+        'bool': 'override_frame_list', 
+        'val': 'frame_list', 
+        'apply': 'none' # The frames missing in one job mean nothing to the others
+    },
     'resolution': {
         'display': 'Resolution', 
         'bool': 'override_resolution', 
@@ -102,6 +118,12 @@ OVERRIDE_METADATA = {
         'val': 'use_compositor', 
         'apply': 'universal'
     },
+    'skip_existing': {
+        'display': 'Skip Existing', 
+        'bool': 'override_skip_existing', 
+        'val': 'skip_existing', 
+        'apply': 'universal'
+    },
     'camera': {
         'display': 'Camera', 
         'bool': 'override_camera', 
@@ -156,6 +178,19 @@ def get_applicable_jobs_count(context, override_key, source_job):
                 
     return applicable, total
 
+def get_frame_list_count(job):
+    """Get the number of frames in a job's frame list override.
+
+    Returns:
+        int or None: The frame count, None if the override is off or the list invalid.
+    """
+    if not job.override_frame_list:
+        return None
+    try:
+        return len(parse_frame_list(job.frame_list))
+    except ValueError:
+        return None
+
 def get_override_summary(context, job):
     """Get summary of active overrides for a job, grouped by category.
     
@@ -207,6 +242,9 @@ def get_override_summary(context, job):
                 step = max(1, job.frame_step)
                 output_count = (frame_range // step) + 1
                 value_str = f"{job.frame_step} ({output_count} frames)"
+            elif key == 'frame_list':
+                list_count = get_frame_list_count(job)
+                value_str = f"{list_count} frames" if list_count is not None else "Invalid"
             elif key == 'resolution':
                 value_str = f"{job.resolution_scale}%"
             elif key == 'camera':
@@ -219,8 +257,12 @@ def get_override_summary(context, job):
                 value_str = 'Yes' if job.use_denoising else 'No'
             elif key == 'persistent_data':
                 value_str = 'Yes' if job.use_persistent_data else 'No'
+            elif key == 'skip_existing':
+                value_str = 'Yes' if job.skip_existing else 'No'
             elif key == 'time_limit':
                 value_str = f"{job.time_limit}s"
+            elif key == 'frame_timeout':
+                value_str = f"{job.frame_timeout:.0f}s" if job.frame_timeout > 0 else "Off"
             elif key == 'output':
                 value_str = 'Custom'
             else:
@@ -416,6 +458,9 @@ def validate_queue_for_render(context):
             elif job.frame_step > (job.frame_end - job.frame_start + 1):
                  errors.append(f"Job {job_num}: Frame step ({job.frame_step}) is larger than frame range")
 
+        if job.override_frame_list and not get_frame_list_count(job):
+            errors.append(f"Job {job_num}: Frame list '{job.frame_list}' is empty or invalid")
+
         if job.override_device and job.device == 'GPU':
             try:
                 preferences = context.preferences.addons['cycles'].preferences
@@ -509,6 +554,9 @@ def get_job_confirmation_details(job):
     frames_display = f"{count} frames"
     if step > 1:
         frames_display += f" (step {step})"
+    list_count = get_frame_list_count(job)
+    if list_count is not None:
+        frames_display = f"{list_count} frames (list)"
 
     # Collect all active overrides for display
     overrides = []
@@ -516,6 +564,7 @@ def get_job_confirmation_details(job):
     if job.override_camera: overrides.append("Camera")
     if job.override_resolution: overrides.append("Resolution")
     if job.override_frame_range: overrides.append("Range")
+    if job.override_frame_list: overrides.append("Frame List")
     if job.override_engine: overrides.append("Engine")
     if job.override_samples: overrides.append("Samples")
     if job.override_device: overrides.append("Device")
@@ -553,7 +602,8 @@ def get_queue_summary(context):
             
             step = job.frame_step if job.override_frame_step else job.scene.frame_step
             count = max(0, (end - start) // max(1, step) + 1)
-            total_frames += count
+            list_count = get_frame_list_count(job)
+            total_frames += count if list_count is None else list_count
             
     is_saved = bool(bpy.data.filepath)
     is_dirty = bpy.data.is_dirty
@@ -565,3 +615,45 @@ def get_queue_summary(context):
         'is_dirty': is_dirty,
         'filename': os.path.basename(bpy.data.filepath) if is_saved else "Untitled.blend"
     }
+
+def get_output_projection(context):
+    """Project the output size of every job and the free space on the drives it goes to.
+
+    Frame sizes are measured from frames already in a job's output folder
+    (from an earlier render), otherwise the uncompressed image size is used
+    as an upper bound. Movie output isn't projected.
+
+    Returns:
+        tuple: (jobs, drives). ``jobs`` maps job indices to (projected bytes,
+        measured); ``drives`` lists dicts from ``disk_space.group_by_drive``.
+    """
+    settings = context.window_manager.rendercue
+    manifest = {
+        MANIFEST_GLOBAL_OUTPUT: settings.global_output_path,
+        MANIFEST_OUTPUT_LOCATION: settings.output_location,
+        MANIFEST_JOBS: [StateManager.serialize_job(j) for j in settings.jobs],
+    }
+    jobs = {}
+    outputs = []
+    for i, job in enumerate(settings.jobs):
+        scene = job.scene
+        if not scene:
+            continue
+        render = scene.render
+        if (job.render_format == 'FFMPEG') if job.override_format else render.is_movie_format:
+            continue
+        
+        output_dir = get_job_output_dir(manifest, i, bpy.data.filepath)
+        frame_size = measure_frame_size(output_dir, f"{scene.name}_")
+        measured = frame_size is not None
+        if not measured:
+            scale = job.resolution_scale if job.override_resolution else render.resolution_percentage
+            pixels = int(render.resolution_x * scale / 100) * int(render.resolution_y * scale / 100)
+            image = render.image_settings
+            channels = {'BW': 1, 'RGB': 3}.get(image.color_mode, 4)
+            frame_size = pixels * channels * math.ceil(int(image.color_depth or 8) / 8)
+        
+        size = int(frame_size * len(get_job_frame_list(manifest[MANIFEST_JOBS][i], scene)))
+        jobs[i] = (size, measured)
+        outputs.append((i, output_dir, size))
+    return jobs, group_by_drive(outputs)
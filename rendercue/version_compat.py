@@ -45,20 +45,33 @@ def get_available_engines():
         ('BLENDER_WORKBENCH', "Workbench", "Viewport renderer"),
     ]
 
+# Eevee render sample properties, newest first (Blender 4.2+ uses taa_render_samples)
+EEVEE_SAMPLES_PROPERTIES = ('taa_render_samples',)
+
+def get_eevee_samples_property(scene):
+    """
+    Gets the owner and name of the Eevee render samples property.
+    
+    Lets callers that record what they change (see core.OverrideState)
+    set it without knowing the property name of the running version.
+    
+    Returns:
+        tuple or None: (owner, attribute name), or None if Eevee has no samples setting.
+    """
+    eevee = getattr(scene, "eevee", None)
+    if eevee is None:
+        return None
+    for attr in EEVEE_SAMPLES_PROPERTIES:
+        if hasattr(eevee, attr):
+            return eevee, attr
+    return None
+
 def get_eevee_samples(scene):
-    """Gets Eevee samples count (Blender 4.2+ uses taa_render_samples)."""
-    try:
-        return scene.eevee.taa_render_samples
-    except AttributeError:
+    """Gets Eevee samples count."""
+    samples_property = get_eevee_samples_property(scene)
+    if samples_property is None:
         return 64  # Default fallback
-
-def set_eevee_samples(scene, value):
-    """Sets Eevee samples count (Blender 4.2+ uses taa_render_samples)."""
-    try:
-        scene.eevee.taa_render_samples = value
-        return True
-    except AttributeError:
-        return False
+    return getattr(*samples_property)
 
 def log_version_info():
     """Logs the current Blender version for debugging."""
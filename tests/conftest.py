@@ -0,0 +1,16 @@
+"""Make the bpy-free RenderCue modules importable outside Blender.
+
+The package's ``__init__`` registers the addon with Blender, so it is
+replaced by a bare package pointing at the same folder.
+"""
+
+import os
+import sys
+import types
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rendercue")
+
+if "rendercue" not in sys.modules:
+    package = types.ModuleType("rendercue")
+    package.__path__ = [PACKAGE_DIR]
+    sys.modules["rendercue"] = package
@@ -0,0 +1,122 @@
+import struct
+import zlib
+
+import pytest
+
+from rendercue.audit import is_valid_png, check_frame, audit_sequence
+from rendercue.constants import AUDIT_MISSING, AUDIT_EMPTY, AUDIT_CORRUPT, AUDIT_UNREADABLE
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG = b"\xff\xd8\xff\xe0" + b"\0" * 32 + b"\xff\xd9"
+
+
+def chunk(kind, body, crc=None):
+    if crc is None:
+        crc = zlib.crc32(kind + body)
+    return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", crc)
+
+
+def make_png(width=4, height=4, idat=None):
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    if idat is None:
+        idat = zlib.compress(b"".join(b"\0" + b"\x80" * width * 3 for _ in range(height)))
+    return PNG_SIGNATURE + chunk(b"IHDR", header) + chunk(b"IDAT", idat) + chunk(b"IEND", b"")
+
+
+def test_valid_png():
+    assert is_valid_png(make_png())
+    assert is_valid_png(make_png(width=1024, height=1024))
+
+
+def test_png_with_bad_crc():
+    data = bytearray(make_png())
+    data[-20] ^= 0xFF  # Inside the IDAT chunk
+    assert not is_valid_png(bytes(data))
+
+
+def test_png_with_broken_image_data():
+    # Checksums fine, the compressed data isn't
+    assert not is_valid_png(make_png(idat=b"not deflate data"))
+    # Compressed stream cut short
+    assert not is_valid_png(make_png(idat=zlib.compress(b"\0" * 1000)[:-6]))
+
+
+def test_png_cut_short():
+    data = make_png()
+    assert not is_valid_png(data[:-12])  # No IEND
+    assert not is_valid_png(data[:40])
+
+
+def test_check_frame_zero_bytes(tmp_path):
+    path = tmp_path / "Scene_0001.png"
+    path.write_bytes(b"")
+    assert check_frame(str(path)) == AUDIT_EMPTY
+    assert check_frame(str(path), deep=True) == AUDIT_EMPTY
+
+
+@pytest.mark.parametrize("ext, data", [(".png", JPEG), (".jpg", make_png()), (".exr", b"\0" * 64)])
+def test_check_frame_wrong_signature(tmp_path, ext, data):
+    path = tmp_path / f"Scene_0001{ext}"
+    path.write_bytes(data)
+    assert check_frame(str(path)) == AUDIT_CORRUPT
+
+
+def test_check_frame_truncated(tmp_path):
+    png = tmp_path / "Scene_0001.png"
+    png.write_bytes(make_png()[:-16])
+    jpeg = tmp_path / "Scene_0001.jpg"
+    jpeg.write_bytes(JPEG[:-2])
+
+    # Only the deep check reads past the signature
+    assert check_frame(str(png)) is None
+    assert check_frame(str(png), deep=True) == AUDIT_CORRUPT
+    assert check_frame(str(jpeg)) is None
+    assert check_frame(str(jpeg), deep=True) == AUDIT_CORRUPT
+
+
+def test_check_frame_fine(tmp_path):
+    png = tmp_path / "Scene_0001.png"
+    png.write_bytes(make_png())
+    jpeg = tmp_path / "Scene_0001.jpg"
+    jpeg.write_bytes(JPEG + b"\0" * 8)  # Padding after the end marker is fine
+    tga = tmp_path / "Scene_0001.tga"
+    tga.write_bytes(b"\0" * 64)  # No signature to check
+
+    for path in (png, jpeg, tga):
+        assert check_frame(str(path)) is None
+        assert check_frame(str(path), deep=True) is None
+
+
+def test_check_frame_unreadable(tmp_path):
+    folder = tmp_path / "Scene_0001.png"
+    folder.mkdir()
+    assert check_frame(str(folder)) == AUDIT_UNREADABLE
+
+
+def test_audit_sequence(tmp_path):
+    for frame in (1, 2, 5):
+        (tmp_path / f"Scene_{frame:04d}.png").write_bytes(make_png())
+    (tmp_path / "Scene_0004.png").write_bytes(b"")
+    (tmp_path / "Scene_0006.png").write_bytes(make_png()[:-16])
+    # Another format and another sequence don't count
+    (tmp_path / "Scene_0003.jpg").write_bytes(JPEG)
+    (tmp_path / "Mist_0003.png").write_bytes(make_png())
+
+    numbers = {frame: frame for frame in range(1, 7)}
+    assert audit_sequence(str(tmp_path), "Scene_", numbers, threads=2) == {3: AUDIT_MISSING, 4: AUDIT_EMPTY}
+    assert audit_sequence(str(tmp_path), "Scene_", numbers, deep=True) == {
+        3: AUDIT_MISSING, 4: AUDIT_EMPTY, 6: AUDIT_CORRUPT}
+
+
+def test_audit_sequence_by_output_number(tmp_path):
+    # Frame step 10 saved under sequential numbers
+    for number in (1, 2):
+        (tmp_path / f"Scene_{number:04d}.png").write_bytes(make_png())
+    numbers = {1: 1, 11: 2, 21: 3}
+    assert audit_sequence(str(tmp_path), "Scene_", numbers) == {21: AUDIT_MISSING}
+
+
+def test_audit_sequence_without_output(tmp_path):
+    numbers = {1: 1, 2: 2}
+    assert audit_sequence(str(tmp_path / "missing"), "Scene_", numbers) == {1: AUDIT_MISSING, 2: AUDIT_MISSING}
+    assert audit_sequence(str(tmp_path), "Scene_", numbers) == {1: AUDIT_MISSING, 2: AUDIT_MISSING}
@@ -0,0 +1,113 @@
+import pytest
+
+from rendercue import preview_buffer
+from rendercue.constants import PREVIEW_MAX_SIZE
+from rendercue.preview_buffer import PreviewBufferReader, PreviewBufferWriter, get_buffer_path
+
+
+def make_pixels(width, height, value):
+    return bytes([value, value // 2, 255 - value, 255]) * (width * height)
+
+
+@pytest.fixture
+def status_path(tmp_path):
+    return str(tmp_path / "rendercue_status.json")
+
+
+@pytest.fixture
+def buffer(status_path):
+    reader = PreviewBufferReader(status_path)
+    writer = PreviewBufferWriter(status_path)
+    yield reader, writer
+    writer.close()
+    reader.close()
+
+
+def test_round_trip(buffer):
+    reader, writer = buffer
+    assert reader.read() is None
+
+    pixels = make_pixels(16, 9, 200)
+    writer.write(16, 9, pixels)
+    assert reader.read() == (16, 9, pixels)
+    # Nothing new until the next thumbnail
+    assert reader.read() is None
+
+    # A smaller thumbnail only covers part of the previous one
+    pixels = make_pixels(4, 3, 10)
+    writer.write(4, 3, pixels)
+    assert reader.read() == (4, 3, pixels)
+
+
+def test_largest_thumbnail(buffer):
+    reader, writer = buffer
+    pixels = make_pixels(PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE, 7)
+    writer.write(PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE, pixels)
+    assert reader.read() == (PREVIEW_MAX_SIZE, PREVIEW_MAX_SIZE, pixels)
+
+
+def test_read_skips_write_in_progress(buffer):
+    reader, writer = buffer
+    writer.write(2, 2, make_pixels(2, 2, 1))
+
+    # Seqlock odd: the worker is halfway through a thumbnail
+    preview_buffer._SEQ.pack_into(writer.map, preview_buffer._SEQ_OFFSET, writer.seq + 1)
+    assert reader.read() is None
+
+
+def test_torn_read_is_retried(buffer, monkeypatch):
+    reader, writer = buffer
+    first, second = make_pixels(8, 8, 50), make_pixels(8, 8, 150)
+    writer.write(8, 8, first)
+
+    # The worker publishes the next thumbnail while the reader copies the first out
+    real_seq = preview_buffer._SEQ
+
+    class InterleavedSeq:
+        reads = 0
+
+        def unpack_from(self, buffer, offset):
+            self.reads += 1
+            if self.reads == 2:
+                writer.write(8, 8, second)
+            return real_seq.unpack_from(buffer, offset)
+
+        def pack_into(self, buffer, offset, value):
+            real_seq.pack_into(buffer, offset, value)
+
+    monkeypatch.setattr(preview_buffer, "_SEQ", InterleavedSeq())
+    assert reader.read() == (8, 8, second)
+    assert reader.last_seq == writer.seq
+
+
+def test_restarted_writer_continues_sequence(buffer, status_path):
+    reader, writer = buffer
+    writer.write(2, 2, make_pixels(2, 2, 1))
+    reader.read()
+    writer.close()
+
+    # A restarted worker maps the same buffer, its thumbnails still count as new
+    restarted = PreviewBufferWriter(status_path)
+    try:
+        pixels = make_pixels(2, 2, 2)
+        restarted.write(2, 2, pixels)
+        assert reader.read() == (2, 2, pixels)
+    finally:
+        restarted.close()
+
+
+def test_writer_rejects_oversized_thumbnail(buffer):
+    _, writer = buffer
+    with pytest.raises(ValueError):
+        writer.write(PREVIEW_MAX_SIZE + 1, 1, make_pixels(PREVIEW_MAX_SIZE + 1, 1, 0))
+    with pytest.raises(ValueError):
+        writer.write(4, 4, make_pixels(2, 2, 0))
+
+
+def test_writer_needs_a_buffer(status_path):
+    with pytest.raises(OSError):
+        PreviewBufferWriter(status_path)
+    with open(get_buffer_path(status_path), 'wb') as f:
+        f.write(b"not a preview buffer")
+    with pytest.raises(OSError):
+        PreviewBufferWriter(status_path)
@@ -0,0 +1,221 @@
+"""Tests for frame naming of renumbered frame step output."""
+
+import json
+import os
+
+import pytest
+
+from rendercue.constants import (
+    MANIFEST_SHARD_INDEX, MANIFEST_SHARD_COUNT, MANIFEST_SEQUENTIAL_NAMES,
+    MANIFEST_RENUMBER_VIEW, MANIFEST_RENUMBER_OUTPUT, MANIFEST_RENUMBER_MODE,
+    RENUMBER_MOVE, RENUMBER_SYMLINK, RENUMBER_HARDLINK, RENUMBER_JOURNAL_FILENAME,
+    RENUMBER_TEMP_PREFIX, RENUMBER_VIEW_DIRNAME
+)
+from rendercue.renumber import (
+    get_renumber_flags, get_output_frame, release_shard, builds_link_view,
+    renumber_sequence, RenumberError, get_renumber_frames, write_frame_map,
+    plan_renumber, move_renames, recover_renumber, list_names, scan_sequence,
+    detect_padding, _STAGING, _FINISHING
+)
+
+FRAME_START = 1
+FRAME_END = 39
+FRAME_STEP = 2
+
+
+def make_shard_manifest(shard_index, shard_count, mode):
+    manifest = {
+        MANIFEST_RENUMBER_OUTPUT: True,
+        MANIFEST_RENUMBER_MODE: mode,
+        MANIFEST_SHARD_INDEX: shard_index,
+        MANIFEST_SHARD_COUNT: shard_count,
+    }
+    manifest.update(get_renumber_flags(True, mode))
+    return manifest
+
+
+def output_names(manifest, frames):
+    return {f"Scene_{get_output_frame(manifest, frame, FRAME_START, FRAME_STEP):04d}.png": frame for frame in frames}
+
+
+def test_restarted_shard_keeps_sequential_names():
+    frames = list(range(FRAME_START, FRAME_END + 1, FRAME_STEP))
+    sibling = make_shard_manifest(0, 2, RENUMBER_MOVE)
+    # The restart manifest is a JSON round trip of the crashed shard's manifest
+    restarted = json.loads(json.dumps(make_shard_manifest(1, 2, RENUMBER_MOVE)))
+    assert release_shard(restarted) == (1, 2)
+
+    sibling_names = output_names(sibling, frames[0::2])
+    restarted_names = output_names(restarted, frames[1::2])
+
+    # No name is written twice, and together the shards fill a gap-free sequence
+    assert not set(sibling_names).intersection(restarted_names)
+    names = {**sibling_names, **restarted_names}
+    assert sorted(names) == [f"Scene_{number:04d}.png" for number in range(1, len(frames) + 1)]
+    assert restarted_names["Scene_0002.png"] == 3
+
+
+def test_restarted_shard_leaves_link_view_to_ui():
+    restarted = make_shard_manifest(1, 2, RENUMBER_SYMLINK)
+    release_shard(restarted)
+    assert not restarted[MANIFEST_SEQUENTIAL_NAMES]
+    assert not builds_link_view(restarted)
+    assert get_output_frame(restarted, 5, FRAME_START, FRAME_STEP) == 5
+
+
+def test_restarted_single_worker_keeps_link_view():
+    restarted = make_shard_manifest(0, 1, RENUMBER_SYMLINK)
+    release_shard(restarted)
+    assert builds_link_view(restarted)
+    assert MANIFEST_RENUMBER_VIEW in restarted
+
+
+def test_flags_derived_for_old_manifests():
+    manifest = {MANIFEST_RENUMBER_OUTPUT: True, MANIFEST_RENUMBER_MODE: RENUMBER_MOVE}
+    assert get_output_frame(manifest, 5, FRAME_START, FRAME_STEP) == 3
+    assert not builds_link_view(manifest)
+
+
+def test_renumber_sequential_output_by_output_numbers(tmp_path):
+    frames = range(FRAME_START, FRAME_END + 1, FRAME_STEP)
+    manifest = get_renumber_flags(True, RENUMBER_MOVE)
+    numbers = {get_output_frame(manifest, frame, FRAME_START, FRAME_STEP) for frame in frames}
+    for number in numbers:
+        (tmp_path / f"Scene_{number:04d}.png").write_bytes(b"frame")
+
+    # Selecting by source frames picks every other file and collides with the rest
+    with pytest.raises(RenumberError):
+        renumber_sequence(str(tmp_path), "Scene_", FRAME_START, frames=frames)
+    assert renumber_sequence(str(tmp_path), "Scene_", FRAME_START, frames=numbers) == 0
+
+
+def test_renumber_source_numbered_output_ignores_preference(tmp_path):
+    # Rendered without sequential naming: no frame map, files carry their source frames
+    frames = range(FRAME_START, FRAME_END + 1, FRAME_STEP)
+    for frame in frames:
+        (tmp_path / f"Scene_{frame:04d}.png").write_bytes(str(frame).encode())
+
+    selected = get_renumber_frames(str(tmp_path), "Scene_", FRAME_START, FRAME_END, FRAME_STEP)
+    assert selected == frames
+    assert renumber_sequence(str(tmp_path), "Scene_", FRAME_START, frames=selected) == len(frames) - 1
+
+    names = sorted(path.name for path in tmp_path.iterdir())
+    assert names == [f"Scene_{number:04d}.png" for number in range(1, len(frames) + 1)]
+    assert (tmp_path / "Scene_0020.png").read_bytes() == b"39"
+
+
+def test_renumber_frames_none_for_sequential_output(tmp_path):
+    write_frame_map(str(tmp_path), "Scene_", FRAME_START, FRAME_END, FRAME_STEP)
+    assert get_renumber_frames(str(tmp_path), "Scene_", FRAME_START, FRAME_END, FRAME_STEP) is None
+
+
+def make_sequence(folder, frames, padding=4):
+    for frame in frames:
+        (folder / f"Scene_{frame:0{padding}d}.png").write_bytes(str(frame).encode())
+
+
+def read_sequence(folder):
+    return {path.name: path.read_bytes().decode() for path in folder.iterdir() if path.is_file()}
+
+
+def test_detect_padding_keeps_narrowest_width(tmp_path):
+    make_sequence(tmp_path, [1, 3, 5], padding=3)
+    (tmp_path / "Scene_1001.png").write_bytes(b"1001")
+    files = scan_sequence(list_names(str(tmp_path)), "Scene_")[".png"]
+    assert detect_padding(files) == 3
+    assert detect_padding([]) == 4
+
+    renumber_sequence(str(tmp_path), "Scene_", 1, frames=[1, 3, 5])
+    assert read_sequence(tmp_path) == {"Scene_001.png": "1", "Scene_002.png": "3", "Scene_003.png": "5",
+                                       "Scene_1001.png": "1001"}
+
+
+def test_move_renames_rolls_back_on_error(tmp_path, monkeypatch):
+    make_sequence(tmp_path, [1, 3, 5, 7])
+    before = read_sequence(tmp_path)
+    renames = plan_renumber(str(tmp_path), "Scene_", 1)
+
+    # Fail the second move from a temp name to its target
+    real_replace = os.replace
+    moves = []
+
+    def failing_replace(source, target):
+        if os.path.basename(source).startswith(RENUMBER_TEMP_PREFIX):
+            moves.append(target)
+            if len(moves) == 2:
+                raise OSError("disk gone")
+        return real_replace(source, target)
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        move_renames(str(tmp_path), renames)
+    monkeypatch.undo()
+
+    assert read_sequence(tmp_path) == before
+    assert not (tmp_path / RENUMBER_JOURNAL_FILENAME).exists()
+
+
+def test_move_renames_rolls_back_missing_source(tmp_path):
+    make_sequence(tmp_path, [1, 3])
+    with pytest.raises(OSError):
+        move_renames(str(tmp_path), [("Scene_0003.png", "Scene_0002.png"), ("Scene_0009.png", "Scene_0003.png")])
+    assert read_sequence(tmp_path) == {"Scene_0001.png": "1", "Scene_0003.png": "3"}
+
+
+def write_interrupted_journal(folder, phase, renames, done):
+    """Leave a folder as a renumbering interrupted after ``done`` moves of its phase."""
+    entries = [(source, f"{RENUMBER_TEMP_PREFIX}{target}", target) for source, target in renames]
+    for source, temp, target in entries:
+        if phase == _FINISHING:
+            os.replace(folder / source, folder / temp)
+    for source, temp, target in entries[:done]:
+        if phase == _STAGING:
+            os.replace(folder / source, folder / temp)
+        else:
+            os.replace(folder / temp, folder / target)
+    (folder / RENUMBER_JOURNAL_FILENAME).write_text(json.dumps({"phase": phase, "renames": entries}))
+
+
+@pytest.mark.parametrize("phase", [_STAGING, _FINISHING])
+def test_recover_renumber_replays(tmp_path, phase):
+    make_sequence(tmp_path, [1, 3, 5])
+    renames = plan_renumber(str(tmp_path), "Scene_", 1)
+    write_interrupted_journal(tmp_path, phase, renames, done=1)
+
+    assert recover_renumber(str(tmp_path))
+    assert read_sequence(tmp_path) == {"Scene_0001.png": "1", "Scene_0002.png": "3", "Scene_0003.png": "5"}
+    assert not recover_renumber(str(tmp_path))
+
+
+@pytest.mark.parametrize("phase", [_STAGING, _FINISHING])
+def test_recover_renumber_rolls_back(tmp_path, phase):
+    make_sequence(tmp_path, [1, 3, 5])
+    before = read_sequence(tmp_path)
+    renames = plan_renumber(str(tmp_path), "Scene_", 1)
+    write_interrupted_journal(tmp_path, phase, renames, done=1)
+
+    assert recover_renumber(str(tmp_path), rollback=True)
+    assert read_sequence(tmp_path) == before
+
+
+def test_recover_renumber_rejects_broken_journal(tmp_path):
+    (tmp_path / RENUMBER_JOURNAL_FILENAME).write_text("{not json")
+    with pytest.raises(RenumberError):
+        recover_renumber(str(tmp_path))
+
+
+@pytest.mark.parametrize("mode", [RENUMBER_SYMLINK, RENUMBER_HARDLINK])
+def test_link_view_in_renumbered_folder(tmp_path, mode):
+    make_sequence(tmp_path, [1, 3, 5])
+    before = read_sequence(tmp_path)
+
+    assert renumber_sequence(str(tmp_path), "Scene_", 1, frames=[1, 3, 5], mode=mode) == 2
+    view = tmp_path / RENUMBER_VIEW_DIRNAME
+    assert read_sequence(view) == {"Scene_0001.png": "1", "Scene_0002.png": "3", "Scene_0003.png": "5"}
+    assert read_sequence(tmp_path) == before
+    if mode == RENUMBER_SYMLINK:
+        assert os.readlink(view / "Scene_0002.png") == os.path.join(os.pardir, "Scene_0003.png")
+
+    # Rebuilding replaces the old links
+    renumber_sequence(str(tmp_path), "Scene_", 1, frames=[1, 3, 5], mode=mode)
+    assert len(list(view.iterdir())) == 3
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+
+from rendercue import staging
+from rendercue.constants import STAGING_RETRY_DELAY
+from rendercue.staging import copy_verified, OutputStager
+
+
+@pytest.fixture
+def frame(tmp_path):
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    output = tmp_path / "output"
+    output.mkdir()
+    source = scratch / "0_Scene_0001.png"
+    source.write_bytes(os.urandom(64 * 1024))
+    return source, output / "Scene_0001.png"
+
+
+@pytest.fixture
+def delays(monkeypatch):
+    """Record the retry delays instead of sleeping them."""
+    slept = []
+    monkeypatch.setattr(staging.time, "sleep", slept.append)
+    return slept
+
+
+def flaky_copy(monkeypatch, failures, error="Disk full"):
+    """Let the first ``failures`` copies fail, then copy for real."""
+    calls = []
+
+    def copy(source, target):
+        calls.append(target)
+        if len(calls) <= failures:
+            raise OSError(error)
+        copy_verified(source, target)
+
+    monkeypatch.setattr(staging, "copy_verified", copy)
+    return calls
+
+
+def run_copy(stager, source, target):
+    stager.submit(str(source), str(target), tag="frame 1")
+    copies = stager.collect(timeout=10)
+    stager.close()
+    assert len(copies) == 1 and stager.pending == 0
+    return copies[0]
+
+
+def test_copy_verified(frame):
+    source, target = frame
+    copy_verified(str(source), str(target))
+    assert target.read_bytes() == source.read_bytes()
+    assert os.listdir(target.parent) == [target.name]
+
+
+def test_copy_verified_checksum_mismatch(frame, monkeypatch):
+    source, target = frame
+    monkeypatch.setattr(staging, "file_checksum", lambda path: b"not the checksum")
+    with pytest.raises(OSError, match="Checksum mismatch"):
+        copy_verified(str(source), str(target))
+    # Neither the frame nor its temp copy is left behind
+    assert os.listdir(target.parent) == []
+    assert source.exists()
+
+
+def test_copy_verified_keeps_existing_target(frame, monkeypatch):
+    source, target = frame
+    target.write_bytes(b"previous frame")
+    monkeypatch.setattr(staging, "file_checksum", lambda path: b"not the checksum")
+    with pytest.raises(OSError):
+        copy_verified(str(source), str(target))
+    assert target.read_bytes() == b"previous frame"
+    assert os.listdir(target.parent) == [target.name]
+
+
+def test_stager_copies_and_removes_source(frame, delays):
+    source, target = frame
+    data = source.read_bytes()
+    copy = run_copy(OutputStager(threads=2), source, target)
+    assert copy.error is None
+    assert copy.attempts == 1
+    assert copy.tag == "frame 1"
+    assert copy.seconds >= 0.0
+    assert target.read_bytes() == data
+    assert not source.exists()
+    assert delays == []
+
+
+def test_stager_retries_with_doubling_delay(frame, delays, monkeypatch):
+    source, target = frame
+    calls = flaky_copy(monkeypatch, failures=2)
+    copy = run_copy(OutputStager(retries=3), source, target)
+    assert copy.error is None
+    assert copy.attempts == len(calls) == 3
+    assert delays == [STAGING_RETRY_DELAY, STAGING_RETRY_DELAY * 2]
+    assert target.exists() and not source.exists()
+
+
+def test_stager_gives_up_and_keeps_source(frame, delays, monkeypatch):
+    source, target = frame
+    flaky_copy(monkeypatch, failures=10)
+    copy = run_copy(OutputStager(retries=2), source, target)
+    assert copy.error == "Disk full"
+    assert copy.attempts == 3
+    assert delays == [STAGING_RETRY_DELAY, STAGING_RETRY_DELAY * 2]
+    assert source.exists() and not target.exists()
+
+
+def test_stager_does_not_retry_without_source(frame, delays):
+    source, target = frame
+    source.unlink()
+    copy = run_copy(OutputStager(retries=3), source, target)
+    assert copy.error
+    assert copy.attempts == 1
+    assert delays == []
@@ -0,0 +1,168 @@
+import pytest
+
+from rendercue import status_block
+from rendercue.constants import (
+    STATUS_BLOCK_RING_SIZE, STATUS_JOB_INDEX, STATUS_TOTAL_JOBS, STATUS_MESSAGE, STATUS_ETR,
+    STATUS_FINISHED, STATUS_ERROR, STATUS_TIMESTAMP, STATUS_FINISHED_FRAMES, STATUS_TOTAL_FRAMES,
+    STATUS_LAST_FRAME, STATUS_CURRENT_FRAME, STATUS_MEDIAN_FRAME_TIME, STATUS_COPY_TIME,
+    STATUS_JOB_STATUSES, STATUS_JOB_PROGRESS, STATUS_JOB_TIMINGS,
+    EVENT_BATCH, EVENT_PROGRESS, EVENT_JOB_STATE
+)
+from rendercue.status_block import StatusBlockReader, StatusBlockWriter
+
+JOB_COUNT = 4
+
+
+class Jobs:
+    """Per-job arrays of a worker."""
+
+    def __init__(self):
+        self.statuses = ['PENDING'] * JOB_COUNT
+        self.progress = [{'done': 0, 'total': 10} for _ in range(JOB_COUNT)]
+        self.timings = [{'start': 0.0, 'end': 0.0} for _ in range(JOB_COUNT)]
+
+
+def make_status(finished=0, message="Rendering", job=1):
+    return {
+        STATUS_JOB_INDEX: job,
+        STATUS_TOTAL_JOBS: JOB_COUNT,
+        STATUS_MESSAGE: message,
+        STATUS_ETR: "00:42",
+        STATUS_FINISHED: False,
+        STATUS_ERROR: None,
+        STATUS_TIMESTAMP: 1000.5,
+        STATUS_FINISHED_FRAMES: finished,
+        STATUS_TOTAL_FRAMES: 40,
+        STATUS_LAST_FRAME: "/renders/Scene_0007.png",
+        STATUS_CURRENT_FRAME: [job, 8],
+        STATUS_MEDIAN_FRAME_TIME: 2.5,
+        STATUS_COPY_TIME: None,
+    }
+
+
+@pytest.fixture
+def block(tmp_path):
+    status_path = str(tmp_path / "rendercue_status.json")
+    reader = StatusBlockReader(status_path, JOB_COUNT)
+    writer = StatusBlockWriter(status_path)
+    yield reader, writer
+    writer.close()
+    reader.close()
+
+
+def write(writer, jobs, status, event_type=EVENT_PROGRESS, job_indices=()):
+    writer.write(status, event_type, job_indices, jobs.statuses, jobs.progress, jobs.timings)
+
+
+def test_round_trip(block):
+    reader, writer = block
+    jobs = Jobs()
+    assert reader.read() is None
+
+    jobs.statuses[1] = 'RENDERING'
+    jobs.progress[1] = {'done': 7, 'total': 10}
+    jobs.timings[1] = {'start': 990.0, 'end': 0.0}
+    write(writer, jobs, make_status(finished=17), EVENT_BATCH)
+
+    assert reader.read() == set(range(JOB_COUNT))
+    status = reader.status
+    assert status[STATUS_FINISHED_FRAMES] == 17
+    assert status[STATUS_MESSAGE] == "Rendering"
+    assert status[STATUS_ETR] == "00:42"
+    assert status[STATUS_LAST_FRAME] == "/renders/Scene_0007.png"
+    assert status[STATUS_CURRENT_FRAME] == [1, 8]
+    assert status[STATUS_MEDIAN_FRAME_TIME] == 2.5
+    assert status[STATUS_COPY_TIME] is None
+    assert status[STATUS_ERROR] is None
+    assert status[STATUS_FINISHED] is False
+    assert status[STATUS_JOB_STATUSES] == jobs.statuses
+    assert status[STATUS_JOB_PROGRESS][1] == {'done': 7, 'total': 10}
+    assert status[STATUS_JOB_TIMINGS][1] == {'start': 990.0, 'end': 0.0}
+
+    # Nothing new until the next write
+    assert reader.read() is None
+
+    jobs.statuses[2] = 'COMPLETED'
+    write(writer, jobs, make_status(finished=18, job=2), EVENT_JOB_STATE, [2])
+    assert reader.read() == {2}
+    assert reader.status[STATUS_JOB_STATUSES][2] == 'COMPLETED'
+    assert reader.status[STATUS_FINISHED_FRAMES] == 18
+
+
+def test_read_skips_write_in_progress(block):
+    reader, writer = block
+    write(writer, Jobs(), make_status(), EVENT_BATCH)
+
+    # Seqlock odd: the writer is halfway through an update
+    status_block._SEQ.pack_into(writer.map, status_block._SEQ_OFFSET, writer.seq + 1)
+    assert reader.read() is None
+    assert reader.status is None
+
+
+def test_torn_read_is_retried(block, monkeypatch):
+    reader, writer = block
+    jobs = Jobs()
+    write(writer, jobs, make_status(finished=1, message="First"), EVENT_BATCH)
+
+    # The worker writes again while the reader copies the first update out
+    real_seq = status_block._SEQ
+
+    class InterleavedSeq:
+        reads = 0
+
+        def unpack_from(self, buffer, offset):
+            self.reads += 1
+            if self.reads == 2:
+                write(writer, jobs, make_status(finished=2, message="Second"))
+            return real_seq.unpack_from(buffer, offset)
+
+        def pack_into(self, buffer, offset, value):
+            real_seq.pack_into(buffer, offset, value)
+
+    monkeypatch.setattr(status_block, "_SEQ", InterleavedSeq())
+    assert reader.read() == set(range(JOB_COUNT))
+    assert reader.status[STATUS_MESSAGE] == "Second"
+    assert reader.status[STATUS_FINISHED_FRAMES] == 2
+    assert reader.last_seq == writer.seq
+
+
+def test_event_ring_wraparound(block):
+    reader, writer = block
+    jobs = Jobs()
+    write(writer, jobs, make_status(), EVENT_BATCH)
+    reader.read()
+
+    # A few events: the ring names the job that changed
+    jobs.statuses[3] = 'FAILED'
+    write(writer, jobs, make_status(job=3), EVENT_JOB_STATE, [3])
+    for finished in range(5):
+        write(writer, jobs, make_status(finished, job=3))
+    assert reader.read() == {3}
+
+    # More events than the ring holds: the job state event is overwritten,
+    # so every job is read again
+    jobs.statuses[0] = 'COMPLETED'
+    write(writer, jobs, make_status(job=0), EVENT_JOB_STATE, [0])
+    for finished in range(STATUS_BLOCK_RING_SIZE):
+        write(writer, jobs, make_status(finished, job=0))
+    assert reader.read() == set(range(JOB_COUNT))
+    assert reader.status[STATUS_JOB_STATUSES] == ['COMPLETED', 'PENDING', 'PENDING', 'FAILED']
+
+
+def test_writer_needs_a_block(tmp_path):
+    status_path = str(tmp_path / "rendercue_status.json")
+    with pytest.raises(OSError):
+        StatusBlockWriter(status_path)
+
+    block_path = status_block.get_block_path(status_path)
+    with open(block_path, 'wb') as f:
+        f.write(b"not a status block")
+    with pytest.raises(OSError):
+        StatusBlockWriter(status_path)
+
+    # Cut short after the header
+    status_block.create_block(status_path, JOB_COUNT)
+    with open(block_path, 'r+b') as f:
+        f.truncate(status_block._HEADER.size + 1)
+    with pytest.raises(OSError):
+        StatusBlockWriter(status_path)